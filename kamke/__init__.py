@@ -0,0 +1,11 @@
+r"""
+Tools to run the Kamke ODE database against dsolve.
+
+The corpus itself is stored in kamke/data, this package contains the
+machinery to sweep it: a process pool with hard per-ODE time limits and the
+command line interface, see:
+$ python -m kamke --help
+"""
+from .runner import run_corpus, run_pool, solve_entry
+
+__all__ = ['run_corpus', 'run_pool', 'solve_entry']
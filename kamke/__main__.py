@@ -0,0 +1,1065 @@
+r"""
+Command line interface for the Kamke ODE tools.
+
+Sweep the whole database on all cores with a hard limit of 60 s per ODE:
+$ python -m kamke run --timeout 60
+
+or only a few entries:
+$ python -m kamke run 1-46 49
+
+Write every result to a JSON lines file as soon as it is finished, and
+continue a sweep that was killed where it stopped:
+$ python -m kamke run --results sweep.jsonl --resume
+
+Keep the results in a cache, so that unchanged ODEs are not solved again
+by the next run with the same SymPy:
+$ python -m kamke run --cache results.sqlite
+
+Share the integrals between the ODEs, also across runs:
+$ python -m kamke run --integral-memo-file integrals.sqlite
+
+An ODE that times out is reported with the frames it spent most of its
+samples in, innermost first, e.g. for Kamke 40 after 10 s:
+$ python -m kamke run 40 --timeout 10
+
+Try every hint, each within 10 s, and keep the results of the hints that
+finished when one of them hangs:
+$ python -m kamke run 36-43 --hint all --hint-timeout 10 --timeout 120
+
+Solve without simplification, to see what the simplification of the
+solutions costs, and whether checking needs it:
+$ python -m kamke deferred 36-49 --compare
+
+Verify the distinct solutions of the ODEs for which dsolve gives a list
+in parallel, next to verifying every list as a whole:
+$ python -m kamke multisol 36-49 --compare
+
+Time every ODE with a cold and a warm SymPy cache, with several cache
+sizes, and see the hit rates and the memory the cache holds:
+$ python -m kamke coldwarm 1-100 --sizes 100 1000 10000 none
+
+Record a timing baseline and check a later one against it. With
+--isolate every ODE runs in a fresh worker, so that it does not profit
+from the SymPy cache of the ODEs before it:
+$ python -m kamke baseline --repeat 5 --start-method forkserver --isolate -o before.json
+$ python -m kamke compare before.json after.json --threshold 0.2
+
+Profile every dsolve and checkodesol call, and merge the profiles:
+$ python -m kamke run --profile profiles
+
+Split the corpus into 4 shards of about equal cost, using the times of an
+earlier run, run each on its own machine and merge the results:
+$ python -m kamke shards --costs sweep.jsonl -n 4
+$ python -m kamke run --costs sweep.jsonl --shard 1/4 --results shard1.jsonl
+$ python -m kamke merge shard*.jsonl -o sweep-new.jsonl
+
+Record which solver, integration and simplification modules every ODE
+runs, and after a change to SymPy only solve the ODEs that ran a changed
+module again:
+$ python -m kamke run --coverage -o results.json
+$ python -m kamke rerun results.json --since HEAD~1 -o new.json
+
+Record the peak memory of every dsolve and checkodesol call, and list the
+ODEs that need much more memory than their size suggests:
+$ python -m kamke run --memory
+
+Fill in verified reference solutions in the data file. Solutions that
+match their reference are not verified again by run:
+$ python -m kamke references --timeout 120
+
+Solve the ODEs with arbitrary functions f, g, h with random elementary
+functions in their place, next to the abstract ODEs:
+$ python -m kamke concrete --count 5 --instance-timeout 20
+
+Scale Kamke 1 and 39 up to polynomials of degree 10, and fit how the
+time of dsolve and checkodesol grows:
+$ python -m kamke scaling 1 39 --by degree --sizes 1-10 -o degree.csv
+
+Stream 2000 ODEs, made of the Kamke ODEs with reference solutions by
+random changes of variables, through the process pool:
+$ python -m kamke stress --count 2000 --depth 2 --results stress.jsonl
+
+Solve with the integrals deferred and do them afterwards within 10 s, to
+see how much time goes to matching, reduction and integration:
+$ python -m kamke lazy --budget 10 --compare
+
+Time every matching hint of every ODE separately:
+$ python -m kamke hints --timeout 20 --output matrix.csv
+
+Learn a hint ordering from the hint timings, and solve with the first hint
+that gives a verified solution, compared with plain dsolve:
+$ python -m kamke hints --ranking ranking.json
+$ python -m kamke first --ranking ranking.json --compare
+
+Check that the structural dispatcher of kamke/features.py gives the same
+hints as classify_ode, and how many matchers it skips:
+$ python -m kamke features --timeout 60
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+from collections import Counter
+from time import perf_counter
+
+
+def parse_ranges(specs):
+    """Convert command line specs like ``['1-3', '7,9']`` to ``[1, 2, 3, 7, 9]``."""
+    numbers = []
+    for spec in specs:
+        for part in spec.split(','):
+            if '-' in part:
+                lo, hi = part.split('-')
+                numbers.extend(range(int(lo), int(hi) + 1))
+            elif part:
+                numbers.append(int(part))
+    return numbers
+
+
+def parse_numbers(specs):
+    r"""
+    Convert command line specs like ``['1-46', '49']`` to a list of Kamke
+    numbers. Without specs all entries of the database are returned.
+    """
+    from .corpus import load_corpus
+
+    kamke1_1 = load_corpus('kamke1_1')
+    if not specs:
+        return kamke1_1.numbers()
+    return [n for n in parse_ranges(specs) if kamke1_1.raw(n)['ode']]
+
+
+def shard_spec(spec):
+    """:func:`~kamke.sharding.parse_shard` as the type of --shard."""
+    from .sharding import parse_shard
+
+    try:
+        return parse_shard(spec)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc))
+
+
+def cmd_run(args):
+    from .cache import ResultCache
+    from .runner import run_corpus
+
+    if args.resume and not args.results:
+        print("--resume needs a --results file")
+        return 2
+    numbers = parse_numbers(args.numbers)
+    if args.shard and not args.costs:
+        print("--shard needs --costs")
+        return 2
+    if args.costs:
+        from .sharding import load_costs, plan_shards
+
+        k, count = args.shard or (1, 1)
+        numbers, predicted = plan_shards(numbers, load_costs(args.costs), count)[k - 1]
+        print("shard %d/%d: %d ODEs, predicted %.1f s" % (k, count, len(numbers), predicted))
+    log = None
+    if args.results:
+        from .results import ResultLog, finished, read_results
+
+        if args.resume:
+            done = finished(read_results(args.results), args.hint)
+            print("resuming %s: %d of %d ODEs already finished"
+                  % (args.results, len(done.intersection(numbers)), len(numbers)))
+            numbers = [n for n in numbers if n not in done]
+        log = ResultLog(args.results)
+    cache = ResultCache(args.cache) if args.cache else None
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+    integrals = None
+    if args.integral_memo or args.integral_memo_file:
+        integrals = (args.integral_memo_size, args.integral_memo_file)
+    records = []
+    start = perf_counter()
+    for record in run_corpus(numbers, args.hint, args.timeout, args.jobs,
+                             cache=cache, watchdog=args.watchdog,
+                             start_method=args.start_method, isolate=args.isolate,
+                             check=not args.no_check,
+                             numeric=args.numeric_check, profile_dir=args.profile,
+                             memory=args.memory, coverage=args.coverage,
+                             reference=not args.no_reference, integrals=integrals,
+                             hint_timeout=args.hint_timeout,
+                             total_timeout=args.total_timeout or 0.8 * args.timeout):
+        records.append(record)
+        if log is not None:
+            log.write(record)
+        cpu = (record.get('solve_time') or 0) + (record.get('check_time') or 0)
+        print("kamke number %3d  %-10s  %8.2f s%s" % (record['number'], record['status'], cpu,
+                                                     '  (cached)' if record.get('cached') else ''))
+        for attempt in record.get('attempts') or []:
+            if attempt['status'] != 'timeout':
+                continue
+            print("    %-60s %-10s %8.2f s" % (attempt['hint'], attempt['status'],
+                                            attempt['time']))
+        for frame, samples, own in (record.get('hot_frames') or [])[:5]:
+            print("    %5d %5d  %s" % (samples, own, frame))
+        sys.stdout.flush()
+    wall = perf_counter() - start
+
+    cpu = sum((r.get('solve_time') or 0) + (r.get('check_time') or 0) for r in records)
+    print("")
+    for status, count in sorted(Counter(r['status'] for r in records).items()):
+        print("%-10s %4d" % (status, count))
+    print("cpu time %.1f s, wall time %.1f s on %d processes"
+          % (cpu, wall, args.jobs or os.cpu_count() or 1))
+    if log is not None:
+        log.close()
+    if cache is not None:
+        print("cache: %d hits, %d misses" % (cache.hits, cache.misses))
+        cache.close()
+    if integrals is not None:
+        hits = sum(r.get('integral_hits') or 0 for r in records)
+        misses = sum(r.get('integral_misses') or 0 for r in records)
+        print("integral memo: %d hits, %d misses (%.0f%%), %.1f s cpu time saved"
+              % (hits, misses, 100 * hits / max(hits + misses, 1),
+                 sum(r.get('integral_saved') or 0 for r in records)))
+    if args.profile:
+        from .profiling import merge_profiles
+
+        merge_profiles(args.profile)
+        print("profile report in %s" % os.path.join(args.profile, 'report.txt'))
+    if args.memory:
+        from .memory import memory_outliers, peak_memory
+
+        outliers = memory_outliers(records)
+        print("%d ODEs with memory out of line with their size" % len(outliers))
+        for r in outliers:
+            print("kamke number %3d  %8.1f MB traced  %8.1f MB rss  %4d ops -> %6s ops  (x%.0f)"
+                  % (r['number'], peak_memory(r) / 2**20,
+                     max(r.get(s + '_rss') or 0 for s in ('dsolve', 'checkodesol')) / 2**20,
+                     r['ode_ops'], r.get('solution_ops'), r['memory_ratio']))
+    if args.output:
+        records.sort(key=lambda r: r['number'])
+        with open(args.output, 'w') as fd:
+            json.dump(records, fd, indent=1)
+
+
+def cmd_rerun(args):
+    import subprocess
+
+    from .incremental import (SYMPY_ROOT, changed_modules, diff_paths, git_changed_paths,
+                              plan_rerun)
+    from .runner import run_corpus
+
+    from .results import load_records
+
+    previous = load_records(args.previous)
+    if args.diff:
+        with open(args.diff) as fd:
+            paths = diff_paths(fd.read())
+    else:
+        try:
+            paths = git_changed_paths(args.since)
+        except FileNotFoundError:
+            print("git not found, give the changes of SymPy with --diff")
+            return 2
+        except subprocess.CalledProcessError as exc:
+            print("git diff %s failed in %s, give the changes of SymPy with --diff:\n%s"
+                  % (args.since, SYMPY_ROOT, exc.stderr.strip()))
+            return 2
+    changed = changed_modules(paths)
+    numbers, records = plan_rerun(previous, changed)
+    print("%d changed modules, %d ODEs to solve again, %d records kept"
+          % (len(changed), len(numbers), len(records)))
+    for module in sorted(changed):
+        print("    %s" % module)
+    if args.dry_run:
+        print("to solve: %s" % ' '.join(map(str, numbers)))
+        return
+
+    start = perf_counter()
+    for record in run_corpus(numbers, args.hint, args.timeout, args.jobs,
+                             check=not args.no_check, numeric=args.numeric_check,
+                             coverage=True):
+        records.append(record)
+        print("kamke number %3d  %-10s  %8.2f s" % (record['number'], record['status'],
+                                                   record.get('solve_time') or 0))
+        sys.stdout.flush()
+    before = {r['number']: r['status'] for r in previous}
+    for record in sorted(records, key=lambda r: r['number']):
+        if record['status'] != before.get(record['number']):
+            print("kamke number %3d  status %s -> %s" % (record['number'],
+                                                         before.get(record['number']),
+                                                         record['status']))
+    print("wall time %.1f s" % (perf_counter() - start))
+    records.sort(key=lambda r: r['number'])
+    with open(args.output, 'w') as fd:
+        json.dump(records, fd, indent=1)
+
+
+def cmd_shards(args):
+    from .sharding import format_numbers, load_costs, plan_shards
+
+    costs = load_costs(args.costs)
+    numbers = parse_numbers(args.numbers)
+    plan = plan_shards(numbers, costs, args.count, args.default_cost)
+    unknown = [n for n in numbers if n not in costs]
+    print("%d ODEs, %d without a recorded cost, %.1f s in total"
+          % (len(numbers), len(unknown), sum(p for _, p in plan)))
+    for k, (shard, predicted) in enumerate(plan, 1):
+        print("shard %d/%d  %4d ODEs  %9.1f s  %s"
+              % (k, args.count, len(shard), predicted, format_numbers(shard)))
+
+
+def cmd_merge(args):
+    from .results import ResultLog, load_records
+    from .sharding import format_numbers, merge_records
+
+    records = merge_records(load_records(path) for path in args.files)
+    if args.output.endswith('.jsonl'):
+        with ResultLog(args.output) as log:
+            for record in records:
+                log.write(record)
+    else:
+        with open(args.output, 'w') as fd:
+            json.dump(records, fd, indent=1)
+    missing = sorted(set(parse_numbers([])) - {r['number'] for r in records})
+    print("merged %d records of %d files into %s" % (len(records), len(args.files), args.output))
+    if missing:
+        print("no records for %d ODEs: %s" % (len(missing), format_numbers(missing)))
+
+
+def cmd_references(args):
+    from .reference import reference_entry, store_references
+    from .runner import run_pool
+
+    jobs = ((n, reference_entry, (n, args.hint_timeout), {})
+            for n in parse_numbers(args.numbers))
+    records = []
+    for number, record in run_pool(jobs, args.timeout, args.jobs):
+        record['number'] = number
+        records.append(record)
+        print("kamke number %3d  %-10s  %8.2f s  %s"
+              % (number, record['status'], record.get('solve_time') or record.get('wall_time', 0),
+                 record.get('solver_hint') or ''))
+        if record.get('stored') == 'unverified':
+            print("    the stored reference could not be verified")
+        sys.stdout.flush()
+    print("")
+    for status, count in sorted(Counter(r['status'] for r in records).items()):
+        print("%-10s %4d" % (status, count))
+    if args.dry_run:
+        return
+    changed = store_references(records, replace=args.replace)
+    print("%d references written to the data file" % len(changed))
+
+
+def cmd_concrete(args):
+    from statistics import median
+
+    from .concrete import functional_numbers, solve_concrete
+    from .runner import run_pool
+
+    numbers = parse_numbers(args.numbers) if args.numbers else functional_numbers()
+    kinds = tuple(args.kinds.split(','))
+    timeout = args.timeout or args.instance_timeout * (args.count + 2)
+    jobs = ((n, solve_concrete, (n, args.count, args.seed, args.instance_timeout,
+                                 not args.no_abstract, kinds), {})
+            for n in numbers)
+    totals = Counter()
+    for number, record in run_pool(jobs, timeout, args.jobs):
+        if 'instances' not in record:
+            print("kamke number %3d  %s" % (number, record['status']))
+            continue
+        abstract = record.get('abstract')
+        if abstract is not None:
+            totals['abstract ' + abstract['status']] += 1
+        instances = record['instances']
+        for instance in instances:
+            totals[instance['status']] += 1
+        times = [i['solve_time'] + (i['check_time'] or 0) for i in instances]
+        print("kamke number %3d  abstract %-10s %8s  instances %d/%d verified  %8.2f s (median)"
+              % (number, abstract['status'] if abstract else '-',
+                 '%.2f s' % (abstract['solve_time'] + (abstract['check_time'] or 0))
+                 if abstract else '',
+                 sum(i['status'] == 'verified' for i in instances), len(instances),
+                 median(times) if times else 0))
+        for instance in instances:
+            if instance['status'] != 'verified':
+                print("    %-10s %s" % (instance['status'], ', '.join(
+                    '%s = %s' % item for item in sorted(instance['functions'].items()))))
+        sys.stdout.flush()
+    print("")
+    for status, count in sorted(totals.items()):
+        print("%-19s %4d" % (status, count))
+
+
+def cmd_scaling(args):
+    from .scaling import curve_times, fit_growth, scaling_curve, write_curves
+
+    if args.plot:
+        try:
+            import matplotlib  # noqa: F401
+        except ImportError:
+            print("--plot needs matplotlib")
+            return 2
+    curves = {}
+    for number in parse_numbers(args.numbers):
+        label = 'kamke %d %s' % (number, args.by)
+        try:
+            records = scaling_curve(number, args.by, parse_ranges(args.sizes), args.timeout,
+                                    args.jobs, check=not args.no_check)
+        except ValueError as exc:
+            print("kamke number %3d  %s" % (number, exc))
+            continue
+        curves[label] = records
+        for r in records:
+            print("kamke number %3d  %-10s size %3d  %6s ops  %8.2f s dsolve  %8s checkodesol"
+                  % (number, r['status'], r['size'], r.get('ode_ops', ''),
+                     r.get('solve_time') or r.get('wall_time') or 0,
+                     '%.2f s' % r['check_time'] if r.get('check_time') is not None else '-'))
+        for metric in ('solve_time', 'check_time'):
+            fit = fit_growth(*curve_times(records, metric))
+            if fit is None:
+                continue
+            if fit['model'] == 'power':
+                growth = 'size**%.2f' % fit['exponent']
+            else:
+                growth = 'exp(%.2f*size)' % fit['rate']
+            print("    %-10s grows like %s" % (metric.split('_')[0], growth))
+        sys.stdout.flush()
+    records = [r for rs in curves.values() for r in rs]
+    if args.output:
+        write_curves(records, args.output)
+    if args.plot:
+        from .scaling import plot_curves
+
+        plot_curves(curves, args.plot)
+
+
+def cmd_stress(args):
+    from statistics import median
+
+    from .runner import run_pool
+    from .stress import stress_corpus, stress_jobs
+
+    # number and transformations of the ODEs in the pool, by id
+    generated = {}
+
+    def corpus():
+        for g in stress_corpus(args.count, args.seed, args.depth):
+            generated[g['id']] = g
+            yield g
+
+    log = None
+    if args.results:
+        from .results import ResultLog
+
+        log = ResultLog(args.results)
+    records = []
+    start = perf_counter()
+    for key, record in run_pool(stress_jobs(corpus(), not args.no_check), args.timeout,
+                                args.jobs):
+        g = generated.pop(key)
+        record.update(id=key, number=g['number'], transforms=g['transforms'])
+        records.append(record)
+        if log is not None:
+            log.write(record)
+        if args.verbose:
+            print("ode %5d  kamke %3d  %-10s  %8.2f s  %s"
+                  % (key, g['number'], record['status'],
+                     record.get('solve_time') or record.get('wall_time') or 0,
+                     '; '.join(g['transforms'])))
+            sys.stdout.flush()
+    wall = perf_counter() - start
+    if log is not None:
+        log.close()
+
+    for status, count in sorted(Counter(r['status'] for r in records).items()):
+        print("%-10s %5d" % (status, count))
+    for method, count in sorted(Counter(r['check_method'] for r in records
+                                        if r.get('check_method')).items()):
+        print("checked by %-11s %5d" % (method, count))
+    times = [r['solve_time'] for r in records if r.get('solve_time') is not None]
+    print("%d ODEs in %.1f s wall time on %d processes, %.2f ODEs/s, median dsolve %.2f s"
+          % (len(records), wall, args.jobs or os.cpu_count() or 1, len(records) / wall,
+             median(times) if times else float('nan')))
+
+
+def cmd_lazy(args):
+    from .lazy import lazy_entry
+    from .runner import run_pool
+
+    jobs = ((n, lazy_entry, (n, args.budget, args.compare), {})
+            for n in parse_numbers(args.numbers))
+    totals = Counter()
+    for number, record in run_pool(jobs, args.timeout, args.jobs):
+        totals[record['status']] += 1
+        if 'integrate_time' not in record:
+            print("kamke number %3d  %s" % (number, record['status']))
+            continue
+        for key in ('classify_time', 'reduce_time', 'integrate_time', 'eager_time',
+                    'evaluated', 'deferred'):
+            totals[key] += record.get(key) or 0
+        print("kamke number %3d  %-10s  match %6.2f s  reduce %6.2f s  integrate %6.2f s  "
+              "%2d integrals, %2d deferred%s"
+              % (number, record['status'], record['classify_time'], record['reduce_time'],
+                 record['integrate_time'], record['evaluated'] + record['deferred'],
+                 record['deferred'],
+                 '  dsolve %6.2f s' % record['eager_time'] if args.compare else ''))
+        sys.stdout.flush()
+    print("")
+    for status in ('verified', 'unverified', 'unsolved', 'error', 'timeout', 'crashed'):
+        if totals[status]:
+            print("%-10s %4d" % (status, totals[status]))
+    lazy = sum(totals[k] for k in ('classify_time', 'reduce_time', 'integrate_time'))
+    if lazy:
+        print("matching %.1f s (%.0f%%), reduction %.1f s (%.0f%%), integration %.1f s (%.0f%%)"
+              % tuple(v for k in ('classify_time', 'reduce_time', 'integrate_time')
+                      for v in (totals[k], 100 * totals[k] / lazy)))
+    print("%d integrals evaluated, %d deferred" % (totals['evaluated'], totals['deferred']))
+    if args.compare:
+        print("lazy %.1f s, dsolve %.1f s" % (lazy, totals['eager_time']))
+
+
+def cmd_deferred(args):
+    from .deferred import deferred_entry
+    from .runner import run_pool
+
+    jobs = ((n, deferred_entry, (n, not args.no_check, args.compare), {})
+            for n in parse_numbers(args.numbers))
+    totals = Counter()
+    for number, record in run_pool(jobs, args.timeout, args.jobs):
+        totals[record['status']] += 1
+        if 'simplify_time' not in record:
+            print("kamke number %3d  %s" % (number, record['status']))
+            continue
+        for key in ('classify_time', 'solve_time', 'simplify_time', 'raw_check_time',
+                    'check_time', 'eager_time'):
+            totals[key] += record.get(key) or 0
+        print("kamke number %3d  %-10s  match %6.2f s  solve %6.2f s  simplify %6.2f s  "
+              "%4d -> %4d ops%s"
+              % (number, record['status'], record['classify_time'], record['solve_time'],
+                 record['simplify_time'], record['raw_ops'], record['ops'],
+                 '  dsolve %6.2f s' % record['eager_time'] if args.compare else ''))
+        sys.stdout.flush()
+    print("")
+    for status in ('verified', 'unverified', 'solved', 'unsolved', 'error', 'timeout',
+                   'crashed'):
+        if totals[status]:
+            print("%-10s %4d" % (status, totals[status]))
+    total = sum(totals[k] for k in ('classify_time', 'solve_time', 'simplify_time'))
+    if total:
+        print("matching %.1f s (%.0f%%), solving %.1f s (%.0f%%), simplification %.1f s (%.0f%%)"
+              % tuple(v for k in ('classify_time', 'solve_time', 'simplify_time')
+                      for v in (totals[k], 100 * totals[k] / total)))
+    if not args.no_check:
+        print("verification of the raw solutions %.1f s, of the simplified ones %.1f s"
+              % (totals['raw_check_time'], totals['check_time']))
+    if args.compare:
+        print("raw solutions after %.1f s, simplified after %.1f s, dsolve %.1f s"
+              % (totals['classify_time'] + totals['solve_time'], total, totals['eager_time']))
+
+
+def cmd_multisol(args):
+    from sympy import sympify
+
+    from .multisol import verify_lists
+    from .runner import run_corpus
+
+    solutions = {}
+    for record in run_corpus(parse_numbers(args.numbers), timeout=args.timeout,
+                             processes=args.jobs, check=False):
+        if record['status'] == 'solved' and record['srepr'].startswith('['):
+            solutions[record['number']] = sympify(record['srepr'])
+    print("%d ODEs with a list of solutions" % len(solutions))
+    totals = Counter()
+    for record in verify_lists(dict(sorted(solutions.items())), args.timeout, args.jobs,
+                               args.numeric_check, args.compare):
+        for key in ('solutions', 'distinct', 'check_time', 'span', 'sequential_time'):
+            totals[key] += record.get(key) or 0
+        print("kamke number %3d  %-10s  %2d solutions, %2d distinct  cpu %7.2f s  span %7.2f s%s"
+              % (record['number'], record['status'], record['solutions'], record['distinct'],
+                 record['check_time'], record['span'],
+                 '  sequential %7.2f s (%s)' % (record['sequential_time'],
+                                                record['sequential_status'])
+                 if args.compare else ''))
+        sys.stdout.flush()
+    print("")
+    print("%d solutions, %d distinct, cpu %.1f s, span %.1f s"
+          % (totals['solutions'], totals['distinct'], totals['check_time'], totals['span']))
+    if args.compare:
+        print("sequential %.1f s" % totals['sequential_time'])
+
+
+def cmd_coldwarm(args):
+    from .coldwarm import run_cache_sizes, summarize_sizes
+
+    sizes = [None if s.lower() == 'none' else int(s) for s in args.sizes]
+    records = []
+    for record in run_cache_sizes(parse_numbers(args.numbers), sizes, args.timeout,
+                                  args.jobs, not args.no_memory):
+        records.append(record)
+        if 'cold_time' not in record:
+            print("cache %5s  kamke number %3d  %s"
+                  % (record['cache_size'], record['number'], record['status']))
+            continue
+        print("cache %5s  kamke number %3d  %-9s cold %7.2f s  warm %7.2f s  %6d entries%s"
+              % (record['cache_size'], record['number'], record['status'],
+                 record['cold_time'], record['warm_time'], record['entries'],
+                 '  %7.1f MB' % (record['cache_memory'] / 2**20)
+                 if 'cache_memory' in record else ''))
+        sys.stdout.flush()
+    print("")
+    print("cache size  ODEs  timeouts    cold [s]    warm [s]  speedup  hits cold  hits warm"
+          "  memory [MB]")
+    for s in summarize_sizes(records):
+        print("%10s  %4d  %8d  %10.1f  %10.1f  %7s  %9s  %9s  %11s"
+              % (s['cache_size'], s['count'], s['timeouts'], s['cold_time'], s['warm_time'],
+                 '%.1f' % s['speedup'] if s['speedup'] is not None else '-',
+                 *('%.0f%%' % (100 * s[k]) if s[k] is not None else '-'
+                   for k in ('cold_hit_rate', 'warm_hit_rate')),
+                 '%.1f' % (s['cache_memory'] / 2**20) if s['cache_memory'] is not None
+                 else '-'))
+    if args.output:
+        with open(args.output, 'w') as fd:
+            json.dump(records, fd, indent=1)
+
+
+def cmd_baseline(args):
+    from .baseline import record_baseline, save_baseline
+
+    baseline = record_baseline(parse_numbers(args.numbers), args.repeat, args.timeout,
+                               args.jobs, start_method=args.start_method,
+                               isolate=args.isolate, numeric=args.numeric_check)
+    save_baseline(baseline, args.output)
+    print("baseline of %d ODEs written to %s" % (len(baseline['entries']), args.output))
+
+
+def cmd_compare(args):
+    from .baseline import compare, load_baseline
+
+    changes = compare(load_baseline(args.old), load_baseline(args.new),
+                      args.threshold, args.min_time)
+    failed = False
+    for c in changes:
+        if c['kind'] == 'status':
+            print("kamke number %3d  status      %s -> %s" % (c['number'], c['old'], c['new']))
+            failed |= c['old'] == 'verified'
+        else:
+            print("kamke number %3d  %-11s %-6s %8.3f s -> %8.3f s  (x%.2f)"
+                  % (c['number'], c['kind'], c['metric'], c['old'], c['new'], c['ratio']))
+            failed |= c['kind'] == 'regression'
+    print("%d changes, %s" % (len(changes), 'FAILED' if failed else 'ok'))
+    return 1 if failed else 0
+
+
+def cmd_hints(args):
+    from .hints import hint_matrix, summarize, write_matrix
+
+    records = hint_matrix(parse_numbers(args.numbers), args.timeout, args.jobs)
+    print("%-68s %-52s %5s %5s %5s %5s %9s %9s %9s"
+          % ('hint', 'solver', 'match', 'ok', 'fail', 't/o', 'total', 'median', 'wasted'))
+    for s in summarize(records):
+        print("%-68s %-52s %5d %5d %5d %5d %9.2f %9.3f %9.2f"
+              % (s['hint'], s['solver'], s['matched'], s['solved'], s['failed'],
+                 s['timeout'], s['total'], s['median'], s['wasted']))
+    if args.output:
+        write_matrix(records, args.output)
+    if args.ranking:
+        from .ranking import hint_ranking, save_ranking
+
+        save_ranking(hint_ranking(records), args.ranking)
+
+
+def cmd_first(args):
+    from statistics import median
+
+    from .ranking import load_ranking, solve_first
+    from .runner import run_corpus, run_pool
+
+    numbers = parse_numbers(args.numbers)
+    ranking = load_ranking(args.ranking) if args.ranking else None
+    jobs = ((n, solve_first, (n, ranking, args.hint_timeout, not args.no_numeric_check), {})
+            for n in numbers)
+    first = {}
+    for number, record in run_pool(jobs, args.timeout, args.jobs):
+        first[number] = record
+        print("kamke number %3d  %-10s  %8.2f s  %-45s %2d hints tried"
+              % (number, record['status'], record.get('solve_time') or record['wall_time'],
+                 record.get('solver_hint') or '', len(record.get('attempts', []))))
+        sys.stdout.flush()
+    solved = {n: r['solve_time'] for n, r in first.items() if r['status'] == 'verified'}
+    print("")
+    print("first hint: %d of %d verified, median time to solution %.2f s"
+          % (len(solved), len(first), median(solved.values()) if solved else float('nan')))
+    if not args.compare:
+        return
+    default = {r['number']: r['solve_time'] + (r['check_time'] or 0)
+               for r in run_corpus(numbers, timeout=args.timeout, processes=args.jobs,
+                                   numeric=not args.no_numeric_check)
+               if r['status'] == 'verified'}
+    print("dsolve:     %d of %d verified, median time to solution %.2f s"
+          % (len(default), len(first), median(default.values()) if default else float('nan')))
+    both = sorted(set(solved) & set(default))
+    if both:
+        print("on the %d ODEs both solved: %.2f s first hint, %.2f s dsolve (median)"
+              % (len(both), median(solved[n] for n in both), median(default[n] for n in both)))
+
+
+def cmd_features(args):
+    from .features import compare_entry
+    from .runner import run_pool
+
+    jobs = ((n, compare_entry, (n,), {}) for n in parse_numbers(args.numbers))
+    totals = Counter()
+    for number, record in run_pool(jobs, args.timeout, args.jobs):
+        totals[record['status']] += 1
+        if record['status'] not in ('same', 'different'):
+            print("kamke number %3d  %s" % (number, record['status']))
+            continue
+        for key in ('classify_time', 'fast_time', 'run', 'skipped'):
+            totals[key] += record[key]
+        print("kamke number %3d  %-9s  %2d matchers skipped  %8.2f s -> %8.2f s"
+              % (number, record['status'], record['skipped'], record['classify_time'],
+                 record['fast_time']))
+        if record['status'] == 'different':
+            print("    classify_ode:      %s" % ', '.join(record['hints']))
+            print("    classify_ode_fast: %s" % ', '.join(record['fast_hints']))
+        sys.stdout.flush()
+    print("")
+    print("%d same, %d different, %d matchers run, %d skipped, %.1f s -> %.1f s"
+          % (totals['same'], totals['different'], totals['run'], totals['skipped'],
+             totals['classify_time'], totals['fast_time']))
+    return 1 if totals['different'] else 0
+
+
+def cmd_cache(args):
+    from .cache import ResultCache
+
+    cache = ResultCache(args.path)
+    if args.clear:
+        print("dropped %d records" % cache.invalidate())
+    for module in args.invalidate or []:
+        print("dropped %d records of %s" % (cache.invalidate(module), module))
+    print("%d records, %.1f kB, sympy %s" % (len(cache), cache.size() / 1024, cache.version))
+    cache.close()
+
+
+def cmd_index(args):
+    from .corpus import DATA_DIR, build_index
+
+    offsets = build_index(os.path.join(DATA_DIR, args.name + '.jsonl'))
+    print("indexed %d entries of %s" % (len(offsets), args.name))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m kamke', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='solve Kamke ODEs on a process pool')
+    run.add_argument('numbers', nargs='*', help='Kamke numbers or ranges, e.g. 1-46 49')
+    run.add_argument('--hint', default='default', help='dsolve hint (default: %(default)s)')
+    run.add_argument('--timeout', type=float, default=60,
+                     help='seconds per ODE before the worker is killed (default: %(default)s)')
+    run.add_argument('--jobs', '-j', type=int, default=None,
+                     help='number of worker processes (default: number of cores)')
+    run.add_argument('--no-check', action='store_true', help='do not run checkodesol')
+    run.add_argument('--numeric-check', action='store_true',
+                     help='check solutions numerically first, and only use checkodesol '
+                          'when that is inconclusive')
+    run.add_argument('--output', '-o', help='write the records to this JSON file')
+    run.add_argument('--results', metavar='FILE',
+                     help='append every record to this JSON lines file as soon as it '
+                          'is finished')
+    run.add_argument('--resume', action='store_true',
+                     help='skip the ODEs that already have a record in the --results file')
+    run.add_argument('--costs', metavar='FILE',
+                     help='records or baseline of an earlier run, to start the most '
+                          'expensive ODEs first and to plan --shard')
+    run.add_argument('--shard', metavar='K/N', type=shard_spec,
+                     help='only run the K-th of N shards of about equal cost')
+    run.add_argument('--cache', help='SQLite file to take results from and store them in')
+    run.add_argument('--profile', metavar='DIR',
+                     help='profile dsolve and checkodesol and write a merged report and '
+                          'collapsed stacks for flamegraphs to DIR')
+    run.add_argument('--coverage', action='store_true',
+                     help='record the SymPy modules every ODE runs, for rerun')
+    run.add_argument('--memory', action='store_true',
+                     help='record peak memory and expression sizes, and report the ODEs '
+                          'whose memory is out of line with their size')
+    run.add_argument('--no-reference', action='store_true',
+                     help='also verify solutions that match the reference solution')
+    run.add_argument('--hint-timeout', type=float, default=None, metavar='SECONDS',
+                     help='with --hint all, all_Integral or best: seconds for every hint, '
+                          'a hint that takes longer counts as timed out')
+    run.add_argument('--total-timeout', type=float, default=None, metavar='SECONDS',
+                     help='with --hint all, all_Integral or best: seconds for all hints '
+                          'together (default: 0.8 times --timeout)')
+    run.add_argument('--start-method', choices=multiprocessing.get_all_start_methods(),
+                     help='how the worker processes are started (default: that of the '
+                          'platform); forkserver imports SymPy once for all workers')
+    run.add_argument('--isolate', action='store_true',
+                     help='solve every ODE in a fresh worker, with the SymPy cache as it '
+                          'is after the imports')
+    run.add_argument('--watchdog', type=float, default=0.05, metavar='SECONDS',
+                     help='sample the stack of every ODE at this interval, to report the '
+                          'hottest frames of a timeout; 0 turns it off (default: %(default)s)')
+    run.add_argument('--integral-memo', action='store_true',
+                     help='share the results of integrate between the ODEs of a worker')
+    run.add_argument('--integral-memo-size', type=int, default=4096,
+                     help='integrals kept in memory by every worker (default: %(default)s)')
+    run.add_argument('--integral-memo-file', metavar='FILE',
+                     help='also store the integrals in this SQLite file (implies '
+                          '--integral-memo)')
+    run.set_defaults(func=cmd_run)
+
+    rerun = commands.add_parser('rerun', help='solve only the ODEs affected by a change '
+                                              'to SymPy again')
+    rerun.add_argument('previous', help='JSON or JSON lines file of a run with --coverage')
+    change = rerun.add_mutually_exclusive_group(required=True)
+    change.add_argument('--diff', help='file with the unified diff of the change')
+    change.add_argument('--since', metavar='REV',
+                        help='take the change from git diff REV in the SymPy checkout')
+    rerun.add_argument('--hint', default='default', help='dsolve hint (default: %(default)s)')
+    rerun.add_argument('--timeout', type=float, default=60,
+                       help='seconds per ODE before the worker is killed (default: %(default)s)')
+    rerun.add_argument('--jobs', '-j', type=int, default=None,
+                       help='number of worker processes (default: number of cores)')
+    rerun.add_argument('--no-check', action='store_true', help='do not run checkodesol')
+    rerun.add_argument('--numeric-check', action='store_true',
+                       help='check solutions numerically first')
+    rerun.add_argument('--dry-run', action='store_true',
+                       help='only list the ODEs that would be solved again')
+    rerun.add_argument('--output', '-o', required=True,
+                       help='JSON file for the records of the new run')
+    rerun.set_defaults(func=cmd_rerun)
+
+    shards = commands.add_parser('shards', help='split the corpus into shards of equal cost')
+    shards.add_argument('numbers', nargs='*', help='Kamke numbers or ranges, e.g. 1-46 49')
+    shards.add_argument('--costs', required=True, metavar='FILE',
+                        help='records or baseline of an earlier run')
+    shards.add_argument('--count', '-n', type=int, required=True, help='number of shards')
+    shards.add_argument('--default-cost', type=float, default=None,
+                        help='seconds for ODEs without a recorded cost '
+                             '(default: the median of the recorded ones)')
+    shards.set_defaults(func=cmd_shards)
+
+    merge = commands.add_parser('merge', help='merge the results of several runs or shards')
+    merge.add_argument('files', nargs='+', help='JSON or JSON lines files of records')
+    merge.add_argument('--output', '-o', required=True,
+                       help='JSON file, or JSON lines file if it ends in .jsonl')
+    merge.set_defaults(func=cmd_merge)
+
+    references = commands.add_parser('references',
+                                     help='fill in verified reference solutions')
+    references.add_argument('numbers', nargs='*', help='Kamke numbers or ranges, e.g. 1-46 49')
+    references.add_argument('--hint-timeout', type=float, default=60,
+                            help='seconds for dsolve and for every other hint '
+                                 '(default: %(default)s)')
+    references.add_argument('--timeout', type=float, default=300,
+                            help='seconds per ODE before the worker is killed '
+                                 '(default: %(default)s)')
+    references.add_argument('--jobs', '-j', type=int, default=None,
+                            help='number of worker processes (default: number of cores)')
+    references.add_argument('--replace', action='store_true',
+                            help='replace stored references that are not verified')
+    references.add_argument('--dry-run', action='store_true',
+                            help='do not write the data file')
+    references.set_defaults(func=cmd_references)
+
+    concrete = commands.add_parser('concrete', help='solve the ODEs with arbitrary functions '
+                                                    'for concrete functions')
+    concrete.add_argument('numbers', nargs='*',
+                          help='Kamke numbers or ranges (default: all ODEs with f, g, h)')
+    concrete.add_argument('--count', '-n', type=int, default=3,
+                          help='instances per ODE (default: %(default)s)')
+    concrete.add_argument('--seed', type=int, default=0,
+                          help='seed of the random functions (default: %(default)s)')
+    concrete.add_argument('--kinds', default='polynomial,exponential,trigonometric',
+                          help='kinds of functions to choose from (default: %(default)s)')
+    concrete.add_argument('--instance-timeout', type=float, default=20,
+                          help='seconds for every instance and the abstract ODE '
+                               '(default: %(default)s)')
+    concrete.add_argument('--timeout', type=float, default=None,
+                          help='seconds per ODE before the worker is killed '
+                               '(default: enough for all instances)')
+    concrete.add_argument('--jobs', '-j', type=int, default=None,
+                          help='number of worker processes (default: number of cores)')
+    concrete.add_argument('--no-abstract', action='store_true',
+                          help='do not solve the abstract ODEs')
+    concrete.set_defaults(func=cmd_concrete)
+
+    scaling = commands.add_parser('scaling', help='time scaled up Kamke ODEs and fit the growth')
+    scaling.add_argument('numbers', nargs='+', help='Kamke numbers or ranges, e.g. 1 39')
+    scaling.add_argument('--by', choices=('degree', 'parameters', 'nesting'), default='degree',
+                         help='how to scale the ODEs (default: %(default)s)')
+    scaling.add_argument('--sizes', nargs='+', default=['1-8'],
+                         help='sizes or ranges of sizes (default: 1-8)')
+    scaling.add_argument('--timeout', type=float, default=60,
+                         help='seconds per size before the worker is killed; larger '
+                              'sizes are not tried (default: %(default)s)')
+    scaling.add_argument('--jobs', '-j', type=int, default=None,
+                         help='number of worker processes (default: number of cores)')
+    scaling.add_argument('--no-check', action='store_true', help='do not run checkodesol')
+    scaling.add_argument('--output', '-o', help='write the timings to this CSV file')
+    scaling.add_argument('--plot', help='plot the times to this image file (needs matplotlib)')
+    scaling.set_defaults(func=cmd_scaling)
+
+    stress = commands.add_parser('stress', help='solve transformed Kamke ODEs with known '
+                                                'solutions as a throughput benchmark')
+    stress.add_argument('--count', '-n', type=int, default=1000,
+                        help='number of ODEs to generate (default: %(default)s)')
+    stress.add_argument('--seed', type=int, default=0,
+                        help='seed of the generator (default: %(default)s)')
+    stress.add_argument('--depth', type=int, default=1,
+                        help='transformations per ODE (default: %(default)s)')
+    stress.add_argument('--timeout', type=float, default=30,
+                        help='seconds per ODE before the worker is killed (default: %(default)s)')
+    stress.add_argument('--jobs', '-j', type=int, default=None,
+                        help='number of worker processes (default: number of cores)')
+    stress.add_argument('--no-check', action='store_true', help='do not check the solutions')
+    stress.add_argument('--results', metavar='FILE',
+                        help='append every record to this JSON lines file')
+    stress.add_argument('--verbose', '-v', action='store_true', help='print every ODE')
+    stress.set_defaults(func=cmd_stress)
+
+    lazy = commands.add_parser('lazy', help='solve with the integrals deferred, and '
+                                            'evaluate them within a budget')
+    lazy.add_argument('numbers', nargs='*', help='Kamke numbers or ranges, e.g. 1-46 49')
+    lazy.add_argument('--budget', type=float, default=10,
+                      help='seconds for evaluating the integrals of one ODE '
+                           '(default: %(default)s)')
+    lazy.add_argument('--timeout', type=float, default=60,
+                      help='seconds per ODE before the worker is killed (default: %(default)s)')
+    lazy.add_argument('--jobs', '-j', type=int, default=None,
+                      help='number of worker processes (default: number of cores)')
+    lazy.add_argument('--compare', action='store_true',
+                      help='also time plain dsolve')
+    lazy.set_defaults(func=cmd_lazy)
+
+    deferred = commands.add_parser('deferred', help='solve without simplification, and time '
+                                                    'the simplification on its own')
+    deferred.add_argument('numbers', nargs='*', help='Kamke numbers or ranges, e.g. 1-46 49')
+    deferred.add_argument('--timeout', type=float, default=60,
+                          help='seconds per ODE before the worker is killed (default: %(default)s)')
+    deferred.add_argument('--jobs', '-j', type=int, default=None,
+                          help='number of worker processes (default: number of cores)')
+    deferred.add_argument('--no-check', action='store_true',
+                          help='do not verify the raw and the simplified solution')
+    deferred.add_argument('--compare', action='store_true',
+                          help='also time plain dsolve')
+    deferred.set_defaults(func=cmd_deferred)
+
+    multisol = commands.add_parser('multisol', help='verify the distinct solutions of the '
+                                                    'ODEs with a list of solutions in parallel')
+    multisol.add_argument('numbers', nargs='*', help='Kamke numbers or ranges, e.g. 1-46 49')
+    multisol.add_argument('--timeout', type=float, default=60,
+                          help='seconds per ODE and per solution before the worker is killed '
+                               '(default: %(default)s)')
+    multisol.add_argument('--jobs', '-j', type=int, default=None,
+                          help='number of worker processes (default: number of cores)')
+    multisol.add_argument('--numeric-check', action='store_true',
+                          help='check solutions numerically first')
+    multisol.add_argument('--compare', action='store_true',
+                          help='also verify every list in one job, without removing '
+                               'duplicates')
+    multisol.set_defaults(func=cmd_multisol)
+
+    coldwarm = commands.add_parser('coldwarm', help='time dsolve with a cold and a warm '
+                                                    'SymPy cache, for several cache sizes')
+    coldwarm.add_argument('numbers', nargs='*', help='Kamke numbers or ranges, e.g. 1-46 49')
+    coldwarm.add_argument('--sizes', nargs='+', default=['1000'], metavar='SIZE',
+                          help='values of SYMPY_CACHE_SIZE, none for an unbounded cache '
+                               '(default: 1000)')
+    coldwarm.add_argument('--timeout', type=float, default=120,
+                          help='seconds per ODE before the worker is killed, for all three '
+                               'runs (default: %(default)s)')
+    coldwarm.add_argument('--jobs', '-j', type=int, default=None,
+                          help='number of worker processes (default: number of cores)')
+    coldwarm.add_argument('--no-memory', action='store_true',
+                          help='do not measure the memory held by the cache, which takes '
+                               'a third, traced run')
+    coldwarm.add_argument('--output', '-o', help='write the records to this JSON file')
+    coldwarm.set_defaults(func=cmd_coldwarm)
+
+    baseline = commands.add_parser('baseline', help='record repeated solve and verify times')
+    baseline.add_argument('numbers', nargs='*', help='Kamke numbers or ranges, e.g. 1-46 49')
+    baseline.add_argument('--repeat', '-n', type=int, default=3,
+                          help='number of sweeps (default: %(default)s)')
+    baseline.add_argument('--timeout', type=float, default=60,
+                          help='seconds per ODE before the worker is killed (default: %(default)s)')
+    baseline.add_argument('--jobs', '-j', type=int, default=None,
+                          help='number of worker processes (default: number of cores)')
+    baseline.add_argument('--numeric-check', action='store_true',
+                          help='check solutions numerically first')
+    baseline.add_argument('--output', '-o', required=True, help='JSON file of the baseline')
+    baseline.add_argument('--start-method', choices=multiprocessing.get_all_start_methods(),
+                          help='how the worker processes are started (default: that of the '
+                               'platform); forkserver imports SymPy once for all workers')
+    baseline.add_argument('--isolate', action='store_true',
+                          help='solve every ODE in a fresh worker, with the SymPy cache as it '
+                               'is after the imports')
+    baseline.set_defaults(func=cmd_baseline)
+
+    compare = commands.add_parser('compare', help='compare two baselines, fail on regressions')
+    compare.add_argument('old', help='JSON file of the reference baseline')
+    compare.add_argument('new', help='JSON file of the new baseline')
+    compare.add_argument('--threshold', type=float, default=0.2,
+                         help='relative change of the median to report (default: %(default)s)')
+    compare.add_argument('--min-time', type=float, default=0.05,
+                         help='ignore changes below this many seconds (default: %(default)s)')
+    compare.set_defaults(func=cmd_compare)
+
+    hints = commands.add_parser('hints', help='time every matching hint of every ODE')
+    hints.add_argument('numbers', nargs='*', help='Kamke numbers or ranges, e.g. 1-46 49')
+    hints.add_argument('--timeout', type=float, default=20,
+                       help='seconds per hint before the worker is killed (default: %(default)s)')
+    hints.add_argument('--jobs', '-j', type=int, default=None,
+                       help='number of worker processes (default: number of cores)')
+    hints.add_argument('--output', '-o', help='write the hint x ODE table to this CSV file')
+    hints.add_argument('--ranking', help='write the hint ranking of the first command to '
+                                        'this JSON file')
+    hints.set_defaults(func=cmd_hints)
+
+    first = commands.add_parser('first', help='solve with the first hint that gives a '
+                                              'verified solution')
+    first.add_argument('numbers', nargs='*', help='Kamke numbers or ranges, e.g. 1-46 49')
+    first.add_argument('--ranking', help='JSON file of the hint ranking (default: the '
+                                         'order of classify_ode)')
+    first.add_argument('--hint-timeout', type=float, default=10,
+                       help='seconds per hint before going on to the next one '
+                            '(default: %(default)s)')
+    first.add_argument('--timeout', type=float, default=120,
+                       help='seconds per ODE before the worker is killed (default: %(default)s)')
+    first.add_argument('--jobs', '-j', type=int, default=None,
+                       help='number of worker processes (default: number of cores)')
+    first.add_argument('--no-numeric-check', action='store_true',
+                       help='verify only with checkodesol')
+    first.add_argument('--compare', action='store_true',
+                       help='also solve with dsolve and compare the times to solution')
+    first.set_defaults(func=cmd_first)
+
+    features = commands.add_parser('features',
+                                   help='compare classify_ode with the structural dispatcher')
+    features.add_argument('numbers', nargs='*', help='Kamke numbers or ranges, e.g. 1-46 49')
+    features.add_argument('--timeout', type=float, default=60,
+                          help='seconds per ODE before the worker is killed (default: %(default)s)')
+    features.add_argument('--jobs', '-j', type=int, default=None,
+                          help='number of worker processes (default: number of cores)')
+    features.set_defaults(func=cmd_features)
+
+    cache = commands.add_parser('cache', help='inspect or invalidate a result cache')
+    cache.add_argument('path', help='SQLite file of the cache')
+    cache.add_argument('--invalidate', action='append', metavar='MODULE',
+                       help='drop the records of the solvers in this module, '
+                            'e.g. sympy.solvers.ode.single')
+    cache.add_argument('--clear', action='store_true', help='drop all records')
+    cache.set_defaults(func=cmd_cache)
+
+    index = commands.add_parser('index', help='rebuild the offset index of a data file')
+    index.add_argument('name', nargs='?', default='kamke1_1',
+                       help='name of the database in kamke/data (default: %(default)s)')
+    index.set_defaults(func=cmd_index)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+r"""
+Performance baselines of the Kamke sweep.
+
+A baseline holds the solve and verify times of every ODE, measured in
+``repeat`` runs, in a JSON file:
+
+    {"sympy": "1.14.0", "repeat": 3, "timeout": 60,
+     "entries": {"12": {"status": "verified", "solve": [..], "verify": [..]}}}
+
+Two baselines are compared on the median of the repeats. A change only
+counts when it is larger than ``threshold`` (relative) and larger than the
+noise of the measurements, given by the median absolute deviations, so that
+one slow sample does not flag an ODE. This allows gating solver changes on
+"no Kamke ODE got more than 20% slower":
+$ python -m kamke baseline --repeat 5 -o before.json
+$ python -m kamke baseline --repeat 5 -o after.json
+$ python -m kamke compare before.json after.json --threshold 0.2
+"""
+import json
+import time
+from statistics import median
+
+from .cache import sympy_version
+from .runner import run_corpus
+
+METRICS = ('solve', 'verify')
+# statuses for which checkodesol ran
+CHECKED = ('verified', 'unverified')
+
+
+def record_baseline(numbers, repeat=3, timeout=60, processes=None, **options):
+    r"""
+    Sweep the Kamke ODEs ``numbers`` ``repeat`` times and return the
+    baseline. A timeout counts as ``timeout`` seconds of solve time.
+    """
+    entries = {}
+    for _ in range(repeat):
+        for record in run_corpus(numbers, timeout=timeout, processes=processes, **options):
+            entry = entries.setdefault(str(record['number']),
+                                       {'status': record['status'], 'solve': [], 'verify': []})
+            if record['status'] == 'timeout':
+                entry['status'] = 'timeout'
+                entry['solve'].append(timeout)
+            else:
+                entry['solve'].append(record.get('solve_time') or 0)
+            entry['verify'].append(record.get('check_time') or 0)
+    return {'sympy': sympy_version(), 'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'repeat': repeat, 'timeout': timeout,
+            'entries': dict(sorted(entries.items(), key=lambda e: int(e[0])))}
+
+
+def save_baseline(baseline, path):
+    with open(path, 'w') as fd:
+        json.dump(baseline, fd, indent=1)
+
+
+def load_baseline(path):
+    with open(path) as fd:
+        return json.load(fd)
+
+
+def _mad(values):
+    # median absolute deviation
+    m = median(values)
+    return median(abs(v - m) for v in values)
+
+
+def compare(old, new, threshold=0.2, min_time=0.05, noise=3):
+    r"""
+    Compare the baselines ``old`` and ``new``.
+
+    Returns a list of changes ``{'number', 'metric', 'old', 'new', 'ratio',
+    'kind'}`` where kind is 'regression' or 'improvement' for times and
+    'status' when the status of an ODE changed (e.g. from verified to
+    timeout). A time only changed when the medians differ by more than
+    ``threshold`` relative, by more than ``min_time`` seconds and by more
+    than ``noise`` times the summed median absolute deviations. Verify
+    times are only compared when both runs got to checkodesol.
+    """
+    changes = []
+    for number, before in old['entries'].items():
+        after = new['entries'].get(number)
+        if after is None:
+            continue
+        if before['status'] != after['status']:
+            changes.append({'number': int(number), 'metric': 'status', 'old': before['status'],
+                            'new': after['status'], 'ratio': None, 'kind': 'status'})
+        for metric in METRICS:
+            if metric == 'verify' and not (before['status'] in CHECKED
+                                           and after['status'] in CHECKED):
+                continue
+            m_old, m_new = median(before[metric]), median(after[metric])
+            diff = m_new - m_old
+            spread = noise * (_mad(before[metric]) + _mad(after[metric]))
+            if abs(diff) <= max(threshold * m_old, min_time, spread):
+                continue
+            changes.append({'number': int(number), 'metric': metric, 'old': m_old, 'new': m_new,
+                            'ratio': m_new / m_old if m_old else float('inf'),
+                            'kind': 'regression' if diff > 0 else 'improvement'})
+    return sorted(changes, key=lambda c: (c['kind'], c['number'], c['metric']))
@@ -0,0 +1,189 @@
+r"""
+Persistent cache of dsolve results.
+
+A sweep of the Kamke ODEs does not need to solve an ODE again when neither
+the ODE nor the SymPy checkout changed. Results are stored in an SQLite file,
+keyed by the hash of the canonical srepr of the ODE, the hint, the SymPy
+version (including the git commit, and a hash of the local changes, when
+SymPy is run from a git checkout) and the options of the run that change
+the record (see :data:`RECORD_OPTIONS`). A record holds the dsolve output,
+the checkodesol verdict and the timings.
+
+The cache is bounded by the total size of the stored records; the least
+recently used records are evicted first. Records also remember the module
+of the solver that produced them, so that after changing e.g.
+sympy/solvers/ode/single.py only its records have to be dropped:
+$ python -m kamke cache results.sqlite --invalidate sympy.solvers.ode.single
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import time
+from functools import lru_cache
+
+import sympy
+from sympy import srepr
+
+from .hints import solver_module
+
+# statuses that do not depend on the time budget of the run
+FINISHED = ('verified', 'unverified', 'solved', 'unsolved', 'error')
+
+# options of kamke.runner.solve_entry that change its record, with their
+# defaults; check is not one of them, see ResultCache.get
+RECORD_OPTIONS = {'numeric': False, 'profile_dir': None, 'memory': False, 'coverage': False,
+                  'reference': True, 'integrals': None, 'hint_timeout': None,
+                  'total_timeout': None}
+
+# the time limits of the hints, only the hints that try several use them
+HINT_OPTIONS = ('hint_timeout', 'total_timeout')
+MULTI_HINTS = ('all', 'all_Integral', 'best')
+
+
+@lru_cache(maxsize=None)
+def sympy_version():
+    r"""
+    The version of the SymPy that is imported. For a git checkout the
+    commit is added, and a hash of the diff if there are local changes.
+    """
+    version = sympy.__version__
+    root = os.path.dirname(os.path.dirname(os.path.abspath(sympy.__file__)))
+    try:
+        toplevel, commit = subprocess.run(
+            ['git', '-C', root, 'rev-parse', '--show-toplevel', 'HEAD'],
+            capture_output=True, text=True, check=True).stdout.split()
+        if os.path.realpath(toplevel) != os.path.realpath(root):
+            # e.g. a site-packages inside some other repository
+            return version
+        diff = subprocess.run(['git', '-C', root, 'diff', 'HEAD', '--', 'sympy'],
+                              capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return version
+    version += '+' + commit[:12]
+    if diff:
+        version += '.dirty' + hashlib.sha1(diff).hexdigest()[:8]
+    return version
+
+
+def ode_hash(ode):
+    """Hash of the canonical srepr of ``ode``."""
+    return hashlib.sha256(srepr(ode).encode()).hexdigest()
+
+
+def options_key(options, hint='default'):
+    r"""
+    The ``options`` of a run with ``hint`` that are in
+    :data:`RECORD_OPTIONS` and differ from their defaults, as a string for
+    the key of the cache. The time limits of the hints only count for the
+    :data:`MULTI_HINTS`.
+    """
+    return json.dumps({k: options[k] for k in RECORD_OPTIONS
+                       if options.get(k, RECORD_OPTIONS[k]) != RECORD_OPTIONS[k]
+                       and (hint in MULTI_HINTS or k not in HINT_OPTIONS)},
+                      sort_keys=True)
+
+
+class ResultCache:
+    r"""
+    SQLite store of dsolve records, see the module docstring.
+
+    ``max_size`` is the maximum total size in bytes of the stored records.
+    """
+
+    def __init__(self, path, max_size=256 * 2**20, version=None):
+        self.path = path
+        self.max_size = max_size
+        self.version = version or sympy_version()
+        self.hits = self.misses = 0
+        self.db = sqlite3.connect(path, timeout=60)
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(results)")]
+        if columns and 'options' not in columns:
+            # written before the options were part of the key
+            self.db.execute("DROP TABLE results")
+        self.db.execute("""CREATE TABLE IF NOT EXISTS results (
+            ode TEXT, hint TEXT, version TEXT, options TEXT, module TEXT, record TEXT,
+            size INTEGER, accessed REAL, PRIMARY KEY (ode, hint, version, options))""")
+        self.db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    def get(self, ode, hint='default', timeout=None, check=True, options=None):
+        r"""
+        The cached record of ``ode`` solved with ``hint`` and the options
+        ``options`` of :func:`~kamke.runner.solve_entry`, or None.
+
+        A cached timeout only counts when it had at least ``timeout`` seconds,
+        and a record without checkodesol verdict does not count when ``check``
+        is requested.
+        """
+        key = (ode_hash(ode), hint, self.version, options_key(options or {}, hint))
+        row = self.db.execute("SELECT record FROM results WHERE ode=? AND hint=? AND version=? "
+                              "AND options=?", key).fetchone()
+        record = json.loads(row[0]) if row else None
+        if record is not None:
+            if record['status'] == 'timeout':
+                if timeout is None or record.get('timeout', 0) < timeout:
+                    record = None
+            elif check and record['status'] == 'solved':
+                record = None
+        if record is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.db.execute("UPDATE results SET accessed=? WHERE ode=? AND hint=? AND version=? "
+                        "AND options=?", (time.time(),) + key)
+        self.db.commit()
+        return record
+
+    def put(self, ode, hint, record, options=None):
+        r"""
+        Store ``record`` for ``ode``, ``hint`` and ``options``. Only records
+        whose status does not depend on the machine are stored, plus timeouts.
+        """
+        if record['status'] not in FINISHED + ('timeout',):
+            return
+        data = json.dumps(record)
+        module = solver_module(record.get('solver_hint') or hint)
+        self.db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (ode_hash(ode), hint, self.version, options_key(options or {}, hint),
+                         module, data, len(data), time.time()))
+        self.evict()
+        self.db.commit()
+
+    def size(self):
+        """Total size in bytes of the stored records."""
+        return self.db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def evict(self):
+        """Drop the least recently used records until the cache fits in max_size."""
+        excess = self.size() - self.max_size
+        rows = self.db.execute("SELECT rowid, size FROM results ORDER BY accessed, rowid")
+        doomed = []
+        for rowid, size in rows:
+            if excess <= 0:
+                break
+            doomed.append((rowid,))
+            excess -= size
+        self.db.executemany("DELETE FROM results WHERE rowid=?", doomed)
+        return len(doomed)
+
+    def invalidate(self, module=None):
+        r"""
+        Drop the records produced by the solvers in ``module`` (a module
+        name or a package prefix like 'sympy.solvers.ode'), or all records
+        when no module is given. Returns the number of dropped records.
+        """
+        if module is None:
+            count = self.db.execute("DELETE FROM results").rowcount
+        else:
+            count = self.db.execute("DELETE FROM results WHERE module=? OR module LIKE ?",
+                                    (module, module + '.%')).rowcount
+        self.db.commit()
+        return count
@@ -0,0 +1,155 @@
+r"""
+Cold and warm cache timings of dsolve.
+
+SymPy keeps the results of many functions in a global cache (cacheit, an
+LRU cache of SYMPY_CACHE_SIZE entries per function, 1000 by default). Here
+every Kamke ODE is solved twice in a row: cold, after clear_cache(), and
+warm, with the cache that the cold run left. For both the hits and misses of
+all caches are counted. In a third run, under tracemalloc, the memory that
+the cache holds after solving the ODE is measured, as the memory that
+clear_cache() frees.
+
+SYMPY_CACHE_SIZE is only read when SymPy is imported, so every cache size
+runs in its own workers, started with the 'spawn' method and the size in
+their environment:
+$ python -m kamke coldwarm 1-100 --sizes 100 1000 10000 none
+"""
+import gc
+import os
+import tracemalloc
+from statistics import median
+from time import process_time
+
+from sympy.core import cache
+from sympy.core.cache import clear_cache
+from sympy.solvers.ode import dsolve
+
+from .corpus import load_corpus, y
+from .runner import run_pool
+
+kamke1_1 = load_corpus('kamke1_1')
+
+
+def cache_stats():
+    r"""
+    The hits and misses of all SymPy caches since they were cleared, and the
+    number of cached entries, as ``{'hits', 'misses', 'entries'}``.
+    """
+    stats = {'hits': 0, 'misses': 0, 'entries': 0}
+    for func in cache.CACHE:
+        info = func.cache_info()
+        stats['hits'] += info.hits
+        stats['misses'] += info.misses
+        stats['entries'] += info.currsize
+    return stats
+
+
+def hit_rate(hits, misses):
+    """The share of hits, or None without lookups."""
+    return hits / (hits + misses) if hits + misses else None
+
+
+def _solve(ode):
+    # the cpu time of dsolve, and the status
+    start = process_time()
+    try:
+        dsolve(ode, y)
+        status = 'solved'
+    except NotImplementedError:
+        status = 'unsolved'
+    return process_time() - start, status
+
+
+def cache_memory(ode):
+    r"""
+    The memory in bytes that the SymPy cache holds after solving ``ode``
+    from an empty cache, traced with tracemalloc.
+    """
+    clear_cache()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _solve(ode)
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        clear_cache()
+        gc.collect()
+        return before - tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def cold_warm_entry(number, memory=True):
+    r"""
+    Solve Kamke ODE ``number`` with a cold and then a warm cache, as a record
+    for the process pool with the cpu times 'cold_time' and 'warm_time', the
+    hits and misses of both runs, the 'entries' in the cache after them and
+    the SYMPY_CACHE_SIZE of the worker as 'cache_size'. With ``memory`` the
+    'cache_memory' held by the cache is measured as well.
+    """
+    ode = kamke1_1[number]
+    result = {'number': number, 'cache_size': cache.SYMPY_CACHE_SIZE}
+    clear_cache()
+    result['cold_time'], result['status'] = _solve(ode)
+    cold = cache_stats()
+    result['warm_time'], _ = _solve(ode)
+    warm = cache_stats()
+    result.update(cold_hits=cold['hits'], cold_misses=cold['misses'],
+                  warm_hits=warm['hits'] - cold['hits'],
+                  warm_misses=warm['misses'] - cold['misses'], entries=warm['entries'])
+    if memory:
+        result['cache_memory'] = cache_memory(ode)
+    return result
+
+
+def run_cache_sizes(numbers, sizes=(1000,), timeout=120, processes=None, memory=True):
+    r"""
+    :func:`cold_warm_entry` for the Kamke ODEs ``numbers`` with every cache
+    size of ``sizes`` (None for an unbounded cache). Yields the records,
+    with 'cache_size' set also for timeouts.
+    """
+    previous = os.environ.get('SYMPY_CACHE_SIZE')
+    try:
+        for size in sizes:
+            # inherited by the spawned workers, which import SymPy afresh
+            os.environ['SYMPY_CACHE_SIZE'] = str(size)
+            jobs = ((n, cold_warm_entry, (n, memory), {}) for n in numbers)
+            for number, result in run_pool(jobs, timeout, processes, start_method='spawn'):
+                yield dict(result, number=number, cache_size=size)
+    finally:
+        if previous is None:
+            os.environ.pop('SYMPY_CACHE_SIZE', None)
+        else:
+            os.environ['SYMPY_CACHE_SIZE'] = previous
+
+
+def summarize_sizes(records):
+    r"""
+    Aggregate the records of :func:`run_cache_sizes` per cache size: the
+    ODEs that finished, their total cold and warm time, the median speedup
+    warm/cold, the hit rates of both runs and the median cache memory.
+    """
+    summary = []
+    sizes = []
+    for r in records:
+        if r['cache_size'] not in sizes:
+            sizes.append(r['cache_size'])
+    for size in sizes:
+        done = [r for r in records if r['cache_size'] == size and 'cold_time' in r]
+        s = {'cache_size': size, 'count': len(done),
+             'timeouts': sum(1 for r in records
+                             if r['cache_size'] == size and r['status'] == 'timeout'),
+             'cold_time': sum(r['cold_time'] for r in done),
+             'warm_time': sum(r['warm_time'] for r in done),
+             'speedup': None, 'cold_hit_rate': None, 'warm_hit_rate': None,
+             'cache_memory': None}
+        if done:
+            s['speedup'] = median(r['cold_time'] / max(r['warm_time'], 1e-6) for r in done)
+            for run in ('cold', 'warm'):
+                s[run + '_hit_rate'] = hit_rate(sum(r[run + '_hits'] for r in done),
+                                                sum(r[run + '_misses'] for r in done))
+            memories = [r['cache_memory'] for r in done if 'cache_memory' in r]
+            if memories:
+                s['cache_memory'] = median(memories)
+        summary.append(s)
+    return summary
@@ -0,0 +1,126 @@
+r"""
+Concrete instances of the Kamke ODEs with arbitrary functions.
+
+About 30 Kamke ODEs contain the arbitrary functions f, g, h. Their
+solutions contain unevaluated Derivatives and Integrals of f, g, h, which
+the numeric check can not evaluate, so checkodesol has to decide, which is
+slow and often inconclusive. Here f, g, h are replaced by random elementary
+functions (low degree polynomials, exponentials, sines and cosines), and
+every instance is solved and verified like any other ODE, while the
+abstract ODE is timed for comparison:
+$ python -m kamke concrete --count 5 --instance-timeout 20
+
+The instances of one ODE are solved in one job, each within its own time
+limit. They only depend on the seed, so a failing instance can be
+reproduced from its record.
+"""
+import random
+from time import process_time
+
+from sympy import Derivative, Dummy, Lambda, cos, exp, sin
+from sympy.core.function import AppliedUndef
+from sympy.solvers.ode import dsolve
+
+from .corpus import load_corpus, x, y
+from .numeric import verify
+from .timeout import TimeLimitExceeded, time_limit
+
+kamke1_1 = load_corpus('kamke1_1')
+
+KINDS = ('polynomial', 'exponential', 'trigonometric')
+
+
+def arbitrary_functions(ode, func=y):
+    """The arbitrary functions (f, g, h) in ``ode``, sorted by name."""
+    return sorted({a.func for a in ode.atoms(AppliedUndef) if a.func != func.func},
+                  key=lambda f: f.__name__)
+
+
+def functional_numbers(corpus=kamke1_1):
+    r"""
+    The Kamke numbers of the ODEs with arbitrary functions. These are
+    taken from the ODEs, the 'functions' of the data file are incomplete.
+    """
+    return [n for n in corpus.numbers() if arbitrary_functions(corpus[n])]
+
+
+def random_function(rng, kinds=KINDS):
+    """A random elementary function of x of one of the ``kinds``."""
+    kind = rng.choice(kinds)
+    if kind == 'polynomial':
+        poly = sum(rng.choice((-2, -1, 1, 2, 3)) * x**k for k in range(rng.randint(1, 2) + 1))
+        return poly if poly.has(x) else poly + x
+    if kind == 'exponential':
+        return rng.randint(1, 3) * exp(rng.choice((-2, -1, 1, 2)) * x)
+    return rng.choice((sin, cos))(rng.randint(1, 3) * x)
+
+
+def substitute(ode, functions):
+    r"""
+    ``ode`` with the arbitrary functions replaced by the expressions in x
+    of ``functions``, e.g. ``{f: x**2 + 1}``, and their derivatives
+    evaluated.
+    """
+    t = Dummy('t')
+    for f, expr in functions.items():
+        ode = ode.replace(f, Lambda(t, expr.subs(x, t)))
+    return ode.replace(lambda e: isinstance(e, Derivative) and not e.has(y),
+                       lambda e: e.doit())
+
+
+def concrete_instances(ode, count=3, seed=0, kinds=KINDS):
+    r"""
+    ``count`` concrete instances of ``ode``, as a list of ``(ode,
+    functions)`` pairs. The same seed gives the same instances.
+    """
+    rng = random.Random(seed)
+    fs = arbitrary_functions(ode)
+    instances = []
+    for _ in range(count):
+        functions = {f: random_function(rng, kinds) for f in fs}
+        instances.append((substitute(ode, functions), functions))
+    return instances
+
+
+def _solve_timed(ode, timeout):
+    # dsolve and verify with a time limit, as a record
+    result = {'status': None, 'solve_time': None, 'check_time': None, 'check_method': None}
+    start = process_time()
+    try:
+        with time_limit(timeout):
+            sol = dsolve(ode, y)
+            result['solve_time'] = process_time() - start
+            checked, result['check_method'], result['check_time'] = verify(ode, sol, y)
+    except TimeLimitExceeded:
+        result['status'] = 'timeout'
+    except NotImplementedError:
+        result['status'] = 'unsolved'
+    except Exception as exc:
+        result.update(status='error', error='%s: %s' % (type(exc).__name__, exc))
+    else:
+        result['status'] = 'verified' if checked else 'unverified'
+        result['solution'] = str(sol)
+    if result['solve_time'] is None:
+        result['solve_time'] = process_time() - start
+    return result
+
+
+def solve_concrete(number, count=3, seed=0, timeout=20, abstract=True, kinds=KINDS):
+    r"""
+    Solve and verify ``count`` concrete instances of Kamke ODE ``number``,
+    with functions of the ``kinds``, and with ``abstract`` the ODE itself,
+    each within ``timeout`` seconds.
+    Returns a record for the process pool with 'abstract' and a list of
+    'instances', each a record of the status, the times and the check
+    method, the instances with their 'functions' as strings.
+    """
+    ode = kamke1_1[number]
+    record = {'number': number, 'seed': seed}
+    if abstract:
+        record['abstract'] = _solve_timed(ode, timeout)
+    record['instances'] = []
+    for instance, functions in concrete_instances(ode, count, seed, kinds):
+        result = {'functions': {str(f): str(e) for f, e in functions.items()}}
+        result.update(_solve_timed(instance, timeout))
+        record['instances'].append(result)
+    return record
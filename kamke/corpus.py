@@ -0,0 +1,184 @@
+r"""
+Lazy, indexed on-disk storage of the Kamke ODEs.
+
+The ODEs are stored in kamke/data/<name>.jsonl, one JSON object per line:
+
+    {"number": 1, "ode": "y.diff(x)-...", "functions": ["f(x)"],
+     "solution": "Eq(y, ...)", "comment": "..."}
+
+Entries that are too general to be written down have "ode": null. Next to it,
+kamke/data/<name>.idx holds the byte offset of every line as 8 byte
+integers, so that a single entry can be read with two seeks. The strings are
+only turned into SymPy expressions when an entry is accessed, so loading one
+ODE takes milliseconds instead of building the whole database.
+
+After editing a data file by hand, rebuild its index with:
+$ python -m kamke index kamke1_1
+"""
+import json
+import os
+import re
+from array import array
+from collections.abc import Sequence
+
+from sympy import Function, Symbol, symbols
+from sympy.parsing.sympy_parser import parse_expr
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+x = Symbol('x')
+y = Function('y')(x)
+# arbitrary functions in the kamke ODEs
+f = Function('f')
+g = Function('g')
+h = Function('h')
+
+# names the ODE strings are parsed with, everything else becomes a Symbol
+namespace = {'x': x, 'y': y, 'f': f, 'g': g, 'h': h}
+namespace.update((str(s), s) for s in symbols('C1:6'))
+namespace.update((str(s), s) for s in symbols(
+    'a0, a1, a2, a3, a4, b0, b1, b2, b3, b4, a, b, c, d, k, A, B, C, nu, m, n, '
+    'e1, e2, Alpha, Beta, Gamma, alpha, beta, gamma'))
+
+
+def parse(text):
+    """Convert a string from the data file to a SymPy expression."""
+    return parse_expr(text, local_dict=dict(namespace))
+
+
+def unparse(expr):
+    """Convert a SymPy expression to a string for the data file."""
+    return re.sub(r'\by\(x\)', 'y', str(expr))
+
+
+def _index_path(path):
+    return os.path.splitext(path)[0] + '.idx'
+
+
+def build_index(path):
+    r"""
+    Write the offset index of the data file ``path`` and return the offsets.
+
+    Line ``i`` of the data file must hold Kamke number ``i``.
+    """
+    offsets = array('q')
+    with open(path, 'rb') as fd:
+        offset = 0
+        for number, line in enumerate(fd):
+            if json.loads(line)['number'] != number:
+                raise ValueError("%s: line %d holds entry %s"
+                                 % (path, number, json.loads(line)['number']))
+            offsets.append(offset)
+            offset += len(line)
+    with open(_index_path(path), 'wb') as fd:
+        offsets.tofile(fd)
+    return offsets
+
+
+def write_corpus(entries, path):
+    r"""
+    Write ``entries`` (dictionaries in the format of the data file, sorted by
+    number) to ``path`` and rebuild its index.
+    """
+    with open(path, 'w') as fd:
+        for entry in entries:
+            fd.write(json.dumps(entry) + '\n')
+    build_index(path)
+
+
+class _Field(Sequence):
+    """Read-only view of one field of every entry, e.g. the reference solutions."""
+
+    def __init__(self, corpus, field):
+        self._corpus = corpus
+        self._field = field
+
+    def __len__(self):
+        return len(self._corpus)
+
+    def __getitem__(self, number):
+        if isinstance(number, slice):
+            return [self[i] for i in range(*number.indices(len(self)))]
+        return self._corpus.entry(number)[self._field]
+
+
+class KamkeCorpus(Sequence):
+    r"""
+    A Kamke database backed by a data file and its offset index.
+
+    ``corpus[i]`` is the ODE of Kamke number ``i`` (or 0 for the entries
+    that are too general), just like the old ``kamke1_1`` list.
+    :meth:`entry` gives all the stored information of one entry, and the
+    :attr:`solutions` and :attr:`functions` views replace the old
+    ``solution_kamke1`` and ``kamkefunctions`` lists.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._offsets = array('q')
+        if os.path.exists(_index_path(path)):
+            with open(_index_path(path), 'rb') as fd:
+                self._offsets.frombytes(fd.read())
+        if not self._index_is_current():
+            self._offsets = build_index(path)
+        self._cache = {}
+        self.solutions = _Field(self, 'solution')
+        self.functions = _Field(self, 'functions')
+
+    def _index_is_current(self):
+        # the last offset must point to the last line, holding the last entry
+        if not self._offsets:
+            return False
+        with open(self.path, 'rb') as fd:
+            fd.seek(self._offsets[-1])
+            try:
+                last = json.loads(fd.readline())
+            except ValueError:
+                return False
+            return last['number'] == len(self._offsets) - 1 and not fd.read(1)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, number):
+        if isinstance(number, slice):
+            return [self[i] for i in range(*number.indices(len(self)))]
+        return self.entry(number)['ode']
+
+    def raw(self, number):
+        """The unparsed JSON entry of Kamke number ``number``."""
+        if number < 0:
+            number += len(self)
+        with open(self.path, 'rb') as fd:
+            fd.seek(self._offsets[number])
+            return json.loads(fd.readline())
+
+    def entry(self, number):
+        r"""
+        All stored information of Kamke number ``number`` as SymPy objects:
+        the ODE, the arbitrary functions it contains, the reference solution
+        and the comment of the database.
+        """
+        if number < 0:
+            number += len(self)
+        if number not in self._cache:
+            self._cache[number] = self._parse_entry(self.raw(number))
+        return self._cache[number]
+
+    def _parse_entry(self, raw):
+        return {
+            'number': raw['number'],
+            'ode': parse(raw['ode']) if raw['ode'] else 0,
+            'functions': [parse(s) for s in raw['functions']] if raw.get('functions') else None,
+            'solution': parse(raw['solution']) if raw.get('solution') else None,
+            'comment': raw.get('comment', ''),
+        }
+
+    def numbers(self):
+        """The Kamke numbers of all entries that have an ODE."""
+        return [i for i in range(1, len(self)) if self.raw(i)['ode']]
+
+
+def load_corpus(name='kamke1_1'):
+    """Open the Kamke database ``name`` from the data directory."""
+    return KamkeCorpus(os.path.join(DATA_DIR, name + '.jsonl'))
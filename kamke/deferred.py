@@ -0,0 +1,154 @@
+r"""
+Solving without simplification, and simplifying later.
+
+dsolve simplifies the solution of the solver (odesimp: constantsimp, solving
+for y, removing redundant solutions), and checkodesol simplifies once more;
+on e.g. the Bernoulli and Abel ODEs 36-49 that can cost more than solving.
+:func:`dsolve_raw` solves with simplify=False, and :func:`simplify_solution`
+does what dsolve would have done on top of that, so that both are timed on
+their own. :class:`DeferredSolution` returns the raw solution right away and
+simplifies it in a background thread, or when it is asked for.
+
+Both are timed on the corpus, the raw and the simplified solution are
+verified, and with --compare plain dsolve is timed as well:
+$ python -m kamke deferred 36-49 --compare
+"""
+from concurrent.futures import ThreadPoolExecutor
+from time import process_time, thread_time
+
+from sympy import count_ops
+from sympy.core.cache import clear_cache
+from sympy.solvers.deutils import _desolve
+from sympy.solvers.ode import dsolve
+from sympy.solvers.ode.ode import _helper_simplify, _remove_redundant_solutions, odesimp
+
+from .corpus import load_corpus, unparse, y
+from .numeric import verify
+
+kamke1_1 = load_corpus('kamke1_1')
+
+
+def dsolve_raw(ode, func):
+    r"""
+    Solve ``ode`` with simplify=False. Returns ``(solution, match,
+    classify_time, solve_time)``, where ``match`` is what
+    :func:`simplify_solution` needs, and the cpu times of matching and of
+    the solver itself.
+    """
+    start = process_time()
+    # the single ODE branch of dsolve, see kamke.runner.dsolve_hint
+    match = _desolve(ode, func=func, hint='default', simplify=False, type='ode')
+    classify_time = process_time() - start
+    eq = match.pop('eq', ode)
+    start = process_time()
+    sol = _helper_simplify(eq, match['hint'], match, False)
+    match['eq'] = eq
+    return sol, match, classify_time, process_time() - start
+
+
+def simplify_solution(sol, match):
+    r"""
+    Simplify the raw solution ``sol`` of :func:`dsolve_raw` like dsolve
+    does: odesimp on every solution, and the redundant ones removed.
+    """
+    eq, func, hint = match['eq'], match['func'], match['hint']
+    simplified = []
+    for s in sol if isinstance(sol, list) else [sol]:
+        s = odesimp(eq, s, func, hint)
+        simplified.extend(s if isinstance(s, list) else [s])
+    if len(simplified) > 1:
+        simplified = _remove_redundant_solutions(eq, simplified, match['order'],
+                                                 func.args[0])
+    return simplified[0] if len(simplified) == 1 else simplified
+
+
+# one thread, so that background simplifications do not compete with each other
+_executor = None
+
+
+def _background():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(1, thread_name_prefix='simplify')
+    return _executor
+
+
+class DeferredSolution:
+    r"""
+    The solution of ``ode`` as :attr:`raw` from :func:`dsolve_raw`, with the
+    simplification deferred. With ``background`` it starts in a background
+    thread at once, else it runs when :meth:`simplified` is called first.
+    SymPy holds the GIL, so a background thread only helps while the caller
+    waits for something else.
+    """
+
+    def __init__(self, ode, func=y, background=False):
+        self.raw, self.match, self.classify_time, self.solve_time = dsolve_raw(ode, func)
+        self.simplify_time = None
+        self._future = None
+        self._simplified = None
+        if background:
+            self._future = _background().submit(self._simplify)
+
+    def _simplify(self):
+        # the cpu time of this thread, the caller may go on in the main thread
+        start = thread_time()
+        self._simplified = simplify_solution(self.raw, self.match)
+        self.simplify_time = thread_time() - start
+        return self._simplified
+
+    def done(self):
+        """Whether the simplified solution is ready."""
+        if self._future is not None:
+            return self._future.done()
+        return self.simplify_time is not None
+
+    def simplified(self, timeout=None):
+        r"""
+        The simplified solution. Waits at most ``timeout`` seconds for the
+        background thread (TimeoutError after that).
+        """
+        if self._future is not None:
+            return self._future.result(timeout)
+        if self.simplify_time is None:
+            self._simplify()
+        return self._simplified
+
+
+def deferred_entry(number, check=True, eager=False):
+    r"""
+    Solve Kamke ODE ``number`` without simplification and simplify the
+    solution afterwards, as a record for the process pool with the cpu
+    times 'classify_time', 'solve_time' and 'simplify_time' and the
+    count_ops of both solutions. With ``check`` both solutions are verified,
+    numerically first, with 'raw_check_time' and 'check_time'. With
+    ``eager`` plain dsolve, which simplifies, is timed as 'eager_time'.
+    """
+    ode = kamke1_1[number]
+    result = {'number': number}
+    # both modes start from an empty cache, so that they are comparable
+    clear_cache()
+    try:
+        deferred = DeferredSolution(ode)
+    except NotImplementedError as exc:
+        result.update(status='unsolved', error=str(exc))
+        return result
+    result.update(hint=deferred.match['hint'], classify_time=deferred.classify_time,
+                  solve_time=deferred.solve_time, raw_solution=unparse(deferred.raw),
+                  raw_ops=count_ops(deferred.raw))
+    sol = deferred.simplified()
+    result.update(simplify_time=deferred.simplify_time, solution=unparse(sol),
+                  ops=count_ops(sol), status='solved')
+    if check:
+        result['raw_checked'], _, result['raw_check_time'] = verify(ode, deferred.raw, y)
+        result['checked'], result['check_method'], result['check_time'] = verify(ode, sol, y)
+        result['status'] = 'verified' if result['checked'] else 'unverified'
+    if eager:
+        clear_cache()
+        start = process_time()
+        try:
+            dsolve(ode, y)
+        except NotImplementedError:
+            pass
+        result['eager_time'] = process_time() - start
+    return result
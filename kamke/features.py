@@ -0,0 +1,260 @@
+r"""
+Structural features of first order ODEs, used to skip hints in classify_ode.
+
+classify_ode runs every matcher of solver_map on every ODE, even when the
+structure of the ODE already rules most of them out. Here a first order
+ODE is written as E(x, y, p) = 0 with p = y', and, when E is of first
+degree in p, as y' = F(x, y). The features are cheap to compute:
+
+- the order, the arbitrary functions f, g, h and the parameters,
+- the degree of E in p,
+- the powers of y in F when F is a polynomial in y, whether F is linear in
+  y (with constant or Euler coefficients), of Riccati form
+  b0 + b1*y + b2*y**2 and whether b0, b1, b2 are rational in x,
+- whether F is homogeneous, F(t*x, t*y) = F(x, y), and separable,
+  F(x, y)*F(u, v) = F(x, v)*F(u, y), tested numerically at random points.
+
+:func:`candidate_hints` maps the features to the hints that can still match:
+every rule only removes hints whose matcher needs a structure the ODE does
+not have. :func:`classify_ode_fast` then runs only the matchers of those
+hints and returns the same tuple of hints as classify_ode. That both agree
+on the Kamke corpus, and how much matching is saved, is checked with:
+$ python -m kamke features --timeout 60
+"""
+import random
+from time import process_time
+
+import mpmath
+from sympy import Add, Dummy, Eq, Float, Symbol, Wild, cancel, collect, expand, lambdify, nan, oo, zoo
+from sympy.core.function import AppliedUndef
+from sympy.solvers.deutils import ode_order
+from sympy.solvers.ode import classify_ode
+from sympy.solvers.ode.ode import _preprocess, allhints
+from sympy.solvers.ode.single import SingleODEProblem, solver_map
+
+from .corpus import load_corpus, y
+
+kamke1_1 = load_corpus('kamke1_1')
+
+# hints of solver_map that only match ODEs of second or higher order, some
+# of them do not check the order before matching
+HIGHER_ORDER = {'nth_order_reducible', 'Liouville', '2nd_linear_airy', '2nd_linear_bessel',
+                '2nd_hypergeometric', '2nd_nonlinear_autonomous_conserved'}
+# hints that match the ODE against d + e*y'
+FIRST_DEGREE = {'separable', '1st_exact', '1st_linear', 'Bernoulli', 'Riccati_special_minus2',
+                '1st_rational_riccati', '1st_homogeneous_coeff_best',
+                '1st_homogeneous_coeff_subs_indep_div_dep',
+                '1st_homogeneous_coeff_subs_dep_div_indep', 'almost_linear',
+                'linear_coefficients', 'separable_reduced'}
+CONSTANT_COEFF_HOMOGENEOUS = {'nth_linear_constant_coeff_homogeneous'}
+CONSTANT_COEFF = {'nth_linear_constant_coeff_undetermined_coefficients',
+                  'nth_linear_constant_coeff_variation_of_parameters'}
+EULER_HOMOGENEOUS = {'nth_linear_euler_eq_homogeneous'}
+EULER = {'nth_linear_euler_eq_nonhomogeneous_undetermined_coefficients',
+         'nth_linear_euler_eq_nonhomogeneous_variation_of_parameters'}
+LINEAR = {'1st_linear'} | CONSTANT_COEFF_HOMOGENEOUS | CONSTANT_COEFF | EULER_HOMOGENEOUS | EULER
+HOMOGENEOUS_COEFF = {'1st_homogeneous_coeff_best', '1st_homogeneous_coeff_subs_indep_div_dep',
+                     '1st_homogeneous_coeff_subs_dep_div_indep'}
+
+
+def _has_x(expr, x):
+    return cancel(expr).has(x)
+
+
+def _rhs_coefficients(F, Y):
+    # {power: coefficient} of F as a polynomial in Y
+    coeffs = {}
+    for term in Add.make_args(expand(F)):
+        coeff, power = term.as_independent(Y, as_Add=False)
+        k = power.as_coeff_exponent(Y)[1] if power != 1 else 0
+        coeffs[k] = coeffs.get(k, 0) + coeff
+    return {k: c for k, c in coeffs.items() if c != 0}
+
+
+def _numeric_identity(lhs, rhs, symbols, points=4, seed=0):
+    r"""
+    Whether ``lhs == rhs`` at random points: False as soon as they clearly
+    differ at one point, True when they agree at all points that could be
+    evaluated and None when no point could.
+    """
+    try:
+        evaluate = lambdify(symbols, [lhs, rhs], modules='mpmath')
+    except (NameError, SyntaxError, TypeError):
+        return None
+    rng = random.Random(seed)
+    agreed = False
+    with mpmath.workdps(30):
+        for _ in range(points):
+            values = [mpmath.mpf(rng.uniform(0.3, 1.7)) for _ in symbols]
+            try:
+                a, b = (mpmath.mpmathify(v) for v in evaluate(*values))
+            except (ArithmeticError, ValueError, TypeError):
+                continue
+            if not (mpmath.isfinite(a) and mpmath.isfinite(b)):
+                continue
+            if abs(a - b) > 1e-15 * max(abs(a), abs(b), 1):
+                return False
+            agreed = True
+    return True if agreed else None
+
+
+def extract_features(eq, func):
+    r"""
+    The structural features of the ODE ``eq`` in ``func``, see the module
+    docstring. Features that do not apply, like the powers of y of a right
+    hand side that is not a polynomial in y, are None.
+    """
+    if isinstance(eq, Eq):
+        eq = eq.lhs - eq.rhs
+    x = func.args[0]
+    features = {'order': ode_order(eq, func),
+                'functions': sorted({str(f.func) for f in eq.atoms(AppliedUndef)
+                                     if f.func != func.func}),
+                'parameters': sorted(str(s) for s in eq.free_symbols - {x}),
+                'dy_degree': None, 'rhs_y_powers': None, 'linear': False,
+                'constant_coeff': False, 'euler_coeff': False, 'homogeneous_linear': False,
+                'riccati': False, 'riccati_special': False, 'rational_riccati': False,
+                'homogeneous': None, 'separable': None}
+    if features['order'] != 1:
+        return features
+
+    Y, P = Dummy('y'), Dummy('p')
+    E = expand(eq.subs(func.diff(x), P).subs(func, Y))
+    if E.is_polynomial(P):
+        features['dy_degree'] = max(t.as_coeff_exponent(P)[1] for t in Add.make_args(E))
+    if features['dy_degree'] != 1:
+        return features
+
+    F = cancel(-E.coeff(P, 0) / E.coeff(P, 1))
+    if F.is_polynomial(Y):
+        coeffs = _rhs_coefficients(F, Y)
+        features['rhs_y_powers'] = sorted(str(k) for k in coeffs)
+        powers = set(coeffs)
+        if powers <= {0, 1}:
+            c1 = coeffs.get(1, 0)
+            features['linear'] = True
+            features['homogeneous_linear'] = 0 not in powers
+            features['constant_coeff'] = not _has_x(c1, x)
+            features['euler_coeff'] = not _has_x(x*c1, x)
+        if max(powers, default=0) == 2 and powers <= {0, 1, 2}:
+            features['riccati'] = True
+            # y' = b*y**2 + c*y/x + d/x**2 with constant b, c, d
+            features['riccati_special'] = all(not _has_x(x**(2 - k)*c, x)
+                                              for k, c in coeffs.items())
+            # coefficients rational in x, with at most one symbol each
+            features['rational_riccati'] = all(
+                c.is_rational_function(x) and len(c.atoms(Symbol)) <= 1
+                and not c.atoms(Float, AppliedUndef) for c in coeffs.values())
+
+    if not F.atoms(AppliedUndef):
+        u, v, t = Dummy('u'), Dummy('v'), Dummy('t')
+        symbols = [x, Y, u, v, t] + sorted(F.free_symbols - {x, Y}, key=str)
+        features['homogeneous'] = _numeric_identity(
+            F.subs({x: t*x, Y: t*Y}, simultaneous=True), F, symbols)
+        features['separable'] = _numeric_identity(
+            F*F.subs({x: u, Y: v}, simultaneous=True),
+            F.subs(Y, v)*F.subs(x, u), symbols)
+    return features
+
+
+def candidate_hints(features):
+    r"""
+    The hints of solver_map that can match an ODE with ``features``, the
+    matchers of all other hints are known to fail on it.
+    """
+    hints = set(solver_map)
+    if features['order'] != 1:
+        return hints
+    hints -= HIGHER_ORDER
+    if features['dy_degree'] != 1:
+        return hints - FIRST_DEGREE - LINEAR
+
+    if not features['linear']:
+        hints -= LINEAR
+    if not features['constant_coeff']:
+        hints -= CONSTANT_COEFF | CONSTANT_COEFF_HOMOGENEOUS
+    if not features['euler_coeff']:
+        hints -= EULER | EULER_HOMOGENEOUS
+    if features['homogeneous_linear']:
+        hints -= CONSTANT_COEFF | EULER
+    else:
+        hints -= CONSTANT_COEFF_HOMOGENEOUS | EULER_HOMOGENEOUS
+
+    powers = features['rhs_y_powers']
+    if powers is not None and len(set(powers) - {'1'}) > 1:
+        # y' = Q*y**n - P*y has at most one power of y besides 1
+        hints.discard('Bernoulli')
+    if not features['riccati_special']:
+        hints.discard('Riccati_special_minus2')
+    if not features['rational_riccati']:
+        hints.discard('1st_rational_riccati')
+    if features['homogeneous'] is False:
+        hints -= HOMOGENEOUS_COEFF
+    if features['separable'] is False:
+        hints.discard('separable')
+    return hints
+
+
+def _power_series_matches(eq, func):
+    # the check of classify_ode for the hint 1st_power_series at x = 0
+    eq, _ = _preprocess(eq, func)
+    x = func.args[0]
+    df = func.diff(x)
+    d = Wild('d', exclude=[df, func.diff(x, 2)])
+    e = Wild('e', exclude=[df])
+    r = collect(expand(eq), df, exact=True).match(d + e*df)
+    if not r:
+        return False
+    y = Dummy('y')
+    check = cancel(r[d].subs(func, y) / r[e].subs(func, y))
+    check = check.subs({x: 0, y: Symbol('C1')})
+    return not check.has(oo, zoo, nan, -oo)
+
+
+def classify_ode_fast(eq, func, stats=None):
+    r"""
+    Same as ``classify_ode(eq, func)``, but the matchers of the hints
+    excluded by :func:`candidate_hints` are not run. ODEs that are not of
+    first order are passed on to classify_ode. If ``stats`` is a dict, the
+    numbers of matchers that were run and skipped are added to it.
+    """
+    if isinstance(eq, Eq):
+        eq = eq.lhs - eq.rhs
+    features = extract_features(eq, func)
+    candidates = candidate_hints(features)
+    if stats is not None:
+        stats['run'] = stats.get('run', 0) + len(candidates)
+        stats['skipped'] = stats.get('skipped', 0) + len(solver_map) - len(candidates)
+    if features['order'] != 1:
+        return classify_ode(eq, func)
+
+    problem = SingleODEProblem(eq, func, func.args[0], prep=True, xi=None, eta=None)
+    matching = set()
+    for hint, solver in solver_map.items():
+        if hint in candidates and solver(problem).matches():
+            matching.add(hint)
+            if solver.has_integral:
+                matching.add(hint + '_Integral')
+    if _power_series_matches(eq, func):
+        matching.add('1st_power_series')
+    return tuple(hint for hint in allhints if hint in matching)
+
+
+def compare_entry(number):
+    r"""
+    Classify Kamke ODE ``number`` with classify_ode and classify_ode_fast.
+    The status is 'same' when both give the same hints and 'different'
+    otherwise.
+    """
+    ode = kamke1_1[number]
+    start = process_time()
+    hints = classify_ode(ode, y)
+    classify_time = process_time() - start
+    stats = {}
+    start = process_time()
+    fast_hints = classify_ode_fast(ode, y, stats)
+    fast_time = process_time() - start
+    return {'status': 'same' if hints == fast_hints else 'different',
+            'hints': list(hints), 'fast_hints': list(fast_hints),
+            'classify_time': classify_time, 'fast_time': fast_time,
+            'run': stats['run'], 'skipped': stats['skipped']}
@@ -0,0 +1,149 @@
+r"""
+Per-hint timing matrix of the Kamke ODEs.
+
+dsolve only uses the default hint, so a normal sweep does not tell which
+solver is slow on which ODE. Here every Kamke ODE is classified with
+classify_ode, and every matching hint is timed on its own, each in a worker
+with its own time limit. The result is a hint x ODE table with the time,
+whether dsolve succeeded and the size (count_ops) of the solution.
+
+It can be run from the konsole using:
+$ python -m kamke hints --timeout 20 --output matrix.csv
+"""
+import csv
+from statistics import median
+from time import process_time
+
+from sympy import count_ops
+from sympy.solvers.ode import classify_ode, dsolve
+from sympy.solvers.ode.single import SingleODESolver
+
+from .corpus import load_corpus, y
+from .runner import run_pool
+
+kamke1_1 = load_corpus('kamke1_1')
+
+
+def _subclasses(cls):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _subclasses(sub)
+
+
+def solver_class(hint):
+    r"""
+    The SingleODESolver subclass implementing ``hint``, or None for the
+    hints that are still implemented as functions in sympy.solvers.ode.ode.
+    """
+    if hint.endswith('_Integral'):
+        hint = hint[:-len('_Integral')]
+    for cls in _subclasses(SingleODESolver):
+        if getattr(cls, 'hint', None) == hint:
+            return cls
+    return None
+
+
+def solver_module(hint):
+    """The module that contains the solver of ``hint``."""
+    cls = solver_class(hint)
+    return cls.__module__ if cls is not None else 'sympy.solvers.ode.ode'
+
+
+def classify_entry(number):
+    """The hints of classify_ode that match Kamke ODE ``number``."""
+    start = process_time()
+    hints = classify_ode(kamke1_1[number], y)
+    return {'status': 'classified', 'hints': list(hints),
+            'classify_time': process_time() - start}
+
+
+def solve_hint(number, hint):
+    r"""
+    Solve Kamke ODE ``number`` with only ``hint``. The status is 'solved',
+    'unsolved' (NotImplementedError) or 'error'; the size of a solution is
+    its count_ops.
+    """
+    result = {'size': None}
+    start = process_time()
+    try:
+        sol = dsolve(kamke1_1[number], y, hint=hint)
+    except NotImplementedError as exc:
+        result.update(status='unsolved', error=str(exc))
+    else:
+        result.update(status='solved', solution=str(sol), size=count_ops(sol))
+    result['time'] = process_time() - start
+    return result
+
+
+def hint_matrix(numbers, timeout=20, processes=None):
+    r"""
+    Time every hint matching the Kamke ODEs ``numbers``.
+
+    Returns a list of records ``{'number', 'hint', 'status', 'time', 'size'}``,
+    one for every (ODE, hint) pair. An ODE for which classify_ode itself
+    times out gets a single record with hint 'classify'.
+    """
+    records = []
+    matched = []
+    jobs = ((n, classify_entry, (n,), {}) for n in numbers)
+    for number, result in run_pool(jobs, timeout, processes):
+        if result['status'] == 'classified':
+            matched.extend((number, hint) for hint in result['hints'])
+        else:
+            records.append(dict(result, number=number, hint='classify'))
+
+    jobs = ((key, solve_hint, key, {}) for key in sorted(matched))
+    for (number, hint), result in run_pool(jobs, timeout, processes):
+        if result['status'] == 'timeout':
+            result['time'] = timeout
+        records.append(dict(result, number=number, hint=hint))
+    records.sort(key=lambda r: (r['number'], r['hint']))
+    return records
+
+
+def summarize(records):
+    r"""
+    Aggregate the records of :func:`hint_matrix` per hint: how often it
+    matched, succeeded, failed or timed out, its median time and the time
+    spent in runs that did not give a solution.
+    """
+    summary = {}
+    for r in records:
+        s = summary.setdefault(r['hint'], {'hint': r['hint'], 'matched': 0, 'solved': 0,
+                                           'failed': 0, 'timeout': 0, 'times': [],
+                                           'wasted': 0.0})
+        s['matched'] += 1
+        s['times'].append(r.get('time') or 0)
+        if r['status'] == 'solved':
+            s['solved'] += 1
+        else:
+            s['wasted'] += r.get('time') or 0
+            s['timeout' if r['status'] == 'timeout' else 'failed'] += 1
+    for s in summary.values():
+        s['total'] = sum(s['times'])
+        s['median'] = median(s['times'])
+        cls = solver_class(s['hint'])
+        s['solver'] = cls.__name__ if cls is not None else ''
+        del s['times']
+    return sorted(summary.values(), key=lambda s: -s['total'])
+
+
+def write_matrix(records, path):
+    r"""
+    Write ``records`` as a CSV table with one row per hint and one column
+    per Kamke number. A cell holds the time in seconds followed by the size
+    of the solution, or the status when dsolve did not give a solution.
+    """
+    numbers = sorted({r['number'] for r in records})
+    hints = sorted({r['hint'] for r in records})
+    cells = {}
+    for r in records:
+        if r['status'] == 'solved':
+            cells[r['hint'], r['number']] = '%.3f ops=%d' % (r['time'], r['size'])
+        else:
+            cells[r['hint'], r['number']] = '%.3f %s' % (r.get('time') or 0, r['status'])
+    with open(path, 'w', newline='') as fd:
+        writer = csv.writer(fd)
+        writer.writerow(['hint'] + numbers)
+        for hint in hints:
+            writer.writerow([hint] + [cells.get((hint, n), '') for n in numbers])
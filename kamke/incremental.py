@@ -0,0 +1,113 @@
+r"""
+Change-aware incremental sweeps of the Kamke ODEs.
+
+Most SymPy commits only touch one or two solver modules, and most Kamke
+ODEs never run them. With
+$ python -m kamke run --coverage -o results.json
+every record gets 'modules', the modules of sympy.solvers.ode,
+sympy.integrals and sympy.simplify that were executed while solving and
+verifying the ODE. After a change to SymPy only the ODEs that ran one of the
+changed modules are solved again, the other records are copied:
+$ python -m kamke rerun results.json --since HEAD~1 -o new.json
+$ python -m kamke rerun results.json --diff change.patch -o new.json
+
+This is conservative: a change to any other module of SymPy (e.g. in
+sympy.core) reruns the whole corpus, and ODEs without coverage (timeouts,
+crashes, records from runs without --coverage) are always solved again.
+Test files and files outside the sympy package are ignored.
+"""
+import os
+import re
+import subprocess
+import sys
+from contextlib import contextmanager
+
+import sympy
+
+# packages whose modules are recorded per ODE
+TRACKED = ('sympy.solvers.ode', 'sympy.integrals', 'sympy.simplify')
+
+SYMPY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(sympy.__file__)))
+
+
+def module_name(path):
+    r"""
+    The dotted name of the SymPy module in ``path``, which is either a file
+    name or a path relative to the root of the SymPy repository. None for
+    files that are not modules of the sympy package, and for test files.
+    """
+    if os.path.isabs(path):
+        path = os.path.relpath(path, SYMPY_ROOT)
+    parts = path.replace(os.sep, '/').split('/')
+    if parts[0] != 'sympy' or not parts[-1].endswith('.py') or 'tests' in parts:
+        return None
+    parts[-1] = parts[-1][:-3]
+    if parts[-1] == '__init__':
+        parts.pop()
+    return '.'.join(parts)
+
+
+def is_tracked(module):
+    return any(module == p or module.startswith(p + '.') for p in TRACKED)
+
+
+@contextmanager
+def traced_modules(modules):
+    r"""
+    Add the tracked modules of the functions called in the body of the
+    ``with`` statement to the set ``modules``. Only function calls are
+    traced, not lines, which keeps the overhead small.
+    """
+    files = set()
+
+    def tracer(frame, event, arg):
+        files.add(frame.f_code.co_filename)
+
+    previous = sys.gettrace()
+    sys.settrace(tracer)
+    try:
+        yield modules
+    finally:
+        sys.settrace(previous)
+        for filename in files:
+            module = module_name(filename) if filename.startswith(SYMPY_ROOT) else None
+            if module is not None and is_tracked(module):
+                modules.add(module)
+
+
+def diff_paths(diff):
+    """The paths of the files changed by the unified ``diff``."""
+    paths = set()
+    for match in re.finditer(r'^(?:---|\+\+\+) (?:[ab]/)?(\S+)', diff, re.MULTILINE):
+        if match.group(1) != '/dev/null':
+            paths.add(match.group(1))
+    return paths
+
+
+def git_changed_paths(since, root=SYMPY_ROOT):
+    """The paths changed in the SymPy checkout at ``root`` since ``since``."""
+    out = subprocess.run(['git', '-C', root, 'diff', '--name-only', since],
+                         capture_output=True, text=True, check=True).stdout
+    return set(out.split())
+
+
+def changed_modules(paths):
+    """The SymPy modules of the changed ``paths``, see :func:`module_name`."""
+    return {m for m in map(module_name, paths) if m is not None}
+
+
+def plan_rerun(records, changed):
+    r"""
+    Split the ``records`` of a previous run into the Kamke numbers that have
+    to be solved again after the SymPy modules ``changed`` changed, and the
+    records that are still valid.
+    """
+    everything = any(not is_tracked(m) for m in changed)
+    rerun, kept = [], []
+    for record in records:
+        modules = record.get('modules')
+        if everything or modules is None or changed.intersection(modules):
+            rerun.append(record['number'])
+        else:
+            kept.append(record)
+    return rerun, kept
@@ -0,0 +1,205 @@
+r"""
+Memo of integrals shared by the dsolve calls of a corpus run.
+
+Kamke ODEs of one type ask for the same integrals again and again, e.g. the
+linear ODEs 2-11 and the Riccati families, often only with another name for
+the integration variable or for the Dummy symbols of the solvers. While a
+:class:`IntegralMemo` is installed, every ``Integral.doit`` (and so every
+``integrate``) first looks up the integral in the memo. The key is the
+canonical form of the integral: the integration variables and the free
+Dummy symbols are renamed to _k0, _k1, ... (with their assumptions), so
+that alpha-equivalent integrals share one entry. Integrals that SymPy
+could not do are remembered as well, they are usually the most expensive.
+
+The memo keeps the ``size`` most recently used integrals in memory. With a
+``path`` they are also stored in an SQLite file, for the same SymPy version,
+which outlives the workers that are killed at a timeout and later runs:
+$ python -m kamke run --integral-memo-file integrals.sqlite
+
+Every record of the run gets the 'integral_hits' and 'integral_misses' of
+its ODE, and the cpu time the hits saved as 'integral_saved'.
+"""
+import hashlib
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from time import process_time
+
+from sympy import Integral, Symbol, preorder_traversal, srepr, sympify
+
+from .cache import sympy_version
+
+# the doit of SymPy, which the memo calls on a miss
+_doit = Integral.doit
+
+
+def canonical_integral(integral):
+    r"""
+    The canonical form of ``integral`` as ``(canonical, back)``, where
+    ``back`` renames the canonical symbols to those of ``integral``, or
+    None if the canonical names are taken.
+    """
+    if any(s.name.startswith('_k') and not s.is_Dummy for s in integral.atoms(Symbol)):
+        return None
+    order = list(dict.fromkeys(integral.variables))
+    for e in preorder_traversal(integral.function):
+        if e.is_Dummy and e not in order:
+            order.append(e)
+    names = {Symbol('_k%d' % i, **s.assumptions0): s for i, s in enumerate(order)}
+    forward = {s: k for k, s in names.items()}
+    return integral.xreplace(forward), names
+
+
+class IntegralMemo:
+    r"""
+    LRU memo of the results of ``Integral.doit``, see the module docstring.
+
+    ``size`` is the number of integrals kept in memory, ``path`` an optional
+    SQLite file that the results are also stored in, holding at most
+    ``file_size`` integrals.
+    """
+
+    def __init__(self, size=4096, path=None, file_size=100000, version=None):
+        self.size = size
+        self.path = path
+        self.file_size = file_size
+        self.version = version or sympy_version()
+        self.hits = self.misses = self.evictions = 0
+        self.saved = 0.0
+        self.memo = OrderedDict()
+        self.db = None
+        if path is not None:
+            self.db = sqlite3.connect(path, timeout=60)
+            self.db.execute("""CREATE TABLE IF NOT EXISTS integrals (
+                key TEXT, version TEXT, result TEXT, time REAL, accessed REAL,
+                PRIMARY KEY (key, version))""")
+            self.db.execute("CREATE INDEX IF NOT EXISTS integrals_accessed "
+                            "ON integrals (accessed)")
+            self.db.commit()
+
+    def close(self):
+        self.uninstall()
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def __len__(self):
+        return len(self.memo)
+
+    def counters(self):
+        """The hits, misses and saved cpu time so far, as a dictionary."""
+        return {'integral_hits': self.hits, 'integral_misses': self.misses,
+                'integral_saved': self.saved}
+
+    def _remember(self, key, result, seconds):
+        self.memo[key] = (result, seconds)
+        self.memo.move_to_end(key)
+        while len(self.memo) > self.size:
+            self.memo.popitem(last=False)
+            self.evictions += 1
+
+    def _file_key(self, key):
+        return hashlib.sha256(srepr(key).encode()).hexdigest()
+
+    def get(self, key):
+        r"""
+        The canonical result of the canonical integral ``key`` (with the
+        doit hints) and the cpu time it took, or None.
+        """
+        entry = self.memo.get(key)
+        if entry is not None:
+            self.memo.move_to_end(key)
+        elif self.db is not None:
+            file_key = self._file_key(key)
+            row = self.db.execute("SELECT result, time FROM integrals WHERE key=? AND version=?",
+                                  (file_key, self.version)).fetchone()
+            if row is not None:
+                entry = sympify(row[0]), row[1]
+                self._remember(key, *entry)
+                self.db.execute("UPDATE integrals SET accessed=? WHERE key=? AND version=?",
+                                (time.time(), file_key, self.version))
+                self.db.commit()
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.saved += entry[1]
+        return entry
+
+    def put(self, key, result, seconds):
+        """Store the canonical ``result`` of ``key``, which took ``seconds``."""
+        self._remember(key, result, seconds)
+        if self.db is not None:
+            self.db.execute("INSERT OR REPLACE INTO integrals VALUES (?, ?, ?, ?, ?)",
+                            (self._file_key(key), self.version, srepr(result), seconds,
+                             time.time()))
+            excess = self.db.execute(
+                "SELECT COUNT(*) FROM integrals").fetchone()[0] - self.file_size
+            if excess > 0:
+                self.db.execute("DELETE FROM integrals WHERE rowid IN (SELECT rowid FROM "
+                                "integrals ORDER BY accessed, rowid LIMIT ?)", (excess,))
+            self.db.commit()
+
+    def doit(self, integral, **hints):
+        """``integral.doit(**hints)`` through the memo."""
+        canonical = canonical_integral(integral)
+        try:
+            key = canonical and (canonical[0], tuple(sorted(hints.items())))
+            hash(key)
+        except TypeError:
+            key = None
+        if key is None:
+            return _doit(integral, **hints)
+        names = canonical[1]
+        entry = self.get(key)
+        if entry is not None:
+            return entry[0].xreplace(names)
+        start = process_time()
+        result = _doit(integral, **hints)
+        forward = {s: k for k, s in names.items()}
+        self.put(key, result.xreplace(forward), process_time() - start)
+        return result
+
+    def install(self):
+        """Route ``Integral.doit`` through this memo."""
+        memo = self
+
+        def doit(self, **hints):
+            return memo.doit(self, **hints)
+
+        doit.__doc__ = _doit.__doc__
+        doit.memo = memo
+        Integral.doit = doit
+
+    def uninstall(self):
+        if getattr(Integral.doit, 'memo', None) is self:
+            Integral.doit = _doit
+
+
+@contextmanager
+def memoized_integrals(memo):
+    """Install ``memo`` for the body of the with statement."""
+    memo.install()
+    try:
+        yield memo
+    finally:
+        memo.uninstall()
+
+
+# the memo of a worker process, kept over the ODEs it solves
+_worker_memo = None
+
+
+def worker_memo(size=4096, path=None):
+    r"""
+    The memo of this process, created and installed by the first call.
+    The worker processes of a run keep it installed until they exit.
+    """
+    global _worker_memo
+    if _worker_memo is None or (_worker_memo.size, _worker_memo.path) != (size, path):
+        if _worker_memo is not None:
+            _worker_memo.close()
+        _worker_memo = IntegralMemo(size, path)
+    _worker_memo.install()
+    return _worker_memo
@@ -0,0 +1,129 @@
+r"""
+Lazy integration: solve with the integrals deferred, evaluate them later.
+
+Many Kamke solutions end up with unevaluated Integrals anyway (e.g. Kamke 1
+and 5), but dsolve first tries hard to do them. :func:`dsolve_lazy` solves
+with the _Integral variant of the hint dsolve would use, which leaves the
+integrals alone, and :func:`evaluate_integrals` does them in a separate
+step within a time budget. Integrals that take longer, or that SymPy can not
+do, stay unevaluated; the solution is correct either way, and the numeric
+check of :mod:`kamke.numeric` handles Integrals.
+
+The time of an ODE is split into matching (classify_ode), the reduction of
+the ODE by the solver and integration:
+$ python -m kamke lazy --budget 10 --compare
+"""
+from time import process_time
+
+from sympy import Integral
+from sympy.core.cache import clear_cache
+from sympy.solvers.deutils import _desolve
+from sympy.solvers.ode import dsolve
+from sympy.solvers.ode.ode import _helper_simplify, allhints
+
+from .corpus import load_corpus, unparse, y
+from .numeric import verify
+from .timeout import TimeLimitExceeded, time_limit
+
+kamke1_1 = load_corpus('kamke1_1')
+
+
+def dsolve_lazy(ode, func):
+    r"""
+    Solve ``ode`` with its integrals left unevaluated, using the _Integral
+    variant of the hint dsolve would use, if it has one. Returns
+    ``(solution, hint, classify_time, reduce_time)``, the cpu times of
+    matching and of the solver itself.
+    """
+    start = process_time()
+    # the single ODE branch of dsolve, see kamke.runner.dsolve_hint
+    match = _desolve(ode, func=func, hint='default', simplify=True, type='ode')
+    classify_time = process_time() - start
+    hint = match['hint']
+    if hint + '_Integral' in allhints:
+        # classify_ode gives both hints the same match
+        match[hint + '_Integral'] = match[hint]
+        hint += '_Integral'
+    eq = match.pop('eq', ode)
+    start = process_time()
+    sol = _helper_simplify(eq, hint, match, True)
+    return sol, hint, classify_time, process_time() - start
+
+
+def _innermost(expr):
+    # the integrals without integrals in them
+    return [i for i in expr.atoms(Integral) if not any(
+        j.has(Integral) for j in i.args)]
+
+
+def evaluate_integrals(expr, budget=10):
+    r"""
+    Evaluate the integrals in ``expr``, innermost first, within ``budget``
+    seconds in total. Returns ``(expr, evaluated, deferred)`` with the
+    numbers of integrals that were done and left over.
+    """
+    if isinstance(expr, (list, tuple)):
+        results = [evaluate_integrals(e, budget / len(expr)) for e in expr]
+        return ([r[0] for r in results], sum(r[1] for r in results),
+                sum(r[2] for r in results))
+    start = process_time()
+    evaluated = 0
+    failed = set()
+    while True:
+        todo = [i for i in _innermost(expr) if i not in failed]
+        if not todo:
+            break
+        for integral in todo:
+            left = budget - (process_time() - start)
+            try:
+                if left <= 0:
+                    raise TimeLimitExceeded(budget)
+                with time_limit(left):
+                    done = integral.doit()
+            except (TimeLimitExceeded, NotImplementedError, ValueError):
+                done = integral
+            if done.has(Integral):
+                failed.add(integral)
+            else:
+                expr = expr.xreplace({integral: done})
+                evaluated += 1
+        if process_time() - start >= budget:
+            break
+    return expr, evaluated, len(expr.atoms(Integral))
+
+
+def lazy_entry(number, budget=10, eager=False):
+    r"""
+    Solve Kamke ODE ``number`` lazily and evaluate the integrals within
+    ``budget`` seconds, as a record for the process pool with the cpu
+    times 'classify_time', 'reduce_time' and 'integrate_time', and the
+    number of integrals 'evaluated' and 'deferred'. The final solution is
+    verified, numerically first. With ``eager`` plain dsolve is timed as
+    well, as 'eager_time'.
+    """
+    ode = kamke1_1[number]
+    result = {'number': number}
+    # both modes start from an empty cache, so that they are comparable
+    clear_cache()
+    try:
+        sol, result['lazy_hint'], result['classify_time'], result['reduce_time'] = \
+            dsolve_lazy(ode, y)
+    except NotImplementedError as exc:
+        result.update(status='unsolved', error=str(exc))
+        return result
+    result['deferred_solution'] = unparse(sol)
+    start = process_time()
+    sol, result['evaluated'], result['deferred'] = evaluate_integrals(sol, budget)
+    result['integrate_time'] = process_time() - start
+    result['solution'] = unparse(sol)
+    result['checked'], result['check_method'], result['check_time'] = verify(ode, sol, y)
+    result['status'] = 'verified' if result['checked'] else 'unverified'
+    if eager:
+        clear_cache()
+        start = process_time()
+        try:
+            dsolve(ode, y)
+        except NotImplementedError:
+            pass
+        result['eager_time'] = process_time() - start
+    return result
@@ -0,0 +1,104 @@
+r"""
+Peak memory and expression growth of dsolve and checkodesol.
+
+Some Kamke ODEs (e.g. the Abel ODEs 36-43 and the rational ODEs above 270)
+build huge intermediate expressions in the Risch integrator and in simplify,
+which ends with workers killed by the OOM killer. With
+$ python -m kamke run --memory
+every dsolve and checkodesol call records
+
+- <stage>_traced, the peak of the memory allocated by Python (tracemalloc),
+- <stage>_rss, the peak resident set size of the worker during the call,
+
+and the record gets the count_ops of the ODE and of the solution. Tracing
+allocations makes SymPy about twice as slow, so the times of such a run
+should not be compared with others.
+
+The peak RSS is reset before every call through /proc/self/clear_refs. Where
+that is not available, it is the peak of the worker process so far.
+
+:func:`memory_outliers` flags the ODEs whose peak memory is out of line with
+the size of the ODE, compared with the rest of the corpus.
+"""
+import re
+import resource
+import tracemalloc
+from contextlib import contextmanager
+from statistics import median
+
+STAGES = ('dsolve', 'checkodesol')
+
+
+def peak_rss():
+    """The peak resident set size of this process in bytes."""
+    try:
+        with open('/proc/self/status') as fd:
+            match = re.search(r'VmHWM:\s+(\d+) kB', fd.read())
+        if match:
+            return int(match.group(1)) * 1024
+    except OSError:
+        pass
+    # ru_maxrss is in kB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def reset_peak_rss():
+    """Reset the peak RSS to the current RSS, returns False if not possible."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as fd:
+            fd.write('5')
+        return True
+    except OSError:
+        return False
+
+
+@contextmanager
+def measured(result, stage):
+    r"""
+    Record the peak traced memory and the peak RSS of the body of the
+    ``with`` statement as ``result[stage + '_traced']`` and
+    ``result[stage + '_rss']``, in bytes.
+    """
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    reset_peak_rss()
+    try:
+        yield
+    finally:
+        result[stage + '_traced'] = tracemalloc.get_traced_memory()[1]
+        result[stage + '_rss'] = peak_rss()
+        if not tracing:
+            tracemalloc.stop()
+
+
+def peak_memory(record):
+    """The largest traced peak of the stages of ``record``, or None."""
+    peaks = [record[s + '_traced'] for s in STAGES if record.get(s + '_traced') is not None]
+    return max(peaks) if peaks else None
+
+
+def memory_outliers(records, factor=10, min_memory=50 * 2**20):
+    r"""
+    The records whose peak traced memory per operation of the ODE is more
+    than ``factor`` times the median of all records, and at least
+    ``min_memory`` bytes. They are sorted by their peak memory, largest
+    first, and get 'memory_ratio', the ratio to the median.
+    """
+    rates = {}
+    for record in records:
+        memory = peak_memory(record)
+        if memory is not None and record.get('ode_ops'):
+            rates[record['number']] = memory / record['ode_ops']
+    if not rates:
+        return []
+    typical = median(rates.values())
+    outliers = []
+    for record in records:
+        rate = rates.get(record['number'])
+        if rate is None or peak_memory(record) < min_memory or rate <= factor * typical:
+            continue
+        outliers.append(dict(record, memory_ratio=rate / typical))
+    return sorted(outliers, key=peak_memory, reverse=True)
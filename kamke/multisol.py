@@ -0,0 +1,73 @@
+r"""
+Parallel verification of the ODEs with several solutions.
+
+For many Riccati and Bernoulli ODEs dsolve returns a list of solutions,
+which checkodesol checks one after the other. Here the solutions of the
+lists are first reduced to the distinct ones (see
+:func:`~kamke.numeric.distinct_solutions`), and every distinct solution is
+verified in its own job of the process pool, so that the verification of
+an ODE takes about as long as its slowest solution, and grows with the
+number of distinct solutions rather than the length of the list.
+
+The ODEs are solved first (without verification), then the solutions of
+all ODEs with a list are verified together; with --compare each list is
+also verified as before, in one job:
+$ python -m kamke multisol 36-49 --compare
+"""
+from .corpus import load_corpus, y
+from .numeric import distinct_solutions, verify
+from .runner import run_pool
+
+kamke1_1 = load_corpus('kamke1_1')
+
+
+def verify_one(number, sol, numeric=True, dedup=True):
+    r"""
+    :func:`~kamke.numeric.verify` the solution ``sol`` (or list of
+    solutions) of Kamke ODE ``number``, as a record for the process pool.
+    """
+    checked, method, seconds = verify(kamke1_1[number], sol, y, numeric, dedup)
+    return {'status': 'verified' if checked else 'unverified', 'checked': checked,
+            'check_method': method, 'check_time': seconds}
+
+
+def verify_lists(solutions, timeout=60, processes=None, numeric=True, compare=False):
+    r"""
+    Verify the lists of ``solutions``, a dictionary ``{number: list}``, with
+    one job per distinct solution. Returns a record per number with the
+    number of 'solutions' and 'distinct' ones, the 'status' (verified when
+    all distinct solutions were), the summed cpu 'check_time' and the
+    'span', the wall time of the slowest job. A solution that timed out
+    counts as not verified. With ``compare`` every list is also verified
+    in one job without removing duplicates, as 'sequential_status' and
+    'sequential_time'.
+    """
+    records = {}
+    jobs = []
+    for number, sols in solutions.items():
+        distinct, index = distinct_solutions(sols, y)
+        records[number] = {'number': number, 'solutions': len(sols),
+                           'distinct': len(distinct), 'index': index, 'results': {},
+                           'check_time': 0.0, 'span': 0.0}
+        jobs.extend(((number, i), verify_one, (number, s, numeric), {})
+                    for i, s in enumerate(distinct))
+        if compare:
+            jobs.append(((number, 'all'), verify_one, (number, sols, numeric, False), {}))
+
+    for (number, i), result in run_pool(jobs, timeout, processes):
+        record = records[number]
+        if i == 'all':
+            record['sequential_status'] = result['status']
+            record['sequential_time'] = result.get('check_time') or result['wall_time']
+            continue
+        record['results'][i] = result
+        record['check_time'] += result.get('check_time') or result['wall_time']
+        record['span'] = max(record['span'], result['wall_time'])
+
+    for record in records.values():
+        results = record.pop('results')
+        statuses = [results[i]['status'] for i in range(record['distinct'])]
+        record['status'] = 'verified' if all(s == 'verified' for s in statuses) else (
+            'timeout' if 'timeout' in statuses else 'unverified')
+        record['statuses'] = statuses
+    return [records[n] for n in solutions]
@@ -0,0 +1,223 @@
+r"""
+Numeric pre-verification of ODE solutions.
+
+checkodesol often costs more than the dsolve call it checks, in particular
+for implicit solutions and solutions that contain Integral objects. Before
+doing that symbolic work, the ODE residual is evaluated with mpmath at a
+batch of random points: random values for x, for the constants C1..Cn and
+for the parameters of the ODE (a, b, nu, ...).
+
+- explicit solutions y = F(x) are substituted into the ODE,
+- implicit solutions F(x, y) = C1 are solved for the constant, and the
+  ODE is evaluated at random (x, y) with y' = -F_x/F_y from implicit
+  differentiation,
+- indefinite integrals in x are replaced by definite ones from a fixed
+  base point, which is an antiderivative as good as any other (unless the
+  integrand contains y, then the check is inconclusive).
+
+When the residual vanishes at all points the solution is accepted, when it
+is clearly nonzero at all points it is rejected. Everything else, like
+points where the expressions cannot be evaluated or ODEs with arbitrary
+functions f, g, h, is inconclusive and left to checkodesol.
+
+Lists of solutions (e.g. the branches of Riccati and Bernoulli ODEs) often
+repeat a solution in another form. Before they are verified, duplicates are
+dropped by :func:`distinct_solutions`, on a cheap key: the values of an
+explicit solution at a few fixed points, or else its structure, both with
+the constants renamed in the order they appear.
+"""
+import random
+import re
+from time import process_time
+
+import mpmath
+from sympy import Add, Derivative, Dummy, Eq, Integral, Symbol, lambdify, preorder_traversal, \
+    solve, srepr
+from sympy.core.function import AppliedUndef
+from sympy.solvers.ode.subscheck import checkodesol
+
+# base point of the definite integrals that replace indefinite ones
+BASE_POINT = 0.7
+
+
+def _definite_integrals(expr, x):
+    # Integral(f, x) -> Integral(f, (x, BASE_POINT, x))
+    return expr.replace(
+        lambda e: isinstance(e, Integral) and e.limits == ((x,),),
+        lambda e: Integral(e.function, (x, BASE_POINT, x)))
+
+
+def _residual_terms(ode, sol, func):
+    r"""
+    The additive terms of the ODE residual of the solution ``sol``, as
+    expressions in x, the constants and the parameters. For an implicit
+    solution y is replaced by a Dummy, which is also returned.
+    """
+    x = func.args[0]
+    ode = ode.lhs - ode.rhs if isinstance(ode, Eq) else ode
+    order = max(d.derivative_count for d in ode.atoms(Derivative) if d.expr == func)
+
+    if sol.lhs == func and not sol.rhs.has(func):
+        # explicit solution, differentiate it directly
+        derivs = [sol.rhs]
+        for k in range(order):
+            derivs.append(derivs[-1].diff(x))
+        expr = ode
+        for k in range(order, -1, -1):
+            expr = expr.subs(func.diff(x, k), derivs[k])
+        return _definite_integrals(expr, x), None
+
+    if order != 1:
+        return None, None
+    # implicit solution, write it as Phi(x, y) = C and use y' = -Phi_x/Phi_y
+    F = sol.lhs - sol.rhs
+    Y = Dummy('y')
+    F = F.subs(func, Y)
+    constants = sorted((s for s in F.free_symbols if re.match(r'C\d+$', s.name)),
+                       key=lambda s: s.name)
+    if not constants:
+        # F = 0 is a single curve, F is no level function at points off it
+        return None, None
+    phi = solve(F, constants[0])
+    if len(phi) != 1:
+        return None, None
+    F = phi[0]
+    if any(i.function.has(Y) for i in F.atoms(Integral)):
+        # the integration constant of an integral in x may depend on y, so
+        # an arbitrary antiderivative is not good enough
+        return None, None
+    dy = -F.diff(x) / F.diff(Y)
+    expr = ode.subs(func.diff(x), dy).subs(func, Y)
+    return _definite_integrals(expr, x), Y
+
+
+def numeric_check(ode, sol, func, points=6, tol=1e-10, seed=0):
+    r"""
+    Check ``sol`` of ``ode`` numerically at ``points`` random points.
+
+    Returns True if the residual vanishes at all points, False if it is
+    clearly nonzero at all of them, and None if the test is inconclusive.
+    A list of solutions is accepted when all of them are, and rejected when
+    one of them is.
+    """
+    if isinstance(sol, (list, tuple)):
+        verdicts = [numeric_check(ode, s, func, points, tol, seed) for s in sol]
+        if False in verdicts:
+            return False
+        return True if all(verdicts) else None
+
+    try:
+        expr, Y = _residual_terms(ode, sol, func)
+    except (NotImplementedError, ValueError, TypeError):
+        return None
+    if expr is None or expr.atoms(AppliedUndef) or expr.has(Derivative):
+        return None
+
+    x = func.args[0]
+    terms = Add.make_args(expr)
+    symbols = sorted(expr.free_symbols - {x}, key=lambda s: s.name) + [x]
+    try:
+        evaluate = lambdify(symbols, list(terms), modules='mpmath')
+    except (NameError, SyntaxError, TypeError):
+        return None
+
+    rng = random.Random(seed)
+    passed = failed = 0
+    with mpmath.workdps(30):
+        for _ in range(points):
+            values = [mpmath.mpf(rng.uniform(0.3, 1.7)) for _ in symbols]
+            try:
+                parts = [mpmath.mpmathify(v) for v in evaluate(*values)]
+            except (ArithmeticError, ValueError, TypeError):
+                continue
+            scale = max(abs(v) for v in parts)
+            if not all(mpmath.isfinite(v) for v in parts):
+                continue
+            if scale == 0 or abs(mpmath.fsum(parts)) <= tol * scale:
+                passed += 1
+            else:
+                failed += 1
+    if passed and not failed and passed >= points // 2:
+        return True
+    if failed and not passed and failed >= points // 2:
+        return False
+    return None
+
+
+def _renamed_constants(sol):
+    # the constants C1, C2, ... renamed in the order they appear in sol
+    constants = []
+    for e in preorder_traversal(sol):
+        if e.is_Symbol and re.match(r'C\d+$', e.name) and e not in constants:
+            constants.append(e)
+    return sol.xreplace({c: Symbol('_C%d' % (i + 1)) for i, c in enumerate(constants)})
+
+
+def solution_key(sol, func, points=3, digits=10, seed=0):
+    r"""
+    A cheap key of the solution ``sol``, equal for solutions that differ
+    only by the names of their constants, and for explicit solutions that
+    have the same values at ``points`` fixed random points, compared to
+    ``digits`` digits.
+    """
+    sol = _renamed_constants(sol)
+    x = func.args[0]
+    if isinstance(sol, Eq) and sol.lhs == func and not sol.rhs.has(func):
+        rhs = _definite_integrals(sol.rhs, x)
+        symbols = sorted(rhs.free_symbols - {x}, key=lambda s: s.name) + [x]
+        rng = random.Random(seed)
+        try:
+            evaluate = lambdify(symbols, rhs, modules='mpmath')
+            values = []
+            with mpmath.workdps(digits + 5):
+                for _ in range(points):
+                    v = mpmath.mpmathify(evaluate(*(mpmath.mpf(rng.uniform(0.3, 1.7))
+                                                    for _ in symbols)))
+                    if not mpmath.isfinite(v):
+                        raise ValueError
+                    values.append(mpmath.nstr(v, digits))
+            return ('numeric', tuple(symbols[:-1]), tuple(values))
+        except (ArithmeticError, NameError, SyntaxError, TypeError, ValueError):
+            pass
+    return ('structure', srepr(sol))
+
+
+def distinct_solutions(sols, func):
+    r"""
+    The solutions of the list ``sols`` without duplicates by
+    :func:`solution_key`, and for every solution the index of the one that
+    was kept for it.
+    """
+    keys, distinct, index = {}, [], []
+    for sol in sols:
+        key = solution_key(sol, func)
+        if key not in keys:
+            keys[key] = len(distinct)
+            distinct.append(sol)
+        index.append(keys[key])
+    return distinct, index
+
+
+def verify(ode, sol, func, numeric=True, dedup=True):
+    r"""
+    Verify ``sol`` of ``ode``, numerically first when ``numeric`` is set.
+
+    Returns ``(verdict, method, time)``, where method is 'numeric' when the
+    numeric check was conclusive and 'checkodesol' otherwise. With
+    ``dedup`` only the :func:`distinct_solutions` of a list are verified.
+    """
+    start = process_time()
+    if dedup and isinstance(sol, (list, tuple)):
+        sol = distinct_solutions(sol, func)[0]
+        if len(sol) == 1:
+            sol = sol[0]
+    if numeric:
+        verdict = numeric_check(ode, sol, func)
+        if verdict is not None:
+            return verdict, 'numeric', process_time() - start
+    checked = checkodesol(ode, sol, func)
+    if isinstance(checked, list):
+        verdict = all(c[0] is True for c in checked)
+    else:
+        verdict = checked[0] is True
+    return verdict, 'checkodesol', process_time() - start
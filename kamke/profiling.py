@@ -0,0 +1,181 @@
+r"""
+Profiling of dsolve and checkodesol over the whole corpus.
+
+With ``python -m kamke run --profile DIR`` every dsolve and checkodesol call
+runs under cProfile, and a sampling thread records the call stacks of the
+solving thread. Each call leaves two files in DIR:
+
+- <number>-<hint>-<stage>.prof, the cProfile statistics,
+- <number>-<hint>-<stage>.folded, the sampled stacks in the collapsed format
+  of flamegraph.pl and speedscope, prefixed with kamke<number>;<hint>;<stage>.
+
+At the end of the run they are merged into DIR/report.txt, a cumulative
+per-function report of the whole corpus, and DIR/stacks.folded.
+
+The same sampler, as :class:`Watchdog`, tells where an ODE that timed out
+was stuck, see :func:`~kamke.runner.run_pool`.
+"""
+import cProfile
+import glob
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    filename = code.co_filename
+    # keep the path from the package root, e.g. sympy/solvers/ode/single.py
+    for package in ('sympy', 'mpmath', 'kamke'):
+        marker = os.sep + package + os.sep
+        if marker in filename:
+            filename = package + os.sep + filename.rsplit(marker, 1)[1]
+            break
+    else:
+        filename = os.path.basename(filename)
+    return '%s:%s' % (filename, code.co_name)
+
+
+def collapse(frame, root=None):
+    r"""
+    The stack of ``frame`` in collapsed format, outermost frame first. The
+    stack starts at ``root`` if that frame is part of it.
+    """
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        if frame is root:
+            break
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+class StackSampler(threading.Thread):
+    r"""
+    Daemon thread that samples the stack of the thread ``thread_id`` every
+    ``interval`` seconds and counts the collapsed stacks in :attr:`stacks`.
+    Frames above ``root`` (e.g. the worker loop) are left out.
+    """
+
+    def __init__(self, thread_id=None, interval=0.005, root=None):
+        super().__init__(daemon=True)
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.root = root
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse(frame, self.root)] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        return self.stacks
+
+
+class Watchdog(StackSampler):
+    r"""
+    :class:`StackSampler` that calls ``report(stacks)`` once, when the
+    thread is still running ``deadline`` (a perf_counter time), and then
+    stops sampling.
+    """
+
+    def __init__(self, deadline, report, thread_id=None, interval=0.05, root=None):
+        super().__init__(thread_id, interval, root)
+        self.deadline = deadline
+        self.report = report
+
+    def run(self):
+        while not self._stop_event.wait(min(self.interval,
+                                            max(self.deadline - perf_counter(), 0))):
+            if perf_counter() >= self.deadline:
+                self.report(self.stacks)
+                return
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse(frame, self.root)] += 1
+
+
+def hot_frames(stacks, limit=20):
+    r"""
+    Histogram of the frames in the collapsed ``stacks`` of a sampler, as
+    rows ``[frame, samples, own samples]``: the samples the frame was on
+    the stack, and on top of it. The frames that were on the stack in at
+    least half of the samples come first, innermost first, so that the
+    first row is where the thread was stuck; then the others by samples.
+    """
+    total, own, depth = Counter(), Counter(), {}
+    for stack, count in stacks.items():
+        labels = stack.split(';')
+        for i, label in enumerate(labels):
+            depth[label] = min(depth.get(label, i), i)
+        total.update(dict.fromkeys(labels, count))
+        own[labels[-1]] += count
+    half = sum(stacks.values()) / 2
+    rows = sorted(total, key=lambda label: (False, -depth[label])
+                  if total[label] >= half else (True, -total[label]))
+    return [[label, total[label], own[label]] for label in rows[:limit]]
+
+
+def _write_folded(stacks, path, prefix=''):
+    with open(path, 'w') as fd:
+        for stack, count in stacks.most_common():
+            fd.write('%s%s %d\n' % (prefix, stack, count))
+
+
+@contextmanager
+def profiled(profile_dir, number, hint, stage):
+    r"""
+    Profile the body of the ``with`` statement with cProfile and the stack
+    sampler, and write the results for Kamke ``number``, ``hint`` and
+    ``stage`` ('dsolve' or 'checkodesol') to ``profile_dir``.
+    """
+    name = os.path.join(profile_dir, '%s-%s-%s' % (number, hint, stage))
+    # the frame with the with statement, below this contextmanager's __enter__
+    sampler = StackSampler(root=sys._getframe(2))
+    profile = cProfile.Profile()
+    sampler.start()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        stacks = sampler.stop()
+        profile.dump_stats(name + '.prof')
+        _write_folded(stacks, name + '.folded', 'kamke%s;%s;%s;' % (number, hint, stage))
+
+
+def merge_profiles(profile_dir, sort='cumulative', limit=100):
+    r"""
+    Merge all profiles in ``profile_dir`` into report.txt, sorted by
+    ``sort`` and showing the ``limit`` most expensive functions, and all
+    sampled stacks into stacks.folded. Returns the merged pstats.Stats.
+    """
+    paths = sorted(glob.glob(os.path.join(profile_dir, '*.prof')))
+    if not paths:
+        return None
+    stream = io.StringIO()
+    stats = pstats.Stats(paths[0], stream=stream)
+    for path in paths[1:]:
+        stats.add(path)
+    stream.write("%d profiles of %s\n" % (len(paths), profile_dir))
+    # do not list every profile file in the header of the report
+    stats.files = []
+    stats.sort_stats(sort).print_stats(limit)
+    with open(os.path.join(profile_dir, 'report.txt'), 'w') as fd:
+        fd.write(stream.getvalue())
+
+    with open(os.path.join(profile_dir, 'stacks.folded'), 'w') as out:
+        for path in sorted(glob.glob(os.path.join(profile_dir, '*-*.folded'))):
+            with open(path) as fd:
+                out.write(fd.read())
+    return stats
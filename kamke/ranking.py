@@ -0,0 +1,129 @@
+r"""
+First successful hint mode of dsolve, with a hint order learned on the corpus.
+
+dsolve uses the first hint of classify_ode, whether or not that is fast on
+the ODE at hand. When any correct solution will do, :func:`dsolve_first`
+tries the hints in the order of a ranking instead, gives every hint a time
+limit, and returns the first solution that passes verification. The
+_Integral and power series hints are not tried.
+
+The ranking comes from the per-hint timing matrix of :mod:`kamke.hints`: a
+hint is ranked by its median time divided by its success rate on the ODEs
+it matched, i.e. the time it is expected to cost per solution.
+$ python -m kamke hints --timeout 20 --ranking ranking.json
+$ python -m kamke first --ranking ranking.json --compare
+"""
+import json
+from time import process_time
+
+from sympy import Eq
+from sympy.solvers.ode.ode import _helper_simplify, _preprocess, allhints
+from sympy.solvers.ode.single import SingleODEProblem, solver_map
+
+from .cache import sympy_version
+from .corpus import load_corpus, y
+from .features import candidate_hints, extract_features
+from .hints import summarize
+from .numeric import verify
+from .timeout import TimeLimitExceeded, time_limit
+
+kamke1_1 = load_corpus('kamke1_1')
+
+
+def hint_ranking(records):
+    r"""
+    Rank the hints of the :func:`~kamke.hints.hint_matrix` ``records``.
+
+    Returns ``{'sympy', 'hints'}`` where 'hints' is a list of ``{'hint',
+    'matched', 'solved', 'median', 'cost'}`` sorted by cost, the median time
+    divided by the success rate. Hints that never succeeded come last.
+    """
+    ranked = []
+    for s in summarize(records):
+        if s['hint'] == 'classify':
+            continue
+        cost = s['median'] * s['matched'] / s['solved'] if s['solved'] else None
+        ranked.append({'hint': s['hint'], 'matched': s['matched'], 'solved': s['solved'],
+                       'median': s['median'], 'cost': cost})
+    ranked.sort(key=lambda r: (r['cost'] is None, r['cost'] or 0, r['median']))
+    return {'sympy': sympy_version(), 'hints': ranked}
+
+
+def save_ranking(ranking, path):
+    with open(path, 'w') as fd:
+        json.dump(ranking, fd, indent=1)
+
+
+def load_ranking(path):
+    with open(path) as fd:
+        return json.load(fd)
+
+
+def ranked_hints(ode, func, ranking=None):
+    r"""
+    The hints of solver_map that may match ``ode``, see
+    :func:`~kamke.features.candidate_hints`, in the order of ``ranking``.
+    Hints that are not ranked follow the ranked ones in the order of
+    classify_ode.
+    """
+    candidates = candidate_hints(extract_features(ode, func))
+    ranked = [r['hint'] for r in ranking['hints']] if ranking else []
+    order = ranked + [h for h in allhints if h not in ranked]
+    return [h for h in order if h in candidates]
+
+
+def dsolve_first(ode, func, ranking=None, hint_timeout=10, numeric=True):
+    r"""
+    Try the hints that match ``ode`` in the order of ``ranking`` and return
+    the first solution that is verified.
+
+    The matchers are run lazily, so that the hints after the first
+    successful one are never matched, and a hint is solved with the solver
+    that matched it, as dsolve would. Every hint gets ``hint_timeout``
+    seconds for matching, solving and verification together. Returns
+    ``(solution, hint, attempts)``, where solution and hint are None when
+    no hint succeeded and ``attempts`` lists ``{'hint', 'status', 'time'}``
+    of every matching hint that was tried, with status 'verified',
+    'unverified', 'unsolved', 'timeout' or 'error'.
+    """
+    # the equation and problem that dsolve passes to the solvers
+    eq, _ = _preprocess(ode.lhs - ode.rhs if isinstance(ode, Eq) else ode, func)
+    problem = SingleODEProblem(eq, func, func.args[0], prep=False, xi=None, eta=None)
+    attempts = []
+    for hint in ranked_hints(ode, func, ranking):
+        attempt = {'hint': hint}
+        start = process_time()
+        try:
+            with time_limit(hint_timeout):
+                solver = solver_map[hint](problem)
+                if not solver.matches():
+                    continue
+                sol = _helper_simplify(eq, hint, {'func': func, 'order': problem.order,
+                                                  hint: solver})
+                checked = verify(ode, sol, func, numeric)[0]
+        except TimeLimitExceeded:
+            attempt['status'] = 'timeout'
+        except NotImplementedError:
+            attempt['status'] = 'unsolved'
+        except Exception as exc:
+            attempt.update(status='error', error='%s: %s' % (type(exc).__name__, exc))
+        else:
+            attempt['status'] = 'verified' if checked else 'unverified'
+        attempt['time'] = process_time() - start
+        attempts.append(attempt)
+        if attempt['status'] == 'verified':
+            return sol, hint, attempts
+    return None, None, attempts
+
+
+def solve_first(number, ranking=None, hint_timeout=10, numeric=True):
+    r"""
+    :func:`dsolve_first` for Kamke ODE ``number``, as a record for the
+    process pool. The status is 'verified' or 'unsolved' and 'solve_time'
+    the cpu time until the verified solution, failed hints included.
+    """
+    start = process_time()
+    sol, hint, attempts = dsolve_first(kamke1_1[number], y, ranking, hint_timeout, numeric)
+    return {'number': number, 'status': 'verified' if sol is not None else 'unsolved',
+            'solver_hint': hint, 'solution': None if sol is None else str(sol),
+            'attempts': attempts, 'solve_time': process_time() - start}
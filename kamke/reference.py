@@ -0,0 +1,290 @@
+r"""
+Verified reference solutions of the Kamke ODEs, and a cheap comparison with
+them.
+
+The data file stores a reference solution per ODE (the 'solution' field of
+kamke/data/kamke1_1.jsonl). They are filled in with
+$ python -m kamke references --timeout 120
+
+which solves every entry that has no reference yet, first with the default
+hint of dsolve and then with the other hints (see :mod:`kamke.ranking`), and
+only stores a solution that was verified, numerically or by checkodesol.
+Existing references are verified as well and kept.
+
+A new solution that matches the reference of its ODE needs no checkodesol.
+Two solutions match when they describe the same family of curves:
+
+- structurally, after renaming the constants and folding Piecewise,
+- numerically, for explicit solutions with at most one constant: for a few
+  values D of the constant of the new solution, the constant K of the
+  reference that gives the same y at one x is found with mpmath.findroot,
+  and both have to agree at other x as well. This allows any
+  reparametrisation of the constant, like C1 -> k*C1 + c or C1 -> exp(C1),
+  and the Piecewise forms of a solution evaluate the same for generic
+  values of the parameters,
+- numerically, for implicit solutions F(x, y) = C1: the level curves of the
+  two functions are the same when their gradients are parallel everywhere.
+
+Solutions with arbitrary functions f, g, h can only match structurally.
+Everything that does not match is verified as before.
+"""
+import random
+import re
+from itertools import permutations
+from time import process_time
+
+import mpmath
+from sympy import Dummy, Eq, Integral, lambdify, piecewise_fold, solve
+from sympy.core.function import AppliedUndef
+from sympy.solvers.ode import dsolve
+
+from .corpus import load_corpus, unparse, write_corpus, y
+from .numeric import _definite_integrals, verify
+from .timeout import TimeLimitExceeded, time_limit
+
+kamke1_1 = load_corpus('kamke1_1')
+
+
+def _constants(expr):
+    return sorted((s for s in expr.free_symbols if re.match(r'C\d+$', s.name)),
+                  key=lambda s: s.name)
+
+
+def _solutions(sol):
+    return list(sol) if isinstance(sol, (list, tuple, set)) else [sol]
+
+
+def _same_structure(sol, ref):
+    # equal after renaming the constants and folding Piecewise; the two
+    # sides are compared separately, substituting into Eq would evaluate it
+    C, K = _constants(sol), _constants(ref)
+    if len(C) != len(K) or len(C) > 4:
+        return False
+    sides = [piecewise_fold(e) for e in (sol.lhs, sol.rhs)]
+    expected = [piecewise_fold(e) for e in (ref.lhs, ref.rhs)]
+    for renamed in permutations(K):
+        names = dict(zip(C, renamed))
+        if [e.xreplace(names) for e in sides] == expected:
+            return True
+    return False
+
+
+def _explicit(sol, func):
+    return isinstance(sol, Eq) and sol.lhs == func and not sol.rhs.has(func)
+
+
+def _evaluator(exprs, x, constants, parameters):
+    exprs = [_definite_integrals(e, x) for e in exprs]
+    if any(e.atoms(AppliedUndef) for e in exprs):
+        return None
+    try:
+        return lambdify(parameters + [x] + constants, exprs, modules='mpmath')
+    except (NameError, SyntaxError, TypeError):
+        return None
+
+
+def _close(a, b, tol):
+    return abs(a - b) <= tol * max(abs(a), abs(b), 1)
+
+
+def _same_explicit(sol, ref, func, points=4, tol=1e-8, seed=0):
+    # every sampled curve of sol must be a curve of ref
+    x = func.args[0]
+    C, K = _constants(sol.rhs), _constants(ref.rhs)
+    if len(C) > 1 or len(K) > 1:
+        return False
+    parameters = sorted((sol.rhs.free_symbols | ref.rhs.free_symbols) - {x} - set(C) - set(K),
+                        key=lambda s: s.name)
+    fs = _evaluator([sol.rhs], x, C, parameters)
+    fr = _evaluator([ref.rhs], x, K, parameters)
+    if fs is None or fr is None:
+        return False
+    rng = random.Random(seed)
+    with mpmath.workdps(15):
+        p = [mpmath.mpf(rng.uniform(0.3, 1.7)) for _ in parameters]
+        xs = [mpmath.mpf(rng.uniform(0.3, 1.7)) for _ in range(points)]
+        for D in ([mpmath.mpf(d) for d in (0.4, 1.1, 1.6)] if C else [None]):
+            try:
+                target = [mpmath.mpmathify(fs(*(p + [xi] + ([D] if C else [])))[0])
+                          for xi in xs]
+                if not all(mpmath.isfinite(t) for t in target):
+                    return False
+                if not K:
+                    ok = all(_close(mpmath.mpmathify(fr(*(p + [xi]))[0]), t, tol)
+                             for xi, t in zip(xs, target))
+                else:
+                    ok = any(_fits(fr, p, xs, target, start, tol)
+                             for start in (D or 0, 0, 1, -1, 1j))
+            except (ArithmeticError, ValueError, TypeError, ZeroDivisionError):
+                return False
+            if not ok:
+                return False
+    return True
+
+
+def _fits(fr, p, xs, target, start, tol):
+    # is there a constant K of the reference through all target points?
+    try:
+        K = mpmath.findroot(lambda k: fr(*(p + [xs[0], k]))[0] - target[0], start)
+        return all(_close(mpmath.mpmathify(fr(*(p + [xi, K]))[0]), t, tol)
+                   for xi, t in zip(xs[1:], target[1:]))
+    except (ArithmeticError, ValueError, TypeError, ZeroDivisionError):
+        return False
+
+
+def _level_function(sol, Y, func):
+    # F with sol <=> F(x, y) = C, or None
+    F = (sol.lhs - sol.rhs).subs(func, Y)
+    constants = _constants(F)
+    if len(constants) != 1:
+        return None
+    if any(i.function.has(Y) for i in F.atoms(Integral)):
+        return None
+    C = constants[0]
+    d = F.diff(C)
+    if not d.has(C):
+        # F is linear in C, as for most implicit solutions
+        return -F.subs(C, 0) / d
+    phi = solve(F, C)
+    return phi[0] if len(phi) == 1 else None
+
+
+def _same_implicit(sol, ref, func, points=4, tol=1e-8, seed=0):
+    # F(x, y) = C and G(x, y) = K have the same level curves iff
+    # F_x*G_y - F_y*G_x vanishes
+    x = func.args[0]
+    Y = Dummy('y')
+    try:
+        F, G = _level_function(sol, Y, func), _level_function(ref, Y, func)
+    except (NotImplementedError, ValueError, TypeError):
+        return False
+    if F is None or G is None:
+        return False
+    terms = [F.diff(x) * G.diff(Y), F.diff(Y) * G.diff(x)]
+    parameters = sorted((F.free_symbols | G.free_symbols) - {x, Y}, key=lambda s: s.name)
+    evaluate = _evaluator(terms, x, [Y], parameters)
+    if evaluate is None:
+        return False
+    rng = random.Random(seed)
+    passed = 0
+    with mpmath.workdps(30):
+        p = [mpmath.mpf(rng.uniform(0.3, 1.7)) for _ in parameters]
+        for _ in range(points):
+            values = p + [mpmath.mpf(rng.uniform(0.3, 1.7)), mpmath.mpf(rng.uniform(0.3, 1.7))]
+            try:
+                a, b = [mpmath.mpmathify(v) for v in evaluate(*values)]
+            except (ArithmeticError, ValueError, TypeError, ZeroDivisionError):
+                continue
+            if not (mpmath.isfinite(a) and mpmath.isfinite(b)):
+                continue
+            if not _close(a, b, tol) or a == b == 0:
+                return False
+            passed += 1
+    return passed >= points // 2
+
+
+def _same_one(sol, ref, func):
+    if not (isinstance(sol, Eq) and isinstance(ref, Eq)):
+        return sol == ref
+    if _same_structure(sol, ref):
+        return True
+    if _explicit(sol, func) and _explicit(ref, func):
+        return _same_explicit(sol, ref, func)
+    if not sol.has(func) or not ref.has(func):
+        return False
+    return _same_implicit(sol, ref, func)
+
+
+def same_solution(sol, ref, func):
+    r"""
+    Whether the solution ``sol`` (or every solution of a list) is one of
+    the solutions of the verified reference ``ref``, up to the names and
+    parametrisation of the constants and equivalent Piecewise forms.
+
+    False means that no match was found, not that ``sol`` is wrong.
+    """
+    if ref is None:
+        return False
+    refs = _solutions(ref)
+    return all(any(_same_one(s, r, func) for r in refs) for s in _solutions(sol))
+
+
+def verify_reference(ode, sol, func, ref, numeric=True):
+    r"""
+    :func:`~kamke.numeric.verify` that first compares ``sol`` with the
+    reference ``ref``; a match is returned with the method 'reference'.
+    """
+    start = process_time()
+    if same_solution(sol, ref, func):
+        return True, 'reference', process_time() - start
+    verdict, method, _ = verify(ode, sol, func, numeric)
+    return verdict, method, process_time() - start
+
+
+def _verified(ode, sol, seconds):
+    # numerically or by checkodesol, within the time limit
+    try:
+        with time_limit(seconds):
+            return verify(ode, sol, y)[0]
+    except (TimeLimitExceeded, Exception):
+        return False
+
+
+def reference_entry(number, hint_timeout=60):
+    r"""
+    A verified reference solution for Kamke ODE ``number``, as a record for
+    the process pool. The stored reference is kept when it is verified
+    (status 'kept'). Otherwise the solution of dsolve is taken if it is
+    verified, or else the first verified solution of the other hints
+    (status 'verified'). The status is 'unsolved' when there is none. A
+    stored reference that can not be verified is flagged with 'stored' set
+    to 'unverified'.
+    """
+    from .ranking import dsolve_first
+
+    ode = kamke1_1[number]
+    stored = kamke1_1.solutions[number]
+    start = process_time()
+    result = {'number': number, 'solution': None, 'solver_hint': None}
+    if stored is not None and _verified(ode, stored, hint_timeout):
+        result.update(status='kept', solution=unparse(stored))
+    else:
+        if stored is not None:
+            result['stored'] = 'unverified'
+        sol, hint = None, 'default'
+        try:
+            with time_limit(hint_timeout):
+                sol = dsolve(ode, y)
+        except (TimeLimitExceeded, Exception):
+            pass
+        if sol is None or not _verified(ode, sol, hint_timeout):
+            sol, hint, _ = dsolve_first(ode, y, hint_timeout=hint_timeout)
+        if sol is None:
+            result['status'] = 'unsolved'
+        else:
+            result.update(status='verified', solution=unparse(sol), solver_hint=hint)
+    result['solve_time'] = process_time() - start
+    return result
+
+
+def store_references(records, corpus=kamke1_1, replace=False):
+    r"""
+    Write the solutions of the :func:`reference_entry` ``records`` to the
+    data file of ``corpus``; existing references are only replaced with
+    ``replace``. Returns the numbers whose reference changed.
+    """
+    solutions = {r['number']: r['solution'] for r in records
+                 if r.get('status') in ('kept', 'verified')}
+    entries = [corpus.raw(n) for n in range(len(corpus))]
+    changed = []
+    for entry in entries:
+        sol = solutions.get(entry['number'])
+        if sol is None or sol == entry.get('solution'):
+            continue
+        if entry.get('solution') and not replace:
+            continue
+        entry['solution'] = sol
+        changed.append(entry['number'])
+    if changed:
+        write_corpus(entries, corpus.path)
+    return changed
@@ -0,0 +1,80 @@
+r"""
+Streaming result files with checkpoint and resume.
+
+With ``--results FILE`` every record is appended to FILE as one JSON line
+and flushed to disk as soon as its ODE is finished, so that a sweep that is
+killed partway (timeout of the CI job, OOM, ^C) keeps everything it did. A
+record holds the number, hint, status, timings, the solution as str and
+srepr, and the verification result. Restarting with ``--resume`` skips the
+ODEs that are already in the file:
+$ python -m kamke run --results sweep.jsonl
+$ python -m kamke run --results sweep.jsonl --resume
+
+This also allows to sweep the corpus in slices, e.g. in CI jobs with a time
+limit, all appending to the same file.
+"""
+import json
+import os
+
+
+class ResultLog:
+    r"""
+    Append-only JSON lines file of records. Every record is flushed and
+    synced on :meth:`write`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        if os.path.exists(path):
+            # drop a last line that was cut off, so that it does not run into
+            # the first new record
+            with open(path, 'rb+') as fd:
+                data = fd.read()
+                if data and not data.endswith(b'\n'):
+                    fd.truncate(data.rfind(b'\n') + 1)
+        self.fd = open(path, 'a')
+
+    def write(self, record):
+        self.fd.write(json.dumps(record, sort_keys=True) + '\n')
+        self.fd.flush()
+        os.fsync(self.fd.fileno())
+
+    def close(self):
+        self.fd.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_results(path):
+    r"""
+    The records of the JSON lines file ``path``. A last line that was cut
+    off by killing the writer is ignored, and a missing file has no records.
+    """
+    records = []
+    if not os.path.exists(path):
+        return records
+    with open(path) as fd:
+        for line in fd:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                if line.endswith('\n'):
+                    raise
+    return records
+
+
+def load_records(path):
+    """The records of a JSON file of ``run -o`` or a JSON lines file."""
+    if path.endswith('.jsonl'):
+        return read_results(path)
+    with open(path) as fd:
+        return json.load(fd)
+
+
+def finished(records, hint='default'):
+    """The Kamke numbers that already have a record for ``hint``."""
+    return {r['number'] for r in records if r.get('hint', 'default') == hint}
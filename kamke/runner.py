@@ -0,0 +1,445 @@
+r"""
+Process pool runner for the Kamke ODEs.
+
+Every Kamke number is sent to a pool of worker processes, sized to the number
+of cores of the machine. A worker that runs past its time budget is killed and
+replaced by a fresh one, and the ODE is recorded as a timeout instead of
+hanging the sweep. A worker that dies by itself (e.g. killed by the OOM
+killer) is replaced as well and its ODE is recorded as crashed.
+
+With a watchdog, a thread in the worker samples the stack of the job, and
+sends the histogram of its hottest frames to the parent shortly before the
+timeout, which attaches it to the timeout record as 'hot_frames'; see
+:func:`~kamke.profiling.hot_frames`.
+
+A worker normally runs one job after the other, so the SymPy cache of one
+ODE carries over to the next, which changes their timings and memory. With
+``isolate`` every job gets a fresh worker instead. With the 'forkserver'
+start method these are forked from a server process that has imported
+SymPy and the solvers (:data:`PRELOAD`) once, so that a fresh worker starts
+in milliseconds with the cache as it is after the imports:
+$ python -m kamke run --start-method forkserver --isolate
+
+Functions that are for internal use:
+- _Worker
+- _worker_main
+"""
+import multiprocessing
+import os
+import sys
+import threading
+import traceback
+from contextlib import nullcontext
+from multiprocessing.connection import wait
+from time import perf_counter, process_time
+
+from sympy import Eq, count_ops, srepr
+from sympy.core.cache import clear_cache
+from sympy.solvers.ode import classify_ode
+from sympy.solvers.ode.ode import _desolve, _helper_simplify, _preprocess, ode_sol_simplicity
+
+from .corpus import load_corpus, y
+from .incremental import traced_modules
+from .memory import measured
+from .profiling import Watchdog, hot_frames, profiled
+from .reference import verify_reference
+from .timeout import TimeLimitExceeded, time_limit
+
+kamke1_1 = load_corpus('kamke1_1')
+
+# modules the fork server imports, those of test_kamke_1_1.py and kamke
+PRELOAD = ['sympy', 'sympy.functions', 'sympy.integrals.risch', 'sympy.solvers.ode',
+           'sympy.solvers.ode.ode', 'kamke.runner']
+
+
+def dsolve_all(ode, func, hint='all', hint_timeout=None, timeout=None, simplify=True,
+               attempts=None):
+    r"""
+    ``dsolve(ode, func, hint=hint)`` for the hints 'all', 'all_Integral' and
+    'best', with a time limit of ``hint_timeout`` seconds for every hint and
+    of ``timeout`` seconds for all of them, classify_ode included.
+
+    As with dsolve, the result maps every hint to its solution or to the
+    NotImplementedError it raised, and has 'best', 'best_hint', 'default'
+    and 'order' when a hint succeeded. A hint that ran over its limit, or
+    that was not started because the total limit was reached, maps to a
+    :class:`~kamke.timeout.TimeLimitExceeded`. The hints are tried in the
+    order of classify_ode, and 'default' is its default hint. With ``attempts``, a list, ``{'hint', 'status',
+    'time'}`` of every hint is appended to it, with status 'solved',
+    'unsolved' or 'timeout'.
+    """
+    deadline = None if timeout is None else perf_counter() + timeout
+    # classify_ode once, as dsolve does, for its default hint and order of
+    # all matching hints, which the hints of all_Integral leave out
+    if isinstance(ode, Eq):
+        ode = ode.lhs - ode.rhs
+    eq, func = _preprocess(ode, func)
+    with time_limit(timeout):
+        classified = classify_ode(eq, func, dict=True, hint=hint, prep=False)
+    if not classified['default']:
+        raise NotImplementedError("solve: Cannot solve %s" % eq)
+    # the hints of _desolve(hint=hint)
+    gethints = set(classified) - {'order', 'default', 'ordered_hints'}
+    if hint == 'all_Integral':
+        gethints -= {h.removesuffix('_Integral') for h in gethints if h.endswith('_Integral')}
+        gethints -= {'1st_homogeneous_coeff_best', '1st_power_series', 'lie_group',
+                     '2nd_power_series_ordinary', '2nd_power_series_regular'}
+    order = [h for h in classified['ordered_hints'] if h in gethints]
+    hints = {h: _desolve(eq, func, hint=h, simplify=simplify, prep=False, classify=False,
+                         order=classified['order'], match=classified[h], type='ode')
+             for h in order}
+    solved, failed = {}, {}
+    for h in order:
+        seconds = hint_timeout
+        if deadline is not None:
+            seconds = min(seconds or timeout, deadline - perf_counter())
+        start = process_time()
+        try:
+            if seconds is not None and seconds <= 0:
+                raise TimeLimitExceeded(timeout)
+            with time_limit(seconds):
+                solved[h] = _helper_simplify(eq, h, hints[h], simplify)
+        except (NotImplementedError, TimeLimitExceeded) as exc:
+            failed[h] = exc
+        if attempts is not None:
+            status = 'solved' if h in solved else (
+                'unsolved' if isinstance(failed[h], NotImplementedError) else 'timeout')
+            attempts.append({'hint': h, 'status': status, 'time': process_time() - start})
+
+    result = dict(solved)
+    if solved:
+        result['best'] = min(solved.values(), key=lambda sol:
+                             ode_sol_simplicity(sol, func, trysolving=not simplify))
+        result['best_hint'] = next(h for h in order if solved.get(h) == result['best'])
+        result['default'] = classified['default']
+        result['order'] = classified['order']
+    if hint == 'best':
+        if not solved:
+            raise NotImplementedError("no hint solved %s" % ode)
+        return result['best']
+    result.update(failed)
+    return result
+
+
+def dsolve_hint(ode, func, hint='default', hint_timeout=None, timeout=None, attempts=None):
+    r"""
+    Same as ``dsolve(ode, func, hint=hint)``, but also returns the hint that
+    was actually used, e.g. the one 'default' resolved to. For 'all',
+    'all_Integral' and 'best' that is the best hint, whose solution is
+    returned; the time limits and ``attempts`` are those of
+    :func:`dsolve_all`.
+    """
+    if hint in ('all', 'all_Integral', 'best'):
+        sols = dsolve_all(ode, func, 'all' if hint == 'best' else hint, hint_timeout,
+                          timeout, attempts=attempts)
+        if 'best' not in sols:
+            raise NotImplementedError("no hint solved %s" % ode)
+        return sols['best'], sols['best_hint']
+    # this is the single ODE branch of dsolve
+    hints = _desolve(ode, func=func, hint=hint, simplify=True, type='ode')
+    eq = hints.pop('eq', ode)
+    return _helper_simplify(eq, hints['hint'], hints, True), hints['hint']
+
+
+def solve_entry(number, hint='default', check=True, numeric=False, profile_dir=None,
+                memory=False, coverage=False, reference=True, integrals=None,
+                hint_timeout=None, total_timeout=None):
+    r"""
+    Solve Kamke ODE ``number`` with ``hint`` and verify the solution.
+
+    Returns a dictionary with the status, the solution as str and srepr and
+    the cpu time spent in dsolve and checkodesol. 'solver_hint' is the hint that
+    dsolve actually used. The status is one of
+    'verified', 'unverified' (checkodesol could not confirm the solution),
+    'solved' (no check was requested), 'unsolved' (dsolve raised
+    NotImplementedError) or 'error'. With ``numeric`` the solution is first
+    checked numerically, see :mod:`kamke.numeric`; 'check_method' tells
+    whether that was conclusive. With ``profile_dir`` both calls are
+    profiled, see :mod:`kamke.profiling`. With ``memory`` the peak memory of
+    both calls and the count_ops of the ODE and the solution are recorded,
+    see :mod:`kamke.memory`. With ``coverage`` the SymPy modules that were
+    run are recorded as 'modules', see :mod:`kamke.incremental`. With
+    ``reference`` a solution that matches the reference solution of the data
+    file is not verified again, its 'check_method' is 'reference', see
+    :mod:`kamke.reference`. With ``integrals``, a ``(size, path)`` pair, the
+    integrals are looked up in the memo of the worker, and the hits and
+    misses of this ODE are recorded, see :mod:`kamke.integrals`; not with
+    ``coverage``, which needs every integral to be done. The hints 'all',
+    'all_Integral' and 'best' give the best solution, and the 'attempts' of
+    all hints within ``hint_timeout`` seconds each and ``total_timeout``
+    together, see :func:`dsolve_all`; the status is 'timeout' when
+    classify_ode did not finish within ``total_timeout``.
+    """
+    if integrals is not None and not coverage:
+        # kamke.integrals imports kamke.runner through kamke.cache
+        from .integrals import worker_memo
+
+        memo = worker_memo(*integrals)
+        before = memo.counters()
+        result = solve_entry(number, hint, check, numeric, profile_dir, memory,
+                             reference=reference, hint_timeout=hint_timeout,
+                             total_timeout=total_timeout)
+        result.update((k, v - before[k]) for k, v in memo.counters().items())
+        return result
+    if coverage:
+        # with results of earlier ODEs in the cache, functions that this ODE
+        # needs would not be called
+        clear_cache()
+        modules = set()
+        with traced_modules(modules):
+            result = solve_entry(number, hint, check, numeric, profile_dir, memory,
+                                 reference=reference, hint_timeout=hint_timeout,
+                                 total_timeout=total_timeout)
+        result['modules'] = sorted(modules)
+        return result
+
+    def stage(name):
+        if profile_dir is None:
+            return nullcontext()
+        return profiled(profile_dir, number, hint, name)
+
+    def measure(name):
+        if not memory:
+            return nullcontext()
+        return measured(result, name)
+
+    ode = kamke1_1[number]
+    result = {'number': number, 'hint': hint, 'solver_hint': None, 'solution': None,
+              'checked': None, 'solve_time': None, 'check_time': None}
+    if memory:
+        result['ode_ops'] = count_ops(ode)
+    attempts = None
+    if hint in ('all', 'all_Integral', 'best'):
+        attempts = result['attempts'] = []
+    start = process_time()
+    try:
+        with measure('dsolve'), stage('dsolve'):
+            sol, result['solver_hint'] = dsolve_hint(ode, y, hint, hint_timeout,
+                                                     total_timeout, attempts)
+    except NotImplementedError as exc:
+        result.update(status='unsolved', error=str(exc))
+        return result
+    except TimeLimitExceeded as exc:
+        result.update(status='timeout', error=str(exc))
+        return result
+    finally:
+        result['solve_time'] = process_time() - start
+    result['solution'] = str(sol)
+    result['srepr'] = srepr(sol)
+    if memory:
+        result['solution_ops'] = count_ops(sol)
+    if not check:
+        result['status'] = 'solved'
+        return result
+
+    with measure('checkodesol'), stage('checkodesol'):
+        result['checked'], result['check_method'], result['check_time'] = \
+            verify_reference(ode, sol, y, kamke1_1.solutions[number] if reference else None,
+                             numeric)
+    result['status'] = 'verified' if result['checked'] else 'unverified'
+    return result
+
+
+def _worker_main(conn, watchdog=None, once=False):
+    # runs jobs sent by the parent until it receives None or the pipe closes,
+    # or only one with ``once``; ``watchdog`` is the pair (timeout, sampling
+    # interval) of the watchdog
+    lock = threading.Lock()
+
+    def send(message):
+        with lock:
+            conn.send(message)
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        key, func, args, kwargs = job
+        sampler = None
+        if watchdog is not None:
+            timeout, interval = watchdog
+            sampler = Watchdog(perf_counter() + timeout - min(1, timeout / 10),
+                               lambda stacks: send((key, None, hot_frames(stacks))),
+                               interval=interval, root=sys._getframe())
+            sampler.start()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as exc:
+            result = {'status': 'error', 'error': '%s: %s' % (type(exc).__name__, exc),
+                      'traceback': traceback.format_exc()}
+        finally:
+            if sampler is not None:
+                # after this the watchdog does not send anything any more
+                sampler.stop()
+        send((key, result))
+        if once:
+            break
+
+
+class _Worker:
+    """A worker process together with the job it is currently running."""
+
+    def __init__(self, ctx, watchdog=None, once=False):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, watchdog, once),
+                                   daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.key = None
+        self.started = None
+        self.hot_frames = None
+
+    def submit(self, key, func, args, kwargs):
+        self.conn.send((key, func, args, kwargs))
+        self.key = key
+        self.started = perf_counter()
+
+    def release(self):
+        self.key = None
+        self.started = None
+        self.hot_frames = None
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(1)
+        self.kill()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+def run_pool(jobs, timeout=60, processes=None, watchdog=None, start_method=None,
+             isolate=False):
+    r"""
+    Run ``jobs`` on a pool of worker processes with a hard time limit.
+
+    ``jobs`` is an iterable of ``(key, func, args, kwargs)`` tuples, where
+    ``func`` must be picklable (i.e. defined at module level). It is consumed
+    lazily, so it can be a generator producing many jobs. ``(key, result)``
+    pairs are yielded in the order the jobs finish. A job that takes longer
+    than ``timeout`` seconds of wall time has its worker killed and yields
+    ``{'status': 'timeout'}``; a job whose worker died yields
+    ``{'status': 'crashed'}``. With ``watchdog``, a sampling interval in
+    seconds, a timeout record has the 'hot_frames' of the job. The workers
+    are started with ``start_method`` of multiprocessing (default: that of
+    the platform), and with ``isolate`` every job runs in a fresh worker;
+    see the module docstring.
+    """
+    ctx = multiprocessing.get_context(start_method)
+    if start_method == 'forkserver':
+        ctx.set_forkserver_preload(PRELOAD)
+    processes = processes or os.cpu_count() or 1
+    jobs = iter(jobs)
+    watchdog = (timeout, watchdog) if watchdog else None
+
+    def new_worker():
+        return _Worker(ctx, watchdog, isolate)
+
+    workers = [new_worker() for _ in range(processes)]
+    exhausted = False
+    try:
+        while True:
+            if not exhausted:
+                for worker in workers:
+                    if worker.key is not None:
+                        continue
+                    job = next(jobs, None)
+                    if job is None:
+                        exhausted = True
+                        break
+                    worker.submit(*job)
+            busy = [w for w in workers if w.key is not None]
+            if not busy:
+                break
+
+            now = perf_counter()
+            remaining = min(w.started + timeout - now for w in busy)
+            ready = wait([w.conn for w in busy] + [w.process.sentinel for w in busy],
+                         max(remaining, 0))
+            now = perf_counter()
+            for worker in busy:
+                key = worker.key
+                elapsed = now - worker.started
+                if worker.conn in ready:
+                    try:
+                        message = worker.conn.recv()
+                    except (EOFError, OSError):
+                        message = (key, None)
+                    if len(message) == 3:
+                        # the report of the watchdog, the result is still to come
+                        worker.hot_frames = message[2]
+                        if elapsed < timeout:
+                            continue
+                    key, result = message[:2]
+                    if result is not None:
+                        result.setdefault('wall_time', elapsed)
+                        if isolate:
+                            worker.stop()
+                            workers[workers.index(worker)] = new_worker()
+                        else:
+                            worker.release()
+                        yield key, result
+                        continue
+                elif worker.process.sentinel not in ready and elapsed < timeout:
+                    continue
+
+                # the worker is past its budget or died, replace it
+                worker.kill()
+                if elapsed >= timeout:
+                    result = {'status': 'timeout', 'wall_time': elapsed, 'timeout': timeout}
+                    if worker.hot_frames is not None:
+                        result['hot_frames'] = worker.hot_frames
+                else:
+                    result = {'status': 'crashed', 'wall_time': elapsed,
+                              'error': 'exit code %s' % worker.process.exitcode}
+                workers[workers.index(worker)] = new_worker()
+                yield key, result
+    finally:
+        for worker in workers:
+            worker.stop()
+
+
+def run_corpus(numbers, hint='default', timeout=60, processes=None, cache=None,
+               watchdog=None, start_method=None, isolate=False, **options):
+    r"""
+    Solve the Kamke ODEs ``numbers`` in parallel and yield one record per ODE.
+
+    Records are the dictionaries returned by :func:`solve_entry`, or a
+    'timeout'/'crashed' record when the worker had to be killed. The
+    ``options`` (check, numeric, profile_dir, memory, coverage, reference,
+    integrals)
+    are passed on to :func:`solve_entry`. With a
+    :class:`~kamke.cache.ResultCache` as ``cache``, ODEs found in it are not
+    solved again; their records are yielded first, with 'cached' set.
+    ``watchdog``, ``start_method`` and ``isolate`` are passed on to
+    :func:`run_pool`.
+    """
+    todo = numbers
+    if cache is not None:
+        todo = []
+        for number in numbers:
+            record = cache.get(kamke1_1[number], hint, timeout, options.get('check', True),
+                               options)
+            if record is None:
+                todo.append(number)
+            else:
+                record['cached'] = True
+                yield record
+
+    jobs = (((n, hint), solve_entry, (n, hint), options) for n in todo)
+    for (number, hint_), result in run_pool(jobs, timeout, processes, watchdog, start_method,
+                                            isolate):
+        record = {'number': number, 'hint': hint_}
+        record.update(result)
+        if cache is not None:
+            cache.put(kamke1_1[number], hint_, record, options)
+        yield record
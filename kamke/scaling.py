@@ -0,0 +1,261 @@
+r"""
+Scaling curves of the solvers on families of Kamke ODEs.
+
+The corpus has one ODE per type, e.g. Kamke 1 stops at a quartic under the
+square root and Kamke 39 at a cubic in y, so it does not show how the cost
+of dsolve and checkodesol grows with the size of the input. Here a Kamke ODE
+is scaled up in one of three ways:
+
+- 'degree': the polynomials with coefficients a0, a1, ... (or b0, b1, ...)
+  get degree n, e.g. Kamke 1 with a polynomial of degree n under the root,
+- 'parameters': the polynomials keep their degree (at least n - 1), and the
+  first n coefficients are symbols, the others integers,
+- 'nesting': the elementary functions of x are nested n deep, e.g.
+  sin(log(x)) -> sin(log(sin(log(x)))) for n = 2.
+
+Every size is solved and verified with checkodesol in a worker, from the
+smallest size up to the first timeout. A power law c*n**p and an exponential
+c*exp(r*n) are fitted to the times, and the one with the smaller residual is
+reported:
+$ python -m kamke scaling 1 39 --by degree --sizes 1-10 -o degree.csv --plot degree.png
+
+The plot needs matplotlib.
+"""
+import csv
+import math
+import re
+from time import process_time
+
+from sympy import Add, Function, Symbol, count_ops
+from sympy.core.function import AppliedUndef
+from sympy.solvers.ode import dsolve
+
+from .corpus import load_corpus, x, y
+from .numeric import verify
+from .runner import run_pool
+
+kamke1_1 = load_corpus('kamke1_1')
+
+# coefficients of the polynomials in the Kamke ODEs: a0, a1, ..., b0, ...
+_COEFFICIENT = re.compile(r'([a-z])(\d+)$')
+
+
+def _polynomials(add):
+    r"""
+    The polynomials in the terms of ``add``, as ``{letter: (variable, sign,
+    {degree: term})}`` for the terms ``sign*a<k>*variable**k``.
+    """
+    found = {}
+    for term in add.args:
+        sign, rest = term.as_coeff_Mul()
+        coefficients = [s for s in rest.free_symbols if _COEFFICIENT.match(s.name)]
+        if len(coefficients) != 1 or abs(sign) != 1:
+            continue
+        letter, k = _COEFFICIENT.match(coefficients[0].name).groups()
+        power = rest / coefficients[0]
+        if power == 1:
+            variable, degree = None, 0
+        elif power.is_Pow and power.exp.is_Integer:
+            variable, degree = power.base, int(power.exp)
+        else:
+            variable, degree = power, 1
+        if degree != int(k) or variable is not None and variable not in (x, y):
+            continue
+        entry = found.setdefault(letter, [None, sign, {}])
+        if variable is not None:
+            if entry[0] not in (None, variable):
+                continue
+            entry[0] = variable
+        entry[2][degree] = term
+    return {letter: tuple(entry) for letter, entry in found.items()
+            if entry[0] is not None and len(entry[2]) > 1}
+
+
+def _rebuild(ode, coefficients):
+    # replace every polynomial of the ODE, ``coefficients(letter, degree)``
+    # gives the new coefficients in the order of the powers
+    def rebuild(add):
+        polys = _polynomials(add)
+        terms = list(add.args)
+        for letter, (variable, sign, old) in polys.items():
+            terms = [t for t in terms if t not in old.values()]
+            terms.extend(sign * c * variable**k
+                         for k, c in enumerate(coefficients(letter, max(old))))
+        return Add(*terms)
+
+    return ode.replace(lambda e: e.is_Add and _polynomials(e), rebuild)
+
+
+def _check_polynomials(ode):
+    if not any(_polynomials(a) for a in ode.atoms(Add)):
+        raise ValueError("%s has no polynomial with coefficients a0, a1, ..." % ode)
+
+
+def scale_degree(ode, n):
+    """``ode`` with polynomials of degree ``n``, see the module docstring."""
+    _check_polynomials(ode)
+    return _rebuild(ode, lambda letter, degree: [
+        Symbol('%s%d' % (letter, k)) for k in range(n + 1)])
+
+
+def scale_parameters(ode, n):
+    r"""
+    ``ode`` with ``n`` symbolic coefficients in every polynomial, see the
+    module docstring.
+    """
+    _check_polynomials(ode)
+    return _rebuild(ode, lambda letter, degree: [
+        Symbol('%s%d' % (letter, k)) if k < n else k + 1
+        for k in range(max(degree, n - 1) + 1)])
+
+
+def scale_nesting(ode, n):
+    """``ode`` with the functions of x nested ``n`` deep."""
+    functions = {a for a in ode.atoms(Function)
+                 if not isinstance(a, AppliedUndef) and not a.has(y) and a.has(x)}
+    # only the outermost ones, the inner ones are nested with them
+    outer = [a for a in functions if not any(b != a and b.has(a) for b in functions)]
+    if not outer:
+        raise ValueError("%s has no elementary functions of x" % ode)
+    nested = {}
+    for a in outer:
+        e = a
+        for _ in range(n - 1):
+            e = a.xreplace({x: e})
+        nested[a] = e
+    return ode.xreplace(nested)
+
+
+SCALINGS = {'degree': scale_degree, 'parameters': scale_parameters,
+            'nesting': scale_nesting}
+
+
+def scaled_ode(number, scaling, size):
+    """Kamke ODE ``number`` scaled to ``size`` by ``scaling``."""
+    return SCALINGS[scaling](kamke1_1[number], size)
+
+
+def time_scaled(number, scaling, size, check=True):
+    r"""
+    Solve and verify Kamke ODE ``number`` scaled to ``size``, as a record
+    for the process pool with the size (count_ops) of the ODE and the
+    solution and the cpu time of dsolve and checkodesol.
+    """
+    ode = scaled_ode(number, scaling, size)
+    result = {'number': number, 'scaling': scaling, 'size': size, 'ode': str(ode),
+              'ode_ops': count_ops(ode), 'solution_ops': None, 'check_time': None}
+    start = process_time()
+    try:
+        sol = dsolve(ode, y)
+    except NotImplementedError as exc:
+        result.update(status='unsolved', error=str(exc))
+        return result
+    finally:
+        result['solve_time'] = process_time() - start
+    result['solution_ops'] = count_ops(sol)
+    if not check:
+        result['status'] = 'solved'
+        return result
+    start = process_time()
+    try:
+        checked = verify(ode, sol, y, numeric=False)[0]
+    except NotImplementedError as exc:
+        checked = False
+        result['error'] = str(exc)
+    result['check_time'] = process_time() - start
+    result['status'] = 'verified' if checked else 'unverified'
+    return result
+
+
+def scaling_curve(number, scaling, sizes, timeout=60, processes=None, check=True):
+    r"""
+    The records of :func:`time_scaled` for Kamke ODE ``number`` and the
+    ``sizes``, sorted by size. Sizes are submitted in increasing order and
+    no larger size is submitted after the first timeout.
+    """
+    # raises ValueError here if the ODE can not be scaled like that
+    scaled_ode(number, scaling, min(sizes))
+    stop = []
+
+    def jobs():
+        for size in sorted(sizes):
+            if stop:
+                return
+            yield size, time_scaled, (number, scaling, size, check), {}
+
+    records = []
+    for size, result in run_pool(jobs(), timeout, processes):
+        if result['status'] == 'timeout':
+            stop.append(size)
+        records.append(dict(result, number=number, scaling=scaling, size=size))
+    return sorted(records, key=lambda r: r['size'])
+
+
+def _line(points):
+    # least squares fit of v = a + b*u, and the residual sum of squares
+    n = len(points)
+    mu = sum(u for u, _ in points) / n
+    mv = sum(v for _, v in points) / n
+    suu = sum((u - mu)**2 for u, _ in points)
+    b = sum((u - mu) * (v - mv) for u, v in points) / suu
+    a = mv - b * mu
+    return a, b, sum((v - a - b*u)**2 for u, v in points)
+
+
+def fit_growth(sizes, times, min_time=0.05):
+    r"""
+    Fit ``times = c*size**p`` and ``times = c*exp(r*size)`` in log space.
+
+    Returns ``{'model', 'exponent', 'rate', 'rss_power', 'rss_exponential'}``
+    where model is 'power' or 'exponential', whichever has the smaller
+    residual. Times below ``min_time`` are mostly noise and left out; with
+    fewer than 3 points left the result is None.
+    """
+    points = [(s, t) for s, t in zip(sizes, times) if s > 0 and t and t >= min_time]
+    if len(points) < 3:
+        return None
+    _, p, rss_power = _line([(math.log(s), math.log(t)) for s, t in points])
+    _, r, rss_exp = _line([(s, math.log(t)) for s, t in points])
+    return {'model': 'power' if rss_power <= rss_exp else 'exponential',
+            'exponent': p, 'rate': r, 'rss_power': rss_power, 'rss_exponential': rss_exp}
+
+
+def curve_times(records, metric='solve_time'):
+    """The sizes and times of the records of one curve that finished."""
+    done = [r for r in records if r.get(metric) is not None and r['status'] != 'timeout']
+    return [r['size'] for r in done], [r[metric] for r in done]
+
+
+FIELDS = ('number', 'scaling', 'size', 'status', 'ode_ops', 'solution_ops',
+          'solve_time', 'check_time')
+
+
+def write_curves(records, path):
+    """Write ``records`` of :func:`time_scaled` as a CSV file."""
+    with open(path, 'w', newline='') as fd:
+        writer = csv.DictWriter(fd, FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def plot_curves(curves, path):
+    r"""
+    Plot the solve and check times of ``curves``, a dictionary of record
+    lists by label, on a log scale to ``path``. Needs matplotlib.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    for label, records in sorted(curves.items()):
+        for metric, style in (('solve_time', '-o'), ('check_time', '--x')):
+            sizes, times = curve_times(records, metric)
+            if sizes:
+                ax.plot(sizes, times, style, label='%s %s' % (label, metric.split('_')[0]))
+    ax.set_yscale('log')
+    ax.set_xlabel('size')
+    ax.set_ylabel('cpu time [s]')
+    ax.legend()
+    fig.savefig(path)
+    plt.close(fig)
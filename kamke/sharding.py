@@ -0,0 +1,161 @@
+r"""
+Cost-balanced shards of the Kamke corpus.
+
+A few ODEs dominate the cost of a sweep, so shards with the same number of
+ODEs take very different times. Here the ODEs are split into shards of
+about equal predicted cost, using the costs of an earlier run: the records
+of ``run -o``/``--results`` or a baseline. ODEs without a recorded cost get
+a default cost, the median of the known ones.
+
+The shards are planned with the longest processing time first rule (the
+most expensive ODE goes to the shard with the smallest load), followed by
+moves and swaps between the most loaded shard and the others while that
+lowers the makespan. The plan only depends on the costs and the numbers, so
+every machine can compute it by itself and run its own shard:
+$ python -m kamke shards --costs sweep.jsonl -n 4
+$ python -m kamke run --costs sweep.jsonl --shard 1/4 --results shard1.jsonl
+$ python -m kamke merge shard*.jsonl -o sweep-new.jsonl
+"""
+import heapq
+from statistics import median
+
+from .results import load_records
+
+
+def record_cost(record):
+    r"""
+    The cost of a record in seconds: its cpu time, or its time budget for a
+    timeout. None if the record has no timing.
+    """
+    if record.get('status') == 'timeout':
+        return record.get('timeout') or record.get('wall_time')
+    times = [record.get('solve_time'), record.get('check_time')]
+    if any(t is not None for t in times):
+        return sum(t or 0 for t in times)
+    return record.get('wall_time')
+
+
+def load_costs(path):
+    r"""
+    The cost of every Kamke number in the records or baseline at ``path``.
+    For a baseline it is the median solve plus verify time.
+    """
+    if path.endswith('.json'):
+        from .baseline import load_baseline
+
+        data = load_baseline(path)
+        if isinstance(data, dict):
+            return {int(n): median(e['solve']) + median(e['verify'])
+                    for n, e in data['entries'].items()}
+    costs = {}
+    for record in load_records(path):
+        cost = record_cost(record)
+        if cost is not None:
+            costs[record['number']] = cost
+    return costs
+
+
+def _improve(shards, loads, costs):
+    # move or swap ODEs of the most loaded shard while that lowers it; every
+    # step lowers the sum of the squared loads, so this terminates
+    improved = True
+    while improved:
+        improved = False
+        top = max(range(len(shards)), key=lambda i: loads[i])
+        for other in sorted(range(len(shards)), key=lambda i: loads[i]):
+            if other == top:
+                continue
+            gap = loads[top] - loads[other]
+            # the best move: the largest ODE that is cheaper than the gap
+            best = None
+            for n in shards[top]:
+                if 0 < costs[n] < gap and (best is None or costs[n] > costs[best]):
+                    best = n
+            if best is not None:
+                shards[top].remove(best)
+                shards[other].append(best)
+                loads[top] -= costs[best]
+                loads[other] += costs[best]
+                improved = True
+                break
+            # the best swap, moving the difference d with 0 < d < gap
+            swap = None
+            for n in shards[top]:
+                for m in shards[other]:
+                    d = costs[n] - costs[m]
+                    if 0 < d < gap and (swap is None or abs(gap - 2*d) < abs(gap - 2*swap[2])):
+                        swap = (n, m, d)
+            if swap is not None:
+                n, m, d = swap
+                shards[top].remove(n)
+                shards[other].remove(m)
+                shards[top].append(m)
+                shards[other].append(n)
+                loads[top] -= d
+                loads[other] += d
+                improved = True
+                break
+    return shards, loads
+
+
+def plan_shards(numbers, costs, count, default=None):
+    r"""
+    Split the Kamke ``numbers`` into ``count`` shards of about equal cost.
+
+    ``costs`` maps numbers to seconds; numbers without a cost get
+    ``default``, or the median of ``costs`` if that is None. Returns a list
+    of ``(numbers, predicted)`` per shard, the numbers of a shard sorted by
+    decreasing cost, so that a pool running them also starts with the
+    longest ones.
+    """
+    if default is None:
+        default = median(costs.values()) if costs else 1.0
+    costs = {n: costs.get(n, default) for n in numbers}
+    order = sorted(set(numbers), key=lambda n: (-costs[n], n))
+    heap = [(0.0, i) for i in range(count)]
+    shards = [[] for _ in range(count)]
+    for n in order:
+        load, i = heapq.heappop(heap)
+        shards[i].append(n)
+        heapq.heappush(heap, (load + costs[n], i))
+    loads = [sum(costs[n] for n in shard) for shard in shards]
+    shards, loads = _improve(shards, loads, costs)
+    return [(sorted(shard, key=lambda n: (-costs[n], n)), load)
+            for shard, load in zip(shards, loads)]
+
+
+def parse_shard(spec):
+    """Parse a shard spec ``'K/N'`` to ``(K, N)``, K counts from 1."""
+    try:
+        k, n = map(int, spec.split('/'))
+    except ValueError:
+        raise ValueError("shard %s is not of the form K/N" % spec) from None
+    if not 1 <= k <= n:
+        raise ValueError("shard %s is not in 1..%d" % (spec, n))
+    return k, n
+
+
+def merge_records(record_lists):
+    r"""
+    Merge the records of several runs, keeping the last record of every
+    (number, hint). Returns the records sorted by number and hint.
+    """
+    merged = {}
+    for records in record_lists:
+        for record in records:
+            merged[record['number'], record.get('hint', 'default')] = record
+    return [merged[key] for key in sorted(merged)]
+
+
+def format_numbers(numbers):
+    """The inverse of parse_numbers, e.g. ``[1, 2, 3, 7]`` -> ``'1-3 7'``."""
+    parts = []
+    numbers = sorted(numbers)
+    i = 0
+    while i < len(numbers):
+        j = i
+        while j + 1 < len(numbers) and numbers[j + 1] == numbers[j] + 1:
+            j += 1
+        parts.append(str(numbers[i]) if i == j else '%d-%d' % (numbers[i], numbers[j]))
+        i = j + 1
+    return ' '.join(parts)
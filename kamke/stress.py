@@ -0,0 +1,191 @@
+r"""
+Stress corpus of transformed Kamke ODEs with known solutions.
+
+The Kamke ODEs that have a verified reference solution are transformed by
+random invertible changes of variables, and the reference solutions with
+them, so that every generated ODE comes with its solution:
+
+- 'shift': y = u + p(x), with a random elementary function p,
+- 'moebius': y = (a*u + b)/(c*u + d), with random integers, c != 0 and
+  a*d - b*c != 0,
+- 'point': x = phi(t), with phi(t) = t + k, k*t or t**2.
+
+Several transformations can be composed. The ODEs are generated lazily
+from a seed, so thousands of them can be streamed into the process pool as
+a throughput benchmark:
+$ python -m kamke stress --count 2000 --depth 2 --timeout 30
+
+A solution of dsolve is checked against the known solution with
+:func:`~kamke.reference.same_solution`, and only verified when it does not
+match.
+"""
+import random
+from time import process_time
+
+from sympy import Derivative, Dummy, Eq, Integral
+from sympy.core.function import AppliedUndef
+from sympy.solvers.ode import dsolve
+
+from .concrete import random_function
+from .corpus import load_corpus, unparse, x, y
+from .numeric import verify
+from .reference import same_solution
+
+kamke1_1 = load_corpus('kamke1_1')
+
+TRANSFORMS = ('shift', 'moebius', 'point')
+
+
+def _split(ode):
+    # the ODE as an expression in x, Y = y and D = y'
+    Y, D = Dummy('y'), Dummy('dy')
+    return ode.subs(Derivative(y, x), D).subs(y, Y), Y, D
+
+
+def _transformed(sol, new_y, inverse):
+    # the solution for u with y = new_y(u); y = S is kept explicit
+    if sol.lhs == y and not sol.rhs.has(y):
+        return Eq(y, inverse(sol.rhs))
+    return sol.subs(y, new_y)
+
+
+def shift(ode, solutions, p):
+    r"""
+    Transform ``ode`` and its ``solutions`` by y = u + p(x). Returns the
+    ODE and solutions for u, written in y again.
+    """
+    F, Y, D = _split(ode)
+    F = F.subs({Y: Y + p, D: D + p.diff(x)}, simultaneous=True)
+    ode = F.subs({Y: y, D: Derivative(y, x)}, simultaneous=True)
+    return ode, [_transformed(s, y + p, lambda S: S - p) for s in solutions]
+
+
+def moebius(ode, solutions, a, b, c, d):
+    """Transform ``ode`` and its ``solutions`` by y = (a*u + b)/(c*u + d)."""
+    if a*d - b*c == 0:
+        raise ValueError("the Moebius map (%s, %s, %s, %s) is singular" % (a, b, c, d))
+    F, Y, D = _split(ode)
+    F = F.subs({Y: (a*Y + b)/(c*Y + d), D: (a*d - b*c)/(c*Y + d)**2 * D},
+               simultaneous=True)
+    ode = F.subs({Y: y, D: Derivative(y, x)}, simultaneous=True)
+    return ode, [_transformed(s, (a*y + b)/(c*y + d), lambda S: (d*S - b)/(a - c*S))
+                 for s in solutions]
+
+
+def point(ode, solutions, phi):
+    r"""
+    Transform ``ode`` and its ``solutions`` by x = phi(t), where ``phi`` is
+    an expression in x that stands for t.
+    """
+    if any(s.has(Integral) for s in solutions):
+        # the integration variable would have to be changed as well
+        raise ValueError("solutions with integrals can not be transformed by x = phi(t)")
+    F, Y, D = _split(ode)
+    F = F.subs({x: phi, D: D / phi.diff(x)}, simultaneous=True)
+    ode = F.subs({Y: y, D: Derivative(y, x)}, simultaneous=True)
+    Y = Dummy('y')
+    return ode, [s.subs(y, Y).subs(x, phi).subs(Y, y) for s in solutions]
+
+
+def random_transform(rng, ode, solutions, kinds=TRANSFORMS):
+    r"""
+    Apply one random transformation of the ``kinds`` to ``ode`` and its
+    ``solutions``. Returns ``(ode, solutions, description)``.
+    """
+    kind = rng.choice(kinds)
+    if kind == 'point' and any(s.has(Integral) for s in solutions):
+        kind = rng.choice([k for k in kinds if k != 'point'] or ['shift'])
+    if kind == 'shift':
+        p = random_function(rng)
+        return shift(ode, solutions, p) + ('y -> y + %s' % p,)
+    if kind == 'moebius':
+        while True:
+            a, b, c, d = (rng.randint(-3, 3) for _ in range(4))
+            if a*d - b*c != 0 and c != 0:
+                break
+        return moebius(ode, solutions, a, b, c, d) + (
+            'y -> (%s)/(%s)' % (unparse(a*y + b), unparse(c*y + d)),)
+    phi = rng.choice((x + rng.randint(1, 3), rng.randint(2, 3) * x, x**2))
+    return point(ode, solutions, phi) + ('x -> %s' % phi,)
+
+
+def base_numbers(corpus=kamke1_1):
+    r"""
+    The Kamke numbers that have a reference solution and no arbitrary
+    functions, which the generated ODEs are made of.
+    """
+    numbers = []
+    for n in corpus.numbers():
+        if corpus.solutions[n] is None:
+            continue
+        ode = corpus[n]
+        if any(a.func != y.func for a in ode.atoms(AppliedUndef)):
+            continue
+        numbers.append(n)
+    return numbers
+
+
+def stress_corpus(count, seed=0, depth=1, numbers=None, kinds=TRANSFORMS):
+    r"""
+    Generate ``count`` transformed ODEs, each made of a random Kamke ODE of
+    ``numbers`` (default :func:`base_numbers`) by ``depth`` random
+    transformations. Yields dictionaries ``{'id', 'number', 'transforms',
+    'ode', 'solution'}`` with SymPy expressions for the ODE and the list of
+    solutions. The same seed gives the same ODEs.
+    """
+    rng = random.Random(seed)
+    numbers = base_numbers() if numbers is None else numbers
+    generated = 0
+    while generated < count:
+        number = rng.choice(numbers)
+        ode = kamke1_1[number]
+        solution = kamke1_1.solutions[number]
+        solutions = list(solution) if isinstance(solution, list) else [solution]
+        transforms = []
+        try:
+            for _ in range(depth):
+                ode, solutions, description = random_transform(rng, ode, solutions, kinds)
+                transforms.append(description)
+        except ValueError:
+            continue
+        if ode.has(Derivative(y, x)) and not ode.has(Derivative(y, (x, 2))):
+            yield {'id': generated, 'number': number, 'transforms': transforms,
+                   'ode': ode, 'solution': solutions}
+            generated += 1
+
+
+def solve_stress(ode, solution, check=True):
+    r"""
+    Solve a generated ODE and check the solution against the known
+    ``solution``, as a record for the process pool. 'check_method' is
+    'reference' when it matched, else the method of
+    :func:`~kamke.numeric.verify`.
+    """
+    result = {'ode': unparse(ode), 'known': unparse(solution), 'check_time': None}
+    start = process_time()
+    try:
+        sol = dsolve(ode, y)
+    except NotImplementedError as exc:
+        result.update(status='unsolved', error=str(exc))
+        return result
+    finally:
+        result['solve_time'] = process_time() - start
+    result['solution'] = unparse(sol)
+    if not check:
+        result['status'] = 'solved'
+        return result
+    start = process_time()
+    if same_solution(sol, solution, y):
+        checked, result['check_method'] = True, 'reference'
+    else:
+        checked, result['check_method'], _ = verify(ode, sol, y)
+    result['check_time'] = process_time() - start
+    result['status'] = 'verified' if checked else 'unverified'
+    return result
+
+
+def stress_jobs(generated, check=True):
+    """Jobs for :func:`~kamke.runner.run_pool` of the generated ODEs."""
+    for g in generated:
+        yield g['id'], solve_stress, (g['ode'], g['solution'], check), {}
+
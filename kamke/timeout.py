@@ -0,0 +1,60 @@
+r"""
+Time limits inside a process.
+
+The process pool of :mod:`kamke.runner` kills a worker when an ODE takes too
+long, which is the only safe way to stop SymPy. Within one ODE, e.g. when
+trying several hints one after the other, a hint that runs too long can be
+interrupted with :func:`time_limit` instead, which raises
+:class:`TimeLimitExceeded` from a SIGALRM handler. This only works in the
+main thread, and code that does not return to the interpreter (a long
+computation in C) is not interrupted before it does.
+"""
+import signal
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class TimeLimitExceeded(BaseException):
+    r"""
+    Raised when the time limit of :func:`time_limit` is exceeded. It is not
+    an Exception, so that the ``except Exception`` clauses in SymPy do not
+    swallow it.
+    """
+
+    def __init__(self, seconds):
+        super().__init__('time limit of %g s exceeded' % seconds)
+        self.seconds = seconds
+
+
+@contextmanager
+def time_limit(seconds):
+    r"""
+    Raise :class:`TimeLimitExceeded` in the body of the ``with`` statement
+    after ``seconds`` of wall time; None means no limit. Limits can be
+    nested, an outer limit that expires first is raised as usual.
+    """
+    if seconds is None:
+        yield
+        return
+    # a zero interval would disable the timer
+    seconds = max(seconds, 1e-6)
+    outer, _ = signal.getitimer(signal.ITIMER_REAL)
+    inner_first = not outer or seconds <= outer
+    previous = signal.getsignal(signal.SIGALRM)
+
+    def handler(signum, frame):
+        if inner_first or not callable(previous):
+            raise TimeLimitExceeded(seconds if inner_first else outer)
+        previous(signum, frame)
+
+    signal.signal(signal.SIGALRM, handler)
+    start = perf_counter()
+    signal.setitimer(signal.ITIMER_REAL, seconds if inner_first else outer)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+        if outer:
+            # give the outer limit what is left of it
+            signal.setitimer(signal.ITIMER_REAL, max(outer - (perf_counter() - start), 1e-6))
@@ -0,0 +1,31 @@
+#
+# tests for the baseline comparison in kamke/baseline.py
+#
+from kamke.baseline import compare
+
+
+def _baseline(**entries):
+    return {'entries': {number[1:]: entry for number, entry in entries.items()}}
+
+
+def test_compare_uses_median_and_spread():
+    old = _baseline(k2={'status': 'verified', 'solve': [1.0, 1.0, 1.1], 'verify': [0.1] * 3},
+                    k3={'status': 'verified', 'solve': [1.0, 1.0, 1.0], 'verify': [0.1] * 3},
+                    k4={'status': 'verified', 'solve': [1.0, 2.0, 3.0], 'verify': [0.1] * 3})
+    new = _baseline(k2={'status': 'verified', 'solve': [1.3, 1.4, 1.3], 'verify': [0.1] * 3},
+                    # a single slow sample is not a regression
+                    k3={'status': 'verified', 'solve': [1.0, 5.0, 1.0], 'verify': [0.1] * 3},
+                    # within the noise of the measurements
+                    k4={'status': 'verified', 'solve': [1.5, 2.5, 3.5], 'verify': [0.1] * 3})
+    changes = compare(old, new, threshold=0.2)
+    assert [(c['number'], c['kind'], c['metric']) for c in changes] == [(2, 'regression', 'solve')]
+
+
+def test_compare_improvement_and_status():
+    old = _baseline(k2={'status': 'verified', 'solve': [2.0] * 3, 'verify': [1.0] * 3},
+                    k3={'status': 'verified', 'solve': [1.0] * 3, 'verify': [0.1] * 3})
+    new = _baseline(k2={'status': 'verified', 'solve': [2.0] * 3, 'verify': [0.2] * 3},
+                    k3={'status': 'timeout', 'solve': [60] * 3, 'verify': [0] * 3})
+    kinds = {(c['number'], c['metric']): c['kind'] for c in compare(old, new)}
+    assert kinds == {(2, 'verify'): 'improvement', (3, 'status'): 'status',
+                     (3, 'solve'): 'regression'}
@@ -0,0 +1,91 @@
+#
+# tests for the dsolve result cache in kamke/cache.py
+#
+import sqlite3
+
+from kamke.cache import ResultCache
+from kamke.corpus import load_corpus
+
+kamke1_1 = load_corpus('kamke1_1')
+
+
+def _record(number, status='verified', **kwargs):
+    record = {'number': number, 'hint': 'default', 'status': status,
+              'solver_hint': '1st_linear', 'solution': 'x' * 100}
+    record.update(kwargs)
+    return record
+
+
+def test_cache_roundtrip(tmp_path):
+    cache = ResultCache(str(tmp_path / 'c.sqlite'), version='test')
+    assert cache.get(kamke1_1[2]) is None
+    cache.put(kamke1_1[2], 'default', _record(2))
+    assert cache.get(kamke1_1[2])['status'] == 'verified'
+    assert cache.get(kamke1_1[2], '1st_linear') is None
+    assert ResultCache(str(tmp_path / 'c.sqlite'), version='other').get(kamke1_1[2]) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_timeouts_and_unchecked(tmp_path):
+    cache = ResultCache(str(tmp_path / 'c.sqlite'), version='test')
+    cache.put(kamke1_1[3], 'default', _record(3, 'timeout', timeout=10))
+    assert cache.get(kamke1_1[3], timeout=5) is not None
+    assert cache.get(kamke1_1[3], timeout=20) is None
+    cache.put(kamke1_1[4], 'default', _record(4, 'solved'))
+    assert cache.get(kamke1_1[4], check=False) is not None
+    assert cache.get(kamke1_1[4], check=True) is None
+    cache.put(kamke1_1[5], 'default', _record(5, 'crashed'))
+    assert len(cache) == 2
+
+
+def test_cache_eviction_and_invalidation(tmp_path):
+    cache = ResultCache(str(tmp_path / 'c.sqlite'), max_size=1000, version='test')
+    for number in range(2, 12):
+        cache.put(kamke1_1[number], 'default', _record(number))
+    assert cache.size() <= 1000
+    assert cache.get(kamke1_1[2]) is None
+    assert cache.get(kamke1_1[11]) is not None
+    cache.put(kamke1_1[2], '1st_power_series', _record(2, solver_hint='1st_power_series'))
+    count = len(cache)
+    assert cache.invalidate('sympy.solvers.ode.single') == count - 1
+    assert cache.invalidate('sympy.solvers') == 1
+
+
+def test_cache_options(tmp_path):
+    cache = ResultCache(str(tmp_path / 'c.sqlite'), version='test')
+    cache.put(kamke1_1[2], 'default', _record(2), {'check': True, 'reference': True})
+    assert cache.get(kamke1_1[2]) is not None
+    assert cache.get(kamke1_1[2], options={'memory': True}) is None
+    assert cache.get(kamke1_1[2], options={'reference': False}) is None
+    cache.put(kamke1_1[2], 'default', _record(2, peak_solve=1000), {'memory': True})
+    assert 'peak_solve' in cache.get(kamke1_1[2], options={'memory': True, 'numeric': False})
+    assert 'peak_solve' not in cache.get(kamke1_1[2])
+
+
+def test_cache_drops_old_table(tmp_path):
+    path = str(tmp_path / 'c.sqlite')
+    db = sqlite3.connect(path)
+    db.execute("""CREATE TABLE results (ode TEXT, hint TEXT, version TEXT, module TEXT,
+                  record TEXT, size INTEGER, accessed REAL, PRIMARY KEY (ode, hint, version))""")
+    db.execute("INSERT INTO results VALUES ('h', 'default', 'test', 'm', '{}', 2, 0)")
+    db.commit()
+    db.close()
+    cache = ResultCache(path, version='test')
+    assert len(cache) == 0
+    cache.put(kamke1_1[2], 'default', _record(2))
+    assert len(cache) == 1
+
+
+def test_cache_reused_with_other_timeout(tmp_path):
+    from kamke.runner import run_corpus
+
+    cache = ResultCache(str(tmp_path / 'c.sqlite'), version='test')
+    # python -m kamke run 2 --timeout 10, then --timeout 20
+    records = list(run_corpus([2], timeout=10, processes=1, cache=cache, total_timeout=8))
+    assert 'cached' not in records[0]
+    records = list(run_corpus([2], timeout=20, processes=1, cache=cache, total_timeout=16))
+    assert records[0]['cached']
+    # the time limits do change the records of the hints that try several
+    cache.put(kamke1_1[2], 'best', _record(2), {'total_timeout': 8})
+    assert cache.get(kamke1_1[2], 'best', options={'total_timeout': 8}) is not None
+    assert cache.get(kamke1_1[2], 'best', options={'total_timeout': 16}) is None
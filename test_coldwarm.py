@@ -0,0 +1,29 @@
+#
+# tests for the cold and warm cache timings in kamke/coldwarm.py
+#
+from kamke.coldwarm import cache_stats, cold_warm_entry, hit_rate, run_cache_sizes, \
+    summarize_sizes
+
+
+def test_cold_warm_entry():
+    record = cold_warm_entry(2)
+    assert record['status'] == 'solved'
+    assert record['cold_misses'] > 0 and record['entries'] > 0
+    assert hit_rate(record['warm_hits'], record['warm_misses']) > \
+        hit_rate(record['cold_hits'], record['cold_misses'])
+    assert record['warm_time'] < record['cold_time']
+    assert record['cache_memory'] > 0
+    assert cache_stats()['entries'] == 0
+
+
+def test_run_cache_sizes():
+    records = list(run_cache_sizes([3], [10, None], timeout=120, processes=1, memory=False))
+    assert [(r['cache_size'], r['status']) for r in records] == [(10, 'solved'),
+                                                                 (None, 'solved')]
+    assert records[0]['entries'] < records[1]['entries']
+    summary = summarize_sizes(records + [{'number': 4, 'cache_size': 10,
+                                          'status': 'timeout'}])
+    assert [(s['cache_size'], s['count'], s['timeouts']) for s in summary] == \
+        [(10, 1, 1), (None, 1, 0)]
+    assert summary[1]['warm_hit_rate'] > summary[0]['warm_hit_rate']
+    assert summary[0]['cache_memory'] is None
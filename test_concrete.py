@@ -0,0 +1,48 @@
+#
+# tests for the concrete instances in kamke/concrete.py
+#
+import random
+
+from sympy import Derivative, exp, sin
+
+from kamke.concrete import (arbitrary_functions, concrete_instances, functional_numbers,
+                            random_function, solve_concrete, substitute)
+from kamke.corpus import f, g, load_corpus, x, y
+
+kamke1_1 = load_corpus('kamke1_1')
+
+
+def test_functional_numbers():
+    numbers = functional_numbers()
+    assert 10 in numbers and 12 not in numbers
+    # the functions field of 11 misses f
+    assert arbitrary_functions(kamke1_1[11]) == [f, g]
+
+
+def test_substitute():
+    ode = substitute(kamke1_1[10], {f: sin(x)})
+    assert ode == Derivative(y, x) + y*sin(x).diff(x) - sin(x)*sin(x).diff(x)
+    assert ode == (y.diff(x) + f(x).diff(x)*y - f(x)*f(x).diff(x)).subs(f(x), sin(x)).doit()
+    assert substitute(y.diff(x) - f(2*x), {f: exp(x)}) == Derivative(y, x) - exp(2*x)
+
+
+def test_random_function():
+    rng = random.Random(1)
+    for _ in range(20):
+        assert random_function(rng).has(x)
+    assert all(random_function(rng, ('exponential',)).has(exp) for _ in range(5))
+
+
+def test_concrete_instances():
+    instances = concrete_instances(kamke1_1[34], count=4, seed=3)
+    assert instances == concrete_instances(kamke1_1[34], count=4, seed=3)
+    for ode, functions in instances:
+        assert set(functions) == {f, g}
+        assert not arbitrary_functions(ode)
+
+
+def test_solve_concrete():
+    record = solve_concrete(10, count=2, abstract=False, kinds=('exponential',))
+    assert 'abstract' not in record
+    assert [i['status'] for i in record['instances']] == ['verified', 'verified']
+    assert all(i['check_method'] == 'numeric' for i in record['instances'])
@@ -0,0 +1,37 @@
+#
+# tests for the on-disk Kamke database in kamke/corpus.py
+#
+from sympy import Derivative, Eq
+
+from kamke.corpus import KamkeCorpus, load_corpus, parse, unparse, write_corpus, x, y, f
+
+kamke1_1 = load_corpus('kamke1_1')
+
+
+def test_corpus_entries():
+    assert len(kamke1_1) == 368
+    assert kamke1_1[0] == 0
+    assert kamke1_1[47] == 0
+    assert kamke1_1[12] == Derivative(y, x) + y**2 - 1
+    assert kamke1_1.functions[10] == [f(x)]
+    assert kamke1_1.functions[12] is None
+    assert isinstance(kamke1_1.solutions[4], Eq)
+    assert kamke1_1.solutions[13] is None
+
+
+def test_corpus_all_entries_parse():
+    for number in kamke1_1.numbers():
+        assert kamke1_1[number].has(Derivative(y, x)), number
+        solution = kamke1_1.solutions[number]
+        if solution is not None:
+            assert parse(unparse(solution)) == solution, number
+
+
+def test_corpus_rebuilds_stale_index(tmp_path):
+    path = str(tmp_path / 'small.jsonl')
+    write_corpus([{'number': 0, 'ode': None}, {'number': 1, 'ode': 'y.diff(x) - y'}], path)
+    with open(path, 'a') as fd:
+        fd.write('{"number": 2, "ode": "y.diff(x) - x"}\n')
+    corpus = KamkeCorpus(path)
+    assert len(corpus) == 3
+    assert corpus[2] == Derivative(y, x) - x
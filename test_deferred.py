@@ -0,0 +1,35 @@
+#
+# tests for the deferred simplification in kamke/deferred.py
+#
+from sympy import count_ops, dsolve
+
+from kamke.corpus import load_corpus, y
+from kamke.deferred import DeferredSolution, deferred_entry, dsolve_raw, simplify_solution
+from kamke.reference import same_solution
+
+kamke1_1 = load_corpus('kamke1_1')
+
+
+def test_dsolve_raw_and_simplify():
+    sol, match, classify_time, solve_time = dsolve_raw(kamke1_1[12], y)
+    assert match['hint'] == 'separable'
+    simplified = simplify_solution(sol, match)
+    assert count_ops(simplified) < count_ops(sol)
+    assert same_solution(simplified, dsolve(kamke1_1[12], y), y)
+
+
+def test_deferred_solution():
+    deferred = DeferredSolution(kamke1_1[3])
+    assert not deferred.done()
+    assert deferred.simplified() == dsolve(kamke1_1[3], y)
+    assert deferred.done() and deferred.simplify_time >= 0
+    deferred = DeferredSolution(kamke1_1[3], background=True)
+    assert deferred.simplified(timeout=60) == dsolve(kamke1_1[3], y)
+    assert deferred.done()
+
+
+def test_deferred_entry():
+    record = deferred_entry(2, eager=True)
+    assert record['status'] == 'verified' and record['raw_checked']
+    for key in ('classify_time', 'solve_time', 'simplify_time', 'check_time', 'eager_time'):
+        assert record[key] >= 0
@@ -0,0 +1,69 @@
+#
+# tests for the structural hint dispatcher in kamke/features.py
+#
+import pytest
+from sympy import Function, exp, sin, sqrt, symbols
+from sympy.solvers.ode import classify_ode
+
+from kamke.corpus import load_corpus, x, y
+from kamke.features import candidate_hints, classify_ode_fast, extract_features
+
+a, b = symbols('a b')
+f = Function('f')
+kamke1_1 = load_corpus('kamke1_1')
+
+ODES = [
+    y.diff(x) - 2*y - 3,
+    x*y.diff(x) - 2*y,
+    y.diff(x) + y/x - x**2*y**3,
+    y.diff(x) - y**2 + 2/x**2,
+    y.diff(x) - y**2 - x,
+    y.diff(x) - (x + y)/(x - y),
+    y.diff(x) - sin(x)*exp(y),
+    y.diff(x) - sqrt(y) - x,
+    y.diff(x) - f(x)*y - a,
+    y.diff(x)**2 - x*y,
+]
+
+
+def test_features():
+    features = extract_features(y.diff(x) - y**2 + 2/x**2, y)
+    assert features['riccati'] and features['riccati_special'] and features['rational_riccati']
+    assert not features['linear']
+    assert features['rhs_y_powers'] == ['0', '2']
+
+    features = extract_features(x*y.diff(x) - 2*y, y)
+    assert features['linear'] and features['homogeneous_linear']
+    assert features['euler_coeff'] and not features['constant_coeff']
+    assert features['homogeneous'] is True and features['separable'] is True
+
+    features = extract_features(y.diff(x) - f(x)*y - a, y)
+    assert features['functions'] == ['f'] and features['parameters'] == ['a']
+    assert features['homogeneous'] is None
+
+    assert extract_features(y.diff(x)**2 - x*y, y)['dy_degree'] == 2
+
+
+def test_candidate_hints():
+    hints = candidate_hints(extract_features(y.diff(x) - y**2 - x, y))
+    assert '1st_rational_riccati' in hints
+    assert 'Riccati_special_minus2' not in hints
+    assert '1st_linear' not in hints and 'Bernoulli' not in hints
+    assert not hints & {'1st_homogeneous_coeff_best', 'separable', 'Liouville'}
+
+    hints = candidate_hints(extract_features(x*y.diff(x) + a*x*y**2 + 2*y + b*x, y))
+    assert '1st_rational_riccati' in hints
+    hints = candidate_hints(extract_features(y.diff(x) + a*x*y**2 + b*x, y))
+    assert '1st_rational_riccati' not in hints
+
+
+@pytest.mark.parametrize('ode', ODES)
+def test_classify_ode_fast(ode):
+    stats = {}
+    assert classify_ode_fast(ode, y, stats) == classify_ode(ode, y)
+    assert stats['skipped'] > 0
+
+
+@pytest.mark.parametrize('number', [2, 3, 4, 12, 13, 14, 17, 19, 23, 104])
+def test_corpus(number):
+    assert classify_ode_fast(kamke1_1[number], y) == classify_ode(kamke1_1[number], y)
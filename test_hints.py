@@ -0,0 +1,29 @@
+#
+# tests for the per-hint timing matrix in kamke/hints.py
+#
+from sympy.solvers.ode.single import FirstLinear
+
+from kamke.hints import solver_class, solver_module, summarize
+
+
+def test_solver_class():
+    assert solver_class('1st_linear') is FirstLinear
+    assert solver_class('1st_linear_Integral') is FirstLinear
+    assert solver_class('1st_power_series') is None
+    assert solver_module('1st_linear') == 'sympy.solvers.ode.single'
+    assert solver_module('1st_power_series') == 'sympy.solvers.ode.ode'
+
+
+def test_summarize():
+    records = [
+        {'number': 2, 'hint': '1st_linear', 'status': 'solved', 'time': 1.0, 'size': 5},
+        {'number': 3, 'hint': '1st_linear', 'status': 'timeout', 'time': 20},
+        {'number': 3, 'hint': 'lie_group', 'status': 'unsolved', 'time': 4.0},
+    ]
+    summary = {s['hint']: s for s in summarize(records)}
+    assert summary['1st_linear']['matched'] == 2
+    assert summary['1st_linear']['solved'] == 1
+    assert summary['1st_linear']['timeout'] == 1
+    assert summary['1st_linear']['wasted'] == 20
+    assert summary['1st_linear']['solver'] == 'FirstLinear'
+    assert summary['lie_group']['failed'] == 1
@@ -0,0 +1,64 @@
+#
+# tests for the change-aware reruns in kamke/incremental.py
+#
+import os
+
+from sympy import cos, integrate, simplify, sin
+
+from kamke.corpus import x
+from kamke.incremental import (SYMPY_ROOT, changed_modules, diff_paths, module_name,
+                               plan_rerun, traced_modules)
+
+DIFF = """\
+diff --git a/sympy/integrals/risch.py b/sympy/integrals/risch.py
+index 1111111..2222222 100644
+--- a/sympy/integrals/risch.py
++++ b/sympy/integrals/risch.py
+@@ -1 +1 @@
+-a
++b
+diff --git a/sympy/integrals/tests/test_risch.py b/sympy/integrals/tests/test_risch.py
+--- a/sympy/integrals/tests/test_risch.py
++++ b/sympy/integrals/tests/test_risch.py
+diff --git a/doc/src/modules/solvers/ode.rst b/doc/src/modules/solvers/ode.rst
+--- /dev/null
++++ b/doc/src/modules/solvers/ode.rst
+"""
+
+
+def test_module_name():
+    assert module_name('sympy/solvers/ode/single.py') == 'sympy.solvers.ode.single'
+    assert module_name('sympy/integrals/__init__.py') == 'sympy.integrals'
+    assert module_name('sympy/integrals/tests/test_risch.py') is None
+    assert module_name('doc/src/conf.py') is None
+    path = os.path.join(SYMPY_ROOT, 'sympy', 'simplify', 'fu.py')
+    assert module_name(path) == 'sympy.simplify.fu'
+
+
+def test_changed_modules():
+    paths = diff_paths(DIFF)
+    assert paths == {'sympy/integrals/risch.py', 'sympy/integrals/tests/test_risch.py',
+                     'doc/src/modules/solvers/ode.rst'}
+    assert changed_modules(paths) == {'sympy.integrals.risch'}
+
+
+def test_traced_modules():
+    modules = set()
+    with traced_modules(modules):
+        simplify(sin(x)**2 + cos(x)**2)
+        integrate(x*sin(x), x)
+    assert 'sympy.simplify.simplify' in modules
+    assert 'sympy.integrals.integrals' in modules
+    assert not any(m.startswith('sympy.core') for m in modules)
+
+
+def test_plan_rerun():
+    records = [{'number': 1, 'modules': ['sympy.solvers.ode.single']},
+               {'number': 2, 'modules': ['sympy.integrals.risch', 'sympy.solvers.ode.ode']},
+               {'number': 3, 'status': 'timeout'}]
+    rerun, kept = plan_rerun(records, {'sympy.integrals.risch'})
+    assert rerun == [2, 3]
+    assert [r['number'] for r in kept] == [1]
+    rerun, kept = plan_rerun(records, {'sympy.core.add'})
+    assert rerun == [1, 2, 3] and kept == []
+    assert plan_rerun(records, set()) == ([3], records[:2])
@@ -0,0 +1,56 @@
+#
+# tests for the integral memo in kamke/integrals.py
+#
+from sympy import Dummy, Integral, Symbol, cos, exp, integrate, sin, symbols
+
+from kamke.integrals import IntegralMemo, canonical_integral, memoized_integrals
+
+x, t, a = symbols('x t a')
+
+
+def test_canonical_integral():
+    u, v = Dummy('u'), Dummy('v')
+    first, names = canonical_integral(Integral(u * exp(x), x))
+    second, _ = canonical_integral(Integral(v * exp(t), t))
+    assert first == second
+    assert first.xreplace(names) == Integral(u * exp(x), x)
+    positive = Symbol('x', positive=True)
+    assert canonical_integral(Integral(exp(positive), positive))[0] != first
+    assert canonical_integral(Integral(Symbol('_k0') * x, x)) is None
+
+
+def test_memo_alpha_equivalent():
+    memo = IntegralMemo(version='test')
+    with memoized_integrals(memo):
+        assert integrate(exp(a*x) * sin(x), x).has(x)
+        misses = memo.misses
+        result = integrate(exp(a*t) * sin(t), t)
+        assert integrate(sin(x), (x, 0, t)) == 1 - cos(t)
+    assert not hasattr(Integral.doit, 'memo')
+    assert result.has(t) and not result.has(x)
+    assert memo.hits == 1 and memo.misses > misses
+    assert memo.saved > 0
+
+
+def test_memo_lru():
+    memo = IntegralMemo(size=2, version='test')
+    with memoized_integrals(memo):
+        for k in (1, 2, 3, 1):
+            integrate(x**k, x)
+    assert (len(memo), memo.evictions, memo.misses) == (2, 2, 4)
+
+
+def test_memo_file(tmp_path):
+    path = str(tmp_path / 'integrals.sqlite')
+    memo = IntegralMemo(path=path, version='test')
+    with memoized_integrals(memo):
+        integrate(x * exp(x), x)
+    memo.close()
+    memo = IntegralMemo(path=path, version='test')
+    with memoized_integrals(memo):
+        assert integrate(t * exp(t), t) == (t - 1) * exp(t)
+    assert (memo.hits, memo.misses) == (1, 0)
+    memo = IntegralMemo(path=path, version='other')
+    with memoized_integrals(memo):
+        integrate(t * exp(t), t)
+    assert memo.hits == 0
@@ -0,0 +1,39 @@
+#
+# tests for the lazy integration in kamke/lazy.py
+#
+from sympy import Eq, Integral, exp, sin, symbols
+
+from kamke.corpus import load_corpus, x, y
+from kamke.lazy import dsolve_lazy, evaluate_integrals, lazy_entry
+
+kamke1_1 = load_corpus('kamke1_1')
+C1 = symbols('C1')
+
+
+def test_dsolve_lazy():
+    sol, hint, classify_time, reduce_time = dsolve_lazy(kamke1_1[12], y)
+    assert hint == 'separable_Integral'
+    assert sol.has(Integral)
+    assert classify_time >= 0 and reduce_time >= 0
+
+
+def test_evaluate_integrals():
+    expr = Eq(y, C1 + Integral(x*exp(Integral(2*x, x)), x))
+    done, evaluated, deferred = evaluate_integrals(expr)
+    assert (evaluated, deferred) == (2, 0)
+    assert done == Eq(y, C1 + exp(x**2)/2)
+    # an integral SymPy can not do is left as it is
+    expr = Eq(y, C1 + Integral(sin(x)/(1 + exp(sin(x))), x) + Integral(x, x))
+    done, evaluated, deferred = evaluate_integrals(expr)
+    assert (evaluated, deferred) == (1, 1)
+    # no budget, no integration
+    assert evaluate_integrals(expr, budget=0) == (expr, 0, 2)
+
+
+def test_lazy_entry():
+    record = lazy_entry(4, budget=10, eager=True)
+    assert record['status'] == 'verified'
+    assert record['lazy_hint'].endswith('_Integral')
+    assert record['deferred'] == 0 and record['evaluated'] > 0
+    for key in ('classify_time', 'reduce_time', 'integrate_time', 'eager_time'):
+        assert record[key] >= 0
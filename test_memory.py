@@ -0,0 +1,36 @@
+#
+# tests for the memory tracking in kamke/memory.py
+#
+from kamke.memory import measured, memory_outliers, peak_rss
+from kamke.runner import solve_entry
+
+
+def test_measured():
+    result = {}
+    with measured(result, 'dsolve'):
+        data = [list(range(1000)) for _ in range(100)]
+    del data
+    assert result['dsolve_traced'] > 100 * 1000 * 8
+    assert result['dsolve_rss'] >= result['dsolve_traced']
+    assert peak_rss() > 0
+
+
+def test_memory_outliers():
+    MB = 2**20
+    records = [{'number': n, 'ode_ops': 10, 'dsolve_traced': MB} for n in range(1, 10)]
+    records.append({'number': 10, 'ode_ops': 10, 'dsolve_traced': 200 * MB,
+                    'checkodesol_traced': MB})
+    records.append({'number': 11, 'ode_ops': 1000, 'dsolve_traced': 100 * MB})
+    records.append({'number': 12, 'status': 'timeout'})
+    outliers = memory_outliers(records)
+    assert [r['number'] for r in outliers] == [10]
+    assert outliers[0]['memory_ratio'] == 200
+
+
+def test_solve_entry_memory():
+    result = solve_entry(2, memory=True)
+    assert result['status'] == 'verified'
+    assert result['ode_ops'] > 0 and result['solution_ops'] > 0
+    for stage in ('dsolve', 'checkodesol'):
+        assert result[stage + '_traced'] > 0
+        assert result[stage + '_rss'] > 0
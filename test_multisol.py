@@ -0,0 +1,31 @@
+#
+# tests for the parallel verification in kamke/multisol.py
+#
+from sympy import Eq, exp, symbols
+
+from kamke.corpus import load_corpus, x, y
+from kamke.multisol import verify_lists, verify_one
+
+kamke1_1 = load_corpus('kamke1_1')
+C1, C2 = symbols('C1 C2')
+
+
+def test_verify_one():
+    record = verify_one(4, kamke1_1.solutions[4])
+    assert record['status'] == 'verified' and record['check_method'] == 'numeric'
+
+
+def test_verify_lists():
+    good = kamke1_1.solutions[4]
+    wrong = Eq(y, (C1 + x**2)*exp(-x**2))
+    records = verify_lists({4: [good, good.subs(C1, C2), good], 7: [kamke1_1.solutions[7]]},
+                           timeout=60, processes=2, compare=True)
+    assert [r['number'] for r in records] == [4, 7]
+    assert (records[0]['solutions'], records[0]['distinct']) == (3, 1)
+    assert records[0]['index'] == [0, 0, 0]
+    assert records[0]['status'] == records[0]['sequential_status'] == 'verified'
+    assert records[1]['status'] == 'verified'
+    records = verify_lists({4: [good, wrong]}, timeout=60, processes=2)
+    assert records[0]['statuses'] == ['verified', 'unverified']
+    assert records[0]['status'] == 'unverified'
+    assert records[0]['span'] > 0
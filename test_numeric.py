@@ -0,0 +1,55 @@
+#
+# tests for the numeric pre-verification in kamke/numeric.py
+#
+from sympy import Eq, exp, log, sqrt, symbols
+
+from kamke.corpus import load_corpus, x, y
+from kamke.numeric import distinct_solutions, numeric_check, solution_key, verify
+
+kamke1_1 = load_corpus('kamke1_1')
+C1, C2 = symbols('C1 C2')
+
+
+def test_numeric_check_explicit():
+    assert numeric_check(kamke1_1[4], kamke1_1.solutions[4], y) is True
+    assert numeric_check(kamke1_1[4], Eq(y, (C1 + x**2)*exp(-x**2)), y) is False
+    # the solution contains an unevaluated Integral
+    assert numeric_check(kamke1_1[1], kamke1_1.solutions[1], y) is True
+
+
+def test_numeric_check_implicit():
+    # y' = y/x has the implicit solution log(y) - log(x) = C1
+    ode = y.diff(x) - y/x
+    assert numeric_check(ode, Eq(log(y) - log(x), C1), y) is True
+    assert numeric_check(ode, Eq(log(y) - 2*log(x), C1), y) is False
+
+
+def test_numeric_check_inconclusive():
+    # arbitrary functions can not be evaluated
+    assert numeric_check(kamke1_1[10], kamke1_1.solutions[10], y) is None
+    verdict, method, _ = verify(kamke1_1[10], kamke1_1.solutions[10], y)
+    assert method == 'checkodesol'
+    verdict, method, _ = verify(kamke1_1[7], kamke1_1.solutions[7], y)
+    assert (verdict, method) == (True, 'numeric')
+    # an implicit solution without a constant, y = x of y' = (y - x)**2 + 1
+    ode = y.diff(x) - (y - x)**2 - 1
+    assert numeric_check(ode, Eq(y - x, 0), y) is None
+    assert verify(ode, Eq(y - x, 0), y)[:2] == (True, 'checkodesol')
+
+
+def test_distinct_solutions():
+    sols = [Eq(y, C1*exp(x)), Eq(y, C2*exp(x)), Eq(y, exp(x + log(C1))),
+            Eq(y, -1/(C1 + x)), Eq(y, 1/(-C1 - x)), Eq(y, sqrt(x + C1)),
+            Eq(y**2 + x, C1), Eq(x + y**2, C2), Eq(y**2 - x, C1)]
+    distinct, index = distinct_solutions(sols, y)
+    assert index == [0, 0, 0, 1, 1, 2, 3, 3, 4]
+    assert distinct == [sols[i] for i in (0, 3, 5, 6, 8)]
+    assert solution_key(sols[0], y)[0] == 'numeric'
+    assert solution_key(sols[6], y)[0] == 'structure'
+
+
+def test_verify_dedup():
+    sol = kamke1_1.solutions[4]
+    renamed = sol.subs(C1, C2)
+    assert verify(kamke1_1[4], [sol, renamed], y)[:2] == (True, 'numeric')
+    assert verify(kamke1_1[4], [sol, renamed], y, dedup=False)[:2] == (True, 'numeric')
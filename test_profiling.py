@@ -0,0 +1,48 @@
+#
+# tests for the corpus profiling in kamke/profiling.py
+#
+import os
+import time
+
+from kamke.profiling import Watchdog, hot_frames, merge_profiles, profiled
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_profiled_and_merge(tmp_path):
+    profile_dir = str(tmp_path)
+    for number in (1, 2):
+        with profiled(profile_dir, number, 'default', 'dsolve'):
+            _busy(0.1)
+    stats = merge_profiles(profile_dir)
+    assert any(func[2] == '_busy' for func in stats.stats)
+    with open(os.path.join(profile_dir, 'report.txt')) as fd:
+        assert '2 profiles' in fd.read()
+    with open(os.path.join(profile_dir, 'stacks.folded')) as fd:
+        lines = fd.read().splitlines()
+    assert any(line.startswith('kamke1;default;dsolve;test_profiling.py:test_profiled_and_merge;'
+                               'test_profiling.py:_busy') for line in lines)
+    assert any(line.startswith('kamke2;') for line in lines)
+
+
+def test_hot_frames():
+    stacks = {'main;dsolve;integrate;risch': 6, 'main;dsolve;integrate': 1,
+              'main;dsolve;simplify': 3}
+    assert hot_frames(stacks) == [['risch', 6, 6], ['integrate', 7, 1], ['dsolve', 10, 0],
+                                  ['main', 10, 0], ['simplify', 3, 3]]
+    stacks['main;dsolve;simplify'] = 10
+    assert hot_frames(stacks, limit=2) == [['simplify', 10, 10], ['dsolve', 17, 0]]
+
+
+def test_watchdog():
+    reports = []
+    watchdog = Watchdog(time.perf_counter() + 0.2, reports.append, interval=0.01)
+    watchdog.start()
+    _busy(0.4)
+    watchdog.join()
+    assert len(reports) == 1
+    assert any('_busy' in stack for stack in reports[0])
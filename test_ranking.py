@@ -0,0 +1,50 @@
+#
+# tests for the first successful hint mode in kamke/ranking.py
+#
+from sympy import Eq
+from sympy.solvers.ode import dsolve
+
+from kamke.corpus import x, y
+from kamke.ranking import dsolve_first, hint_ranking, ranked_hints
+
+
+def test_hint_ranking():
+    records = [
+        {'number': 1, 'hint': 'lie_group', 'status': 'solved', 'time': 5.0},
+        {'number': 1, 'hint': '1st_linear', 'status': 'solved', 'time': 1.0},
+        {'number': 2, 'hint': '1st_linear', 'status': 'unsolved', 'time': 1.0},
+        {'number': 2, 'hint': 'separable', 'status': 'timeout', 'time': 20},
+        {'number': 3, 'hint': 'classify', 'status': 'timeout'},
+    ]
+    ranking = hint_ranking(records)
+    assert [r['hint'] for r in ranking['hints']] == ['1st_linear', 'lie_group', 'separable']
+    assert ranking['hints'][0]['cost'] == 2.0
+    assert ranking['hints'][2]['cost'] is None
+
+
+def test_ranked_hints():
+    ode = y.diff(x) + y - x
+    default = ranked_hints(ode, y)
+    assert default.index('1st_exact') < default.index('1st_linear') < default.index('lie_group')
+    assert 'separable' not in default and 'Liouville' not in default
+
+    ranking = {'hints': [{'hint': 'lie_group'}, {'hint': '1st_linear_Integral'}]}
+    assert ranked_hints(ode, y, ranking)[0] == 'lie_group'
+
+
+def test_dsolve_first():
+    ranking = {'hints': [{'hint': 'Riccati_special_minus2'}, {'hint': 'nth_algebraic'},
+                         {'hint': '1st_linear'}]}
+    sol, hint, attempts = dsolve_first(y.diff(x) + y - x, y, ranking)
+    assert hint == '1st_linear'
+    assert sol.rhs.has(x)
+    assert [a['hint'] for a in attempts] == ['1st_linear']
+    assert attempts[0]['status'] == 'verified'
+
+
+def test_dsolve_first_like_dsolve():
+    ode = Eq(y.diff(x), y**2 - y)
+    for first in ('separable', 'Bernoulli', '1st_exact', 'lie_group'):
+        sol, hint, _ = dsolve_first(ode, y, {'hints': [{'hint': first}]})
+        assert hint == first
+        assert sol == dsolve(ode, y, hint=hint)
@@ -0,0 +1,59 @@
+#
+# tests for the reference solutions in kamke/reference.py
+#
+from sympy import Eq, Ne, Piecewise, exp, log, sin, symbols
+
+from kamke.corpus import KamkeCorpus, write_corpus, x, y
+from kamke.reference import same_solution, store_references, verify_reference
+
+a, b, c = symbols('a b c')
+C1, C2 = symbols('C1 C2')
+
+
+def test_same_solution_constants():
+    ref = Eq(y, (C1 + x)*exp(-sin(x)))
+    assert same_solution(Eq(y, (C2 + x)*exp(-sin(x))), ref, y)
+    # C1 -> 2*C1 + 3 and C1 -> exp(C1)
+    assert same_solution(Eq(y, (2*C1 + 3 + x)*exp(-sin(x))), ref, y)
+    assert same_solution(Eq(y, (exp(C1) + x)*exp(-sin(x))), ref, y)
+    # a particular solution is one of the family
+    assert same_solution(Eq(y, x*exp(-sin(x))), ref, y)
+    assert not same_solution(Eq(y, (C1 + 2*x)*exp(-sin(x))), ref, y)
+    assert not same_solution(Eq(y, (C1 + x)*exp(-sin(x))), None, y)
+
+
+def test_same_solution_piecewise():
+    ref = Eq(y, (C1 + c*Piecewise((exp(a*x)*exp(b*x)/(a + b), Ne(a, -b)), (x, True)))*exp(-a*x))
+    sol = Eq(y, (C1 + c*Piecewise((x, Eq(a, -b)), (exp((a + b)*x)/(a + b), True)))*exp(-a*x))
+    assert same_solution(sol, ref, y)
+
+
+def test_same_solution_implicit():
+    assert same_solution(Eq(x*y, C1), Eq(log(x) + log(y), C1), y)
+    assert not same_solution(Eq(x*y, C1), Eq(x + y, C1), y)
+    # every solution of a list has to match
+    assert same_solution([Eq(y, C1/x)], [Eq(y, -C1/x), Eq(y, 0)], y)
+    assert not same_solution([Eq(y, C1/x), Eq(y, x)], [Eq(y, C1/x)], y)
+
+
+def test_verify_reference():
+    ode = y.diff(x) + y*sin(x).diff(x) - exp(-sin(x))
+    ref = Eq(y, (C1 + x)*exp(-sin(x)))
+    assert verify_reference(ode, Eq(y, (C1 - x)*exp(-sin(x))), y, ref)[:2] == \
+        (False, 'numeric')
+    assert verify_reference(ode, Eq(y, (C1/2 + x)*exp(-sin(x))), y, ref)[:2] == \
+        (True, 'reference')
+
+
+def test_store_references(tmp_path):
+    path = str(tmp_path / 'small.jsonl')
+    write_corpus([{'number': 0, 'ode': None},
+                  {'number': 1, 'ode': 'y.diff(x) - y', 'solution': 'Eq(y, C1*exp(x))'},
+                  {'number': 2, 'ode': 'y.diff(x) - x'}], path)
+    corpus = KamkeCorpus(path)
+    records = [{'number': 1, 'status': 'verified', 'solution': 'Eq(y, exp(C1 + x))'},
+               {'number': 2, 'status': 'verified', 'solution': 'Eq(y, C1 + x**2/2)'}]
+    assert store_references(records, corpus) == [2]
+    assert KamkeCorpus(path).solutions[2] == Eq(y, C1 + x**2/2)
+    assert store_references(records, corpus, replace=True) == [1]
+    assert KamkeCorpus(path).raw(1)['solution'] == 'Eq(y, exp(C1 + x))'
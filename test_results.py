@@ -0,0 +1,34 @@
+#
+# tests for the streaming result files in kamke/results.py
+#
+import json
+
+from kamke.results import ResultLog, finished, load_records, read_results
+
+
+def test_result_log(tmp_path):
+    path = str(tmp_path / 'sweep.jsonl')
+    assert read_results(path) == []
+    with ResultLog(path) as log:
+        log.write({'number': 1, 'hint': 'default', 'status': 'verified'})
+        log.write({'number': 2, 'hint': 'default', 'status': 'timeout'})
+    # a writer killed in the middle of a record
+    with open(path, 'a') as fd:
+        fd.write('{"number": 3, "hint": "def')
+    assert [r['number'] for r in read_results(path)] == [1, 2]
+
+    with ResultLog(path) as log:
+        log.write({'number': 3, 'hint': 'lie_group', 'status': 'unsolved'})
+    records = read_results(path)
+    assert [r['number'] for r in records] == [1, 2, 3]
+    assert finished(records) == {1, 2}
+    assert finished(records, 'lie_group') == {3}
+    assert load_records(path) == records
+
+
+def test_load_records(tmp_path):
+    path = str(tmp_path / 'results.json')
+    records = [{'number': 5, 'status': 'verified'}]
+    with open(path, 'w') as fd:
+        json.dump(records, fd)
+    assert load_records(path) == records
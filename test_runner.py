@@ -0,0 +1,89 @@
+#
+# tests for the process pool runner in kamke/runner.py
+#
+import os
+import time
+
+from kamke.runner import run_pool
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return {'status': 'done', 'pid': os.getpid()}
+
+
+def _crash():
+    os._exit(3)
+
+
+def test_run_pool_timeout():
+    jobs = [(1, _sleep, (0,), {}), (2, _sleep, (30,), {}), (3, _sleep, (0,), {})]
+    start = time.perf_counter()
+    results = dict(run_pool(jobs, timeout=1, processes=2))
+    assert time.perf_counter() - start < 10
+    assert results[1]['status'] == 'done'
+    assert results[2]['status'] == 'timeout'
+    assert results[3]['status'] == 'done'
+
+
+def test_run_pool_replaces_dead_worker():
+    jobs = [(1, _crash, (), {}), (2, _sleep, (0,), {})]
+    results = dict(run_pool(jobs, timeout=10, processes=1))
+    assert results[1]['status'] == 'crashed'
+    assert results[2]['status'] == 'done'
+
+
+def test_run_pool_watchdog():
+    jobs = [(1, _sleep, (30,), {}), (2, _sleep, (0,), {})]
+    results = dict(run_pool(jobs, timeout=2, processes=1, watchdog=0.01))
+    assert results[1]['status'] == 'timeout'
+    frame, samples, own = results[1]['hot_frames'][0]
+    assert frame == 'test_runner.py:_sleep' and samples == own > 50
+    assert results[2]['status'] == 'done' and 'hot_frames' not in results[2]
+
+
+def test_dsolve_all_budgets():
+    from kamke.corpus import load_corpus, y
+    from kamke.runner import dsolve_all
+    from kamke.timeout import TimeLimitExceeded
+
+    kamke1_1 = load_corpus('kamke1_1')
+    attempts = []
+    sols = dsolve_all(kamke1_1[36], y, hint_timeout=2.5, attempts=attempts)
+    assert isinstance(sols['lie_group'], TimeLimitExceeded)
+    assert sols['best_hint'] == '1st_power_series'
+    assert {a['hint']: a['status'] for a in attempts}['lie_group'] == 'timeout'
+    assert all(a['time'] < 4 for a in attempts)
+
+    start = time.perf_counter()
+    sols = dsolve_all(kamke1_1[2], y, timeout=1.5)
+    assert time.perf_counter() - start < 4
+    assert any(isinstance(s, TimeLimitExceeded) for s in sols.values())
+
+
+def test_dsolve_all_like_dsolve():
+    from sympy.solvers.ode import dsolve
+    from sympy.solvers.ode.ode import ode_sol_simplicity
+
+    from kamke.corpus import load_corpus, y
+    from kamke.runner import dsolve_all
+
+    kamke1_1 = load_corpus('kamke1_1')
+    for number in (3, 12):
+        expected = dsolve(kamke1_1[number], y, hint='all_Integral')
+        sols = dsolve_all(kamke1_1[number], y, hint='all_Integral')
+        assert sols.keys() == expected.keys()
+        assert (sols['default'], sols['order']) == (expected['default'], expected['order'])
+        # dsolve tries the hints of a set, ties of the best depend on its order
+        assert ode_sol_simplicity(sols['best'], y) == ode_sol_simplicity(expected['best'], y)
+        assert sols[sols['best_hint']] == sols['best']
+
+
+def test_run_pool_isolate():
+    jobs = [(i, _sleep, (0,), {}) for i in range(3)]
+    shared = dict(run_pool(jobs, timeout=10, processes=1))
+    assert len({r['pid'] for r in shared.values()}) == 1
+    isolated = dict(run_pool(jobs, timeout=30, processes=1, start_method='forkserver',
+                             isolate=True))
+    assert [isolated[i]['status'] for i in range(3)] == ['done'] * 3
+    assert len({r['pid'] for r in isolated.values()}) == 3
@@ -0,0 +1,57 @@
+#
+# tests for the scaling curves in kamke/scaling.py
+#
+import csv
+import math
+
+import pytest
+from sympy import Derivative, cos, log, sin, sqrt, symbols
+
+from kamke.corpus import load_corpus, x, y
+from kamke.scaling import (fit_growth, scale_degree, scale_nesting, scale_parameters,
+                           time_scaled, write_curves)
+
+kamke1_1 = load_corpus('kamke1_1')
+a, a0, a1, a2, a3 = symbols('a a0 a1 a2 a3')
+
+
+def test_scale_degree():
+    assert scale_degree(kamke1_1[1], 2) == Derivative(y, x) - 1/sqrt(a0 + a1*x + a2*x**2)
+    assert scale_degree(kamke1_1[39], 1) == Derivative(y, x) - a0 - a1*y
+    assert scale_degree(kamke1_1[39], 3) == kamke1_1[39]
+    with pytest.raises(ValueError):
+        scale_degree(kamke1_1[9], 2)
+
+
+def test_scale_parameters():
+    assert scale_parameters(kamke1_1[39], 2) == Derivative(y, x) - a0 - a1*y - 3*y**2 - 4*y**3
+    assert scale_parameters(kamke1_1[39], 4) == kamke1_1[39]
+
+
+def test_scale_nesting():
+    assert scale_nesting(kamke1_1[9], 1) == kamke1_1[9]
+    assert scale_nesting(kamke1_1[9], 2) == \
+        Derivative(y, x) - (sin(log(sin(log(x)))) + cos(log(cos(log(x)))) + a)*y
+    with pytest.raises(ValueError):
+        scale_nesting(kamke1_1[39], 2)
+
+
+def test_fit_growth():
+    sizes = [1, 2, 3, 4, 5, 6]
+    fit = fit_growth(sizes, [0.1 * n**2 for n in sizes])
+    assert fit['model'] == 'power' and math.isclose(fit['exponent'], 2)
+    fit = fit_growth(sizes, [0.1 * math.exp(1.5*n) for n in sizes])
+    assert fit['model'] == 'exponential' and math.isclose(fit['rate'], 1.5)
+    # too few points above the noise
+    assert fit_growth(sizes, [0.01, 0.01, 0.01, 0.01, 1, 2]) is None
+
+
+def test_time_scaled(tmp_path):
+    record = time_scaled(1, 'degree', 1)
+    assert record['status'] == 'verified'
+    assert record['ode_ops'] > 0 and record['solve_time'] > 0
+    path = str(tmp_path / 'curve.csv')
+    write_curves([record], path)
+    with open(path) as fd:
+        rows = list(csv.DictReader(fd))
+    assert rows[0]['size'] == '1' and rows[0]['status'] == 'verified'
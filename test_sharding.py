@@ -0,0 +1,57 @@
+#
+# tests for the cost-balanced shards in kamke/sharding.py
+#
+import json
+
+import pytest
+
+from kamke.sharding import (format_numbers, load_costs, merge_records, parse_shard,
+                            plan_shards, record_cost)
+
+
+def test_plan_shards():
+    costs = {1: 10, 2: 6, 3: 5, 4: 4, 5: 3, 6: 2}
+    plan = plan_shards(list(costs) + [7], costs, 3, default=0.5)
+    assert sorted(n for shard, _ in plan for n in shard) == list(range(1, 8))
+    # 30.5 s on 3 shards, the 10 s ODE alone is a lower bound
+    assert max(p for _, p in plan) == 10.5
+    assert plan == plan_shards(list(costs) + [7], costs, 3, default=0.5)
+    for shard, _ in plan:
+        assert [costs.get(n, 0.5) for n in shard] == sorted((costs.get(n, 0.5) for n in shard),
+                                                            reverse=True)
+
+    # the longest processing time rule alone gives 3+2+2 | 3+2, a swap
+    # finds 3+3 | 2+2+2
+    costs = {1: 3, 2: 3, 3: 2, 4: 2, 5: 2}
+    loads = sorted(p for _, p in plan_shards(list(costs), costs, 2))
+    assert loads == [6, 6]
+
+
+def test_record_cost(tmp_path):
+    assert record_cost({'solve_time': 2.0, 'check_time': 0.5}) == 2.5
+    assert record_cost({'status': 'unsolved', 'solve_time': 1.0, 'check_time': None}) == 1.0
+    assert record_cost({'status': 'timeout', 'timeout': 60, 'wall_time': 60.1}) == 60
+    assert record_cost({'status': 'crashed', 'wall_time': 3.0}) == 3.0
+
+    path = str(tmp_path / 'baseline.json')
+    with open(path, 'w') as fd:
+        json.dump({'entries': {'3': {'solve': [1, 2, 9], 'verify': [1, 1, 1]}}}, fd)
+    assert load_costs(path) == {3: 3}
+
+
+def test_merge_records():
+    old = [{'number': 2, 'hint': 'default', 'status': 'timeout'},
+           {'number': 1, 'hint': 'default', 'status': 'verified'}]
+    new = [{'number': 2, 'hint': 'default', 'status': 'verified'}]
+    merged = merge_records([old, new])
+    assert [(r['number'], r['status']) for r in merged] == [(1, 'verified'), (2, 'verified')]
+
+
+def test_format_numbers():
+    assert format_numbers([7, 1, 2, 3, 9, 10]) == '1-3 7 9-10'
+    assert parse_shard('2/4') == (2, 4)
+    with pytest.raises(ValueError):
+        parse_shard('5/4')
+    for spec in ('0/4', 'x', '1/2/3'):
+        with pytest.raises(ValueError):
+            parse_shard(spec)
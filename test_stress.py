@@ -0,0 +1,57 @@
+#
+# tests for the stress corpus in kamke/stress.py
+#
+import pytest
+from sympy import Derivative, Eq, exp, symbols
+
+from kamke.corpus import load_corpus, x, y
+from kamke.numeric import numeric_check
+from kamke.stress import moebius, point, shift, solve_stress, stress_corpus
+
+kamke1_1 = load_corpus('kamke1_1')
+C1 = symbols('C1')
+
+# y' = y has the solution y = C1*exp(x)
+ode = Derivative(y, x) - y
+solution = [Eq(y, C1*exp(x))]
+
+
+def test_shift():
+    new, sols = shift(ode, solution, x**2)
+    assert new == Derivative(y, x) + 2*x - y - x**2
+    assert sols == [Eq(y, C1*exp(x) - x**2)]
+    assert numeric_check(new, sols, y) is True
+
+
+def test_moebius():
+    new, sols = moebius(ode, solution, 1, 2, 1, 1)
+    assert numeric_check(new, sols, y) is True
+    # implicit solutions are substituted
+    new, sols = moebius(ode, [Eq(y*exp(-x), C1)], 1, 2, 1, 1)
+    assert sols == [Eq((y + 2)/(y + 1)*exp(-x), C1)]
+    assert numeric_check(new, sols, y) is True
+    with pytest.raises(ValueError):
+        moebius(ode, solution, 1, 2, 2, 4)
+
+
+def test_point():
+    new, sols = point(ode, solution, x**2)
+    assert new == Derivative(y, x)/(2*x) - y
+    assert sols == [Eq(y, C1*exp(x**2))]
+    with pytest.raises(ValueError):
+        point(kamke1_1[1], [kamke1_1.solutions[1]], x**2)
+
+
+def test_stress_corpus():
+    generated = list(stress_corpus(15, seed=4, depth=2))
+    assert [g['id'] for g in generated] == list(range(15))
+    assert [g['ode'] for g in generated] == [g['ode'] for g in stress_corpus(15, seed=4, depth=2)]
+    for g in generated:
+        assert len(g['transforms']) == 2
+        assert numeric_check(g['ode'], g['solution'], y) is not False, g['transforms']
+
+
+def test_solve_stress():
+    new, sols = shift(ode, solution, x**2)
+    record = solve_stress(new, sols)
+    assert (record['status'], record['check_method']) == ('verified', 'reference')
@@ -0,0 +1,38 @@
+#
+# tests for the in-process time limits in kamke/timeout.py
+#
+import signal
+from time import perf_counter
+
+import pytest
+
+from kamke.timeout import TimeLimitExceeded, time_limit
+
+
+def spin(seconds):
+    end = perf_counter() + seconds
+    while perf_counter() < end:
+        pass
+
+
+def test_time_limit():
+    with pytest.raises(TimeLimitExceeded) as info:
+        with time_limit(0.05):
+            spin(1)
+    assert info.value.seconds == 0.05
+    with time_limit(1):
+        spin(0.01)
+    with time_limit(None):
+        spin(0.01)
+    assert signal.getitimer(signal.ITIMER_REAL)[0] == 0
+
+
+def test_nested_time_limits():
+    with pytest.raises(TimeLimitExceeded) as info:
+        with time_limit(0.2):
+            with time_limit(0.05):
+                spin(0.01)
+            with time_limit(1):
+                spin(1)
+    assert info.value.seconds == 0.2
+    assert signal.getitimer(signal.ITIMER_REAL)[0] == 0